@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark for GDELT Cloud MCP Server
+
+Measures per-row cost of decoding query responses and encoding tool
+results with each available JSON backend, on synthetic gdelt_gkg rows
+shaped like real ones (long v2_themes / v2_locations strings, tone
+vectors, numeric counts).
+
+Compares:
+1. Whole-body decode of the {"success", "data", ...} envelope
+2. Incremental decode of the same body (utils.streaming.JSONArrayDecoder)
+3. NDJSON decode, one row per line
+4. Tool result encoding (FastMCP tool serializer)
+
+Usage:
+    python bench_json_codec.py
+    python bench_json_codec.py --rows 1000 --repeat 20
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from utils import json_codec
+from utils.streaming import JSONArrayDecoder, NDJSONDecoder
+
+THEMES = [
+    'TAX_FNCACT', 'TAX_FNCACT_PRESIDENT', 'EPU_POLICY', 'ECON_STOCKMARKET',
+    'WB_696_PUBLIC_SECTOR_MANAGEMENT', 'CRISISLEX_CRISISLEXREC', 'LEADER',
+    'GENERAL_GOVERNMENT', 'USPEC_POLITICS_GENERAL1', 'MEDIA_MSM', 'ARMEDCONFLICT',
+]
+SOURCES = ['reuters.com', 'bbc.co.uk', 'nytimes.com', 'aljazeera.com', 'lemonde.fr']
+
+
+def make_gkg_rows(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Build synthetic gdelt_gkg rows with realistic field widths."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        themes = ';'.join(
+            f"{rng.choice(THEMES)},{rng.randint(1, 5000)}" for _ in range(rng.randint(20, 80))
+        )
+        locations = ';'.join(
+            f"1#Country{j}#C{j}#C{j}#{rng.uniform(-90, 90):.4f}#{rng.uniform(-180, 180):.4f}#C{j}#{rng.randint(1, 9999)}"
+            for j in range(rng.randint(1, 8))
+        )
+        tone = [rng.uniform(-10, 10) for _ in range(7)]
+        rows.append({
+            'gkg_record_id': f"20250115{i:06d}-{rng.randint(0, 999)}",
+            'date': f"2025-01-15 {i % 24:02d}:{i % 60:02d}:00",
+            'source_common_name': rng.choice(SOURCES),
+            'document_identifier': f"https://{rng.choice(SOURCES)}/news/{rng.getrandbits(64):x}",
+            'v2_themes': themes,
+            'v2_locations': locations,
+            'v1_5_tone': ','.join(f"{value:.6f}" for value in tone),
+            'num_articles': rng.randint(1, 50),
+            'avg_tone': tone[0],
+        })
+    return rows
+
+
+def bench(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of `repeat` runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def incremental(body: str, chunk_size: int = 65536) -> List[Any]:
+    """Decode a body the way execute_query does for streamed responses."""
+    decoder = JSONArrayDecoder('data')
+    rows = []
+    for start in range(0, len(body), chunk_size):
+        rows.extend(decoder.feed(body[start:start + chunk_size]))
+    rows.extend(decoder.close())
+    return rows
+
+
+def ndjson(body: str, chunk_size: int = 65536) -> List[Any]:
+    """Decode an NDJSON body in chunks."""
+    decoder = NDJSONDecoder()
+    rows = []
+    for start in range(0, len(body), chunk_size):
+        rows.extend(decoder.feed(body[start:start + chunk_size]))
+    rows.extend(decoder.close())
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JSON codecs on GKG payloads')
+    parser.add_argument('--rows', type=int, default=1000, help='Rows per payload')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    rows = make_gkg_rows(args.rows)
+    envelope = {'success': True, 'data': rows, 'rowCount': len(rows), 'executionTime': 0.42}
+    body = json.dumps(envelope)
+    body_bytes = body.encode('utf-8')
+    ndjson_body = '\n'.join(json.dumps(row) for row in rows)
+    result = {'data': rows, 'count': len(rows), 'execution_time': 0.42, 'cached': False}
+
+    print(f"Payload: {len(rows)} gdelt_gkg rows, {len(body_bytes) / 1024:.0f} KiB")
+    print(f"Active codec: {json_codec.BACKEND}")
+    print()
+
+    available = {}
+    for name, backend in json_codec._BACKENDS.items():
+        try:
+            available[name] = backend()
+        except ImportError:
+            print(f"  {name}: not installed")
+
+    print(f"{'case':<34}{'backend':<10}{'total ms':>10}{'us/row':>10}")
+    print('-' * 64)
+
+    def report(case: str, backend: str, seconds: float):
+        print(f"{case:<34}{backend:<10}{seconds * 1000:>10.2f}{seconds * 1e6 / len(rows):>10.2f}")
+
+    for name, (loads, _dumps) in available.items():
+        report('decode envelope (whole body)', name, bench(lambda loads=loads: loads(body_bytes), args.repeat))
+    report('decode envelope (incremental)', 'stdlib', bench(lambda: incremental(body), args.repeat))
+    for name, (loads, _dumps) in available.items():
+        lines = ndjson_body.split('\n')
+        report('decode NDJSON rows', name, bench(lambda lines=lines, loads=loads: [loads(line) for line in lines], args.repeat))
+    report('decode NDJSON (active codec)', json_codec.BACKEND, bench(lambda: ndjson(ndjson_body), args.repeat))
+    for name, (_loads, dumps) in available.items():
+        report('encode tool result', name, bench(lambda dumps=dumps: dumps(result), args.repeat))
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,24 @@ Authentication:
 Documentation: https://docs.gdeltcloud.com
 """
 
+import logging
 import os
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from fastmcp.server.auth import RemoteAuthProvider
-from fastmcp.server.auth.providers.jwt import JWTVerifier
 from pydantic import Field, AnyHttpUrl
 
-# Load environment variables
-load_dotenv()
-
 # Import utilities and resources
-from utils import GDELTCloudAPIClient, AuthContext, get_auth_token
+from utils import GDELTCloudAPIClient, AuthContext, encode_rows, RESULT_FORMATS
+from utils import json_codec
+from utils.log import configure_logging, get_logger
 from utils.dual_token_verifier import DualTokenVerifier
+from utils.jwks import JWKSManager, JWKSVerifier
+from utils.key_introspection import APIKeyIntrospector
+from utils.auth import RequestAuthMiddleware
+from utils.rate_limit import RateLimitMiddleware, parse_limits
 from cameo import (
     COUNTRY_CODES,
     ACTOR_TYPES,
@@ -52,6 +56,19 @@ from resources import (
     COMMON_MISTAKES,
 )
 
+# Load environment variables (settings read at import time are re-read here)
+load_dotenv()
+json_codec.configure()
+configure_logging()
+logger = get_logger('server')
+
+# Supabase signing keys, prefetched and refreshed by the server lifespan
+jwks_manager: Optional[JWKSManager] = None
+
+# Optional backend check of API keys, closed by the server lifespan
+key_introspector: Optional[APIKeyIntrospector] = None
+
+
 # Initialize authentication provider
 def create_auth_provider():
     """
@@ -65,6 +82,7 @@ def create_auth_provider():
     The base_url parameter identifies THIS MCP server as the protected resource,
     not the backend API. MCP clients use this for OAuth discovery metadata.
     """
+    global jwks_manager, key_introspector
     supabase_url = os.getenv('SUPABASE_URL')
     
     # MCP server's own base URL (where THIS server is accessible)
@@ -74,21 +92,37 @@ def create_auth_provider():
     
     if not supabase_url:
         # Fall back to no auth for development if Supabase URL not set
-        print("WARNING: SUPABASE_URL not set. Running without OAuth support.")
+        logger.warning("SUPABASE_URL not set. Running without OAuth support.")
         return None
     
     # Configure JWT token verification for Supabase OAuth tokens
-    # Supabase issues JWT tokens that can be verified using their public keys
-    jwt_verifier = JWTVerifier(
-        jwks_uri=f"{supabase_url}/auth/v1/jwks",  # Supabase public keys endpoint
+    # Supabase issues JWT tokens that can be verified using their public keys,
+    # which are held in memory (indexed by kid) rather than fetched per request
+    jwks_manager = JWKSManager(
+        f"{supabase_url}/auth/v1/jwks",  # Supabase public keys endpoint
+        refresh_interval=float(os.getenv('GDELT_JWKS_REFRESH_INTERVAL', '3600')),
+        min_refetch_interval=float(os.getenv('GDELT_JWKS_MIN_REFETCH_INTERVAL', '30'))
+    )
+    jwt_verifier = JWKSVerifier(
+        jwks_manager,
         issuer=f"{supabase_url}/auth/v1",          # Token issuer must match
         audience="authenticated"                    # Supabase default audience
     )
     
+    # Optionally check API keys against the GDELT Cloud API before accepting
+    # them, so revoked keys are rejected here instead of on every query
+    introspection_url = os.getenv('GDELT_API_KEY_INTROSPECTION_URL')
+    if introspection_url:
+        key_introspector = APIKeyIntrospector(
+            introspection_url,
+            ttl=float(os.getenv('GDELT_API_KEY_CACHE_TTL', '60')),
+            negative_ttl=float(os.getenv('GDELT_API_KEY_NEGATIVE_TTL', '300'))
+        )
+    
     # Wrap JWT verifier in DualTokenVerifier to support BOTH:
     # 1. OAuth JWT tokens from Supabase (for interactive users like ChatGPT, Claude)
     # 2. API keys (gdelt_sk_*) for automated agents and developers
-    dual_verifier = DualTokenVerifier(jwt_verifier)
+    dual_verifier = DualTokenVerifier(jwt_verifier, introspector=key_introspector)
     
     # Create RemoteAuthProvider with Supabase as authorization server
     # This enables MCP clients to:
@@ -102,23 +136,70 @@ def create_auth_provider():
         base_url=mcp_server_url  # THIS MCP server's URL (for OAuth metadata)
     )
 
+# Global API client shared by all requests (auth token is supplied per call)
+_api_client: Optional[GDELTCloudAPIClient] = None
+
+
+def _create_api_client() -> GDELTCloudAPIClient:
+    """Create the shared API client with its connection pool."""
+    base_url = os.getenv('GDELT_CLOUD_API_URL', 'https://gdeltcloud.com')
+    return GDELTCloudAPIClient(base_url=base_url)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Server lifespan: open the pooled API client on startup, close it on shutdown.
+    
+    Keeping one client for the life of the process lets every tool call reuse
+    warm keep-alive connections instead of paying TCP+TLS setup per query.
+    Supabase signing keys are prefetched here too, so the first OAuth request
+    does not wait on a JWKS download.
+    """
+    global _api_client
+    _api_client = _create_api_client()
+    if jwks_manager is not None:
+        await jwks_manager.start()
+    try:
+        yield {"api_client": _api_client}
+    finally:
+        if jwks_manager is not None:
+            await jwks_manager.stop()
+        if key_introspector is not None:
+            await key_introspector.close()
+        client, _api_client = _api_client, None
+        await client.close()
+
+
 # Initialize FastMCP server with authentication
 auth_provider = create_auth_provider()
-mcp = FastMCP("GDELT Cloud", auth=auth_provider)
+mcp = FastMCP(
+    "GDELT Cloud",
+    auth=auth_provider,
+    lifespan=lifespan,
+    tool_serializer=json_codec.dumps
+)
 
-# Global API client (will be initialized with auth context per request)
-_api_client: Optional[GDELTCloudAPIClient] = None
+# Resolve the caller's verified token once per request, for everything below
+mcp.add_middleware(RequestAuthMiddleware())
 
+# Per-caller, per-tool rate limits, checked before any tool work
+if os.getenv('GDELT_RATE_LIMIT_ENABLED', 'true').lower() in ('1', 'true', 'yes', 'on'):
+    rate_limiter = RateLimitMiddleware(limits=parse_limits(os.getenv('GDELT_RATE_LIMITS')))
+    mcp.add_middleware(rate_limiter)
 
-async def get_api_client(auth_token: Optional[str] = None) -> GDELTCloudAPIClient:
-    """Get or create API client with authentication."""
-    token = auth_token or get_auth_token()
-    
-    if not token:
-        raise ValueError("Authentication required. Provide OAuth token or API key.")
+
+def get_api_client() -> GDELTCloudAPIClient:
+    """
+    Get the shared API client.
     
-    base_url = os.getenv('GDELT_CLOUD_API_URL', 'https://gdeltcloud.com')
-    return GDELTCloudAPIClient(base_url=base_url, auth_token=token)
+    The client is normally opened by the server lifespan; if a tool runs
+    outside of it (e.g. direct in-process calls), one is created lazily.
+    """
+    global _api_client
+    if _api_client is None:
+        _api_client = _create_api_client()
+    return _api_client
 
 
 # ============================================================================
@@ -484,7 +565,15 @@ async def query_gdelt_events(
         description="Comma-separated field names"
     ),
     limit: int = Field(100, description="Maximum rows (1-1000)", ge=1, le=1000),
-    order_by: Optional[str] = Field(None, description="ORDER BY clause (without ORDER BY keyword)")
+    order_by: Optional[str] = Field(None, description="ORDER BY clause (without ORDER BY keyword)"),
+    split_by: Optional[str] = Field(
+        None,
+        description="For long date windows: run as parallel 'day', 'week' or 'month' sub-ranges and merge. Requires start AND end dates in where_clause"
+    ),
+    format: str = Field(
+        "rows",
+        description="Response layout: 'rows' (list of objects), 'columnar' ({columns, rows}: values as arrays in column order) or 'dictionary' (columnar; repetitive string columns sent as indexes into 'dictionaries')"
+    )
 ) -> Dict[str, Any]:
     """
     Query GDELT events table for structured event data.
@@ -499,48 +588,53 @@ async def query_gdelt_events(
     IMPORTANT: Always include date filter for performance!
     Example: where_clause="day >= '2025-01-01' AND event_root_code = '14'"
     
+    For long windows (months or more) that time out, bound both ends of the
+    date range and set split_by: where_clause="day BETWEEN '2024-01-01' AND
+    '2024-12-31' AND event_root_code = '14'", split_by="month"
+    
     Returns events with actor information, event classification, and impact metrics.
     """
-    print("\n" + "="*80)
-    print("QUERY_GDELT_EVENTS CALLED")
-    print("="*80)
-    print(f"where_clause: {where_clause}")
-    print(f"select_fields: {select_fields}")
-    print(f"limit: {limit}")
-    print(f"order_by: {order_by}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("query_gdelt_events called", extra={
+            "where_clause": where_clause,
+            "select_fields": select_fields,
+            "limit": limit,
+            "order_by": order_by,
+            "split_by": split_by,
+            "format": format,
+        })
+    
+    if format not in RESULT_FORMATS:
+        return {"error": f"format must be one of: {', '.join(RESULT_FORMATS)}"}
     
     try:
         auth_context = AuthContext()
-        print(f"Getting auth token...")
         token = auth_context.require_auth()
-        print(f"Token obtained: {token[:20]}..." if token else "No token")
         
-        print(f"Creating API client...")
-        async with await get_api_client(token) as client:
-            print(f"Executing query...")
-            result = await client.query_events(
-                where_clause=where_clause,
-                select_fields=select_fields,
-                limit=limit,
-                order_by=order_by
-            )
-            
-            print(f"Query result - Error: {result.error}, Count: {result.count}")
-            
-            if result.error:
-                print(f"Returning error: {result.error}")
-                return {"error": result.error}
-            
-            print(f"Returning {result.count} results")
-            return {
-                "data": result.data,
-                "count": result.count,
-                "execution_time": result.execution_time
-            }
+        client = get_api_client()
+        result = await client.query_events(
+            where_clause=where_clause,
+            select_fields=select_fields,
+            limit=limit,
+            order_by=order_by,
+            auth_token=token,
+            split_by=split_by,
+            columnar=format != "rows"
+        )
+        
+        if result.error:
+            logger.debug("query_gdelt_events failed: %s", result.error)
+            return {"error": result.error}
+        
+        logger.debug("query_gdelt_events returned %d rows", result.count)
+        return {
+            **encode_rows(result.data, format),
+            "count": result.count,
+            "execution_time": result.execution_time,
+            "cached": result.cached
+        }
     except Exception as e:
-        print(f"Exception in query_gdelt_events: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("query_gdelt_events failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"error": str(e)}
 
 
@@ -555,7 +649,15 @@ async def query_gdelt_gkg(
         description="Comma-separated field names"
     ),
     limit: int = Field(100, description="Maximum rows (1-1000)", ge=1, le=1000),
-    order_by: Optional[str] = Field(None, description="ORDER BY clause (without ORDER BY keyword)")
+    order_by: Optional[str] = Field(None, description="ORDER BY clause (without ORDER BY keyword)"),
+    split_by: Optional[str] = Field(
+        None,
+        description="For long date windows: run as parallel 'day', 'week' or 'month' sub-ranges and merge. Requires start AND end dates in where_clause"
+    ),
+    format: str = Field(
+        "rows",
+        description="Response layout: 'rows' (list of objects), 'columnar' ({columns, rows}: values as arrays in column order) or 'dictionary' (columnar; repetitive string columns sent as indexes into 'dictionaries')"
+    )
 ) -> Dict[str, Any]:
     """
     Query GDELT GKG (Global Knowledge Graph) table for semantic content analysis.
@@ -573,27 +675,166 @@ async def query_gdelt_gkg(
     - Check both v1_themes and v2_themes with LIKE '%THEME%'
     
     Example: where_clause="date >= toDateTime('2025-01-01') AND (v1_themes LIKE '%ECON%' OR v2_themes LIKE '%ECON%')"
+    
+    For long windows, bound both ends of the date range and set split_by
+    ('day', 'week' or 'month') to run sub-ranges in parallel.
+    """
+    if format not in RESULT_FORMATS:
+        return {"error": f"format must be one of: {', '.join(RESULT_FORMATS)}"}
+    
+    try:
+        auth_context = AuthContext()
+        token = auth_context.require_auth()
+        
+        client = get_api_client()
+        result = await client.query_gkg(
+            where_clause=where_clause,
+            select_fields=select_fields,
+            limit=limit,
+            order_by=order_by,
+            auth_token=token,
+            split_by=split_by,
+            columnar=format != "rows"
+        )
+        
+        if result.error:
+            return {"error": result.error}
+        
+        return {
+            **encode_rows(result.data, format),
+            "count": result.count,
+            "execution_time": result.execution_time,
+            "cached": result.cached
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(tags=["query", "events", "gkg", "pagination"])
+async def query_gdelt_pages(
+    table: str = Field("events", description="'events' (gdelt_events) or 'gkg' (gdelt_gkg)"),
+    where_clause: Optional[str] = Field(
+        None,
+        description="SQL WHERE clause (without WHERE keyword). MUST include a date filter"
+    ),
+    select_fields: Optional[str] = Field(
+        None,
+        description="Comma-separated field names (defaults to the same fields as query_gdelt_events / query_gdelt_gkg)"
+    ),
+    page_size: int = Field(500, description="Rows per page (1-1000)", ge=1, le=1000),
+    cursor: Optional[str] = Field(
+        None,
+        description="next_cursor from the previous page. When given, all other arguments are ignored"
+    )
+) -> Dict[str, Any]:
+    """
+    Page through more than 1000 rows of events or GKG records.
+    
+    Rows come newest first, ordered by (day, global_event_id) for events or
+    (date, gkg_record_id) for GKG. Each response includes next_cursor; call
+    again with only cursor=<next_cursor> to get the following page. When
+    next_cursor is null there are no more rows.
+    
+    Example: table="events", where_clause="day >= '2025-01-01' AND event_root_code = '14'"
     """
+    tables = {"events": "gdelt_events", "gkg": "gdelt_gkg"}
+    default_fields = {
+        "events": "global_event_id, day, actor1_name, actor2_name, event_code, goldstein_scale, avg_tone, action_geo_country_code",
+        "gkg": "gkg_record_id, date, source_common_name, document_identifier, v2_themes, v1_5_tone",
+    }
+    if not cursor and table not in tables:
+        return {"error": "table must be 'events' or 'gkg'"}
+    
     try:
         auth_context = AuthContext()
         token = auth_context.require_auth()
         
-        async with await get_api_client(token) as client:
-            result = await client.query_gkg(
-                where_clause=where_clause,
-                select_fields=select_fields,
-                limit=limit,
-                order_by=order_by
-            )
-            
-            if result.error:
-                return {"error": result.error}
-            
-            return {
-                "data": result.data,
-                "count": result.count,
-                "execution_time": result.execution_time
-            }
+        client = get_api_client()
+        result = await client.query_page(
+            table=tables.get(table),
+            where_clause=where_clause,
+            select_fields=select_fields or default_fields.get(table, '*'),
+            page_size=page_size,
+            cursor=cursor,
+            auth_token=token
+        )
+        
+        if result.error:
+            return {"error": result.error}
+        
+        return {
+            "data": result.data,
+            "count": result.count,
+            "next_cursor": result.next_cursor,
+            "execution_time": result.execution_time,
+            "cached": result.cached
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(tags=["query", "events", "gkg", "time-series"])
+async def query_gdelt_time_series(
+    start_date: str = Field(..., description="First day of the series (YYYY-MM-DD)"),
+    end_date: str = Field(..., description="Last day of the series, inclusive (YYYY-MM-DD)"),
+    metrics: str = Field(
+        "count() AS event_count, avg(goldstein_scale) AS avg_intensity, avg(avg_tone) AS avg_sentiment",
+        description="Comma-separated aggregate expressions computed per day"
+    ),
+    where_clause: Optional[str] = Field(
+        None,
+        description="Additional filters (without WHERE keyword). Do NOT include date conditions; use start_date/end_date"
+    ),
+    table: str = Field("events", description="'events' (gdelt_events) or 'gkg' (gdelt_gkg)")
+) -> Dict[str, Any]:
+    """
+    Daily time series of aggregate metrics (one row per day).
+    
+    Equivalent to the TIME_SERIES query pattern (GROUP BY day ORDER BY day),
+    but each day is cached separately: re-running with a shifted or extended
+    window only queries the days not seen before, so rolling-window series
+    are nearly free after the first call.
+    
+    Example: start_date="2025-01-01", end_date="2025-03-31",
+             where_clause="event_root_code = '14' AND action_geo_country_code = 'USA'"
+    
+    For GKG, metrics run over gdelt_gkg rows grouped by toDate(date), e.g.
+    metrics="count() AS article_count"
+    """
+    from datetime import date
+    
+    tables = {"events": "gdelt_events", "gkg": "gdelt_gkg"}
+    if table not in tables:
+        return {"error": "table must be 'events' or 'gkg'"}
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except ValueError:
+        return {"error": "start_date and end_date must be YYYY-MM-DD"}
+    
+    try:
+        auth_context = AuthContext()
+        token = auth_context.require_auth()
+        
+        client = get_api_client()
+        result = await client.query_time_series(
+            table=tables[table],
+            metrics=metrics,
+            start_date=start,
+            end_date=end,
+            where_clause=where_clause,
+            auth_token=token
+        )
+        
+        if result.error:
+            return {"error": result.error}
+        
+        return {
+            "data": result.data,
+            "count": result.count,
+            "execution_time": result.execution_time,
+            "cached": result.cached
+        }
     except Exception as e:
         return {"error": str(e)}
 
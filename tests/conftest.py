@@ -0,0 +1,83 @@
+"""
+Shared fixtures for GDELT Cloud MCP Server tests
+"""
+
+import os
+from typing import Callable
+
+import httpx
+import pytest
+from authlib.jose import JsonWebKey
+
+from utils import GDELTCloudAPIClient
+from utils import jwks as jwks_module
+
+VALID_KEY = 'gdelt_sk_' + 'a' * 64
+FORGED_KEY = 'gdelt_sk_' + 'f' * 64
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Run every test with default settings, whatever the developer's .env says."""
+    for name in list(os.environ):
+        if name.startswith(('GDELT_', 'SUPABASE_')):
+            monkeypatch.delenv(name)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Monotonic clock the test advances by hand."""
+    clock = Clock()
+    monkeypatch.setattr(jwks_module.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def make_client() -> Callable[..., GDELTCloudAPIClient]:
+    """Build an API client whose backend is the given request handler."""
+    def factory(handler: Callable[[httpx.Request], httpx.Response], **kwargs) -> GDELTCloudAPIClient:
+        client = GDELTCloudAPIClient(base_url='http://backend.test', **kwargs)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+    return factory
+
+
+def bearer(request: httpx.Request) -> str:
+    """Token a mock backend request was sent with."""
+    return request.headers.get('authorization', '').removeprefix('Bearer ')
+
+
+ISSUER = 'https://project.supabase.test/auth/v1'
+JWKS_URI = 'https://project.supabase.test/auth/v1/jwks'
+
+
+def jwk(key_pair, kid: str) -> dict:
+    """Public JWK for an RSAKeyPair."""
+    key = JsonWebKey.import_key(key_pair.public_key, {'kty': 'RSA'}).as_dict()
+    return {**key, 'kid': kid, 'use': 'sig', 'alg': 'RS256'}
+
+
+class JWKSServer:
+    """Mock JWKS endpoint: serves `keys`, or fails while `down` is set."""
+
+    def __init__(self, *keys: dict):
+        self.keys = list(keys)
+        self.down = False
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.down:
+            raise httpx.ConnectError('JWKS endpoint unreachable', request=request)
+        return httpx.Response(200, json={'keys': self.keys})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
@@ -0,0 +1,193 @@
+"""
+Admission control: priority-ordered slot hand-off and queue rejections
+"""
+
+import asyncio
+
+import pytest
+
+from utils.admission import BATCH, INTERACTIVE, AdmissionController, AdmissionError, PriorityGate
+
+
+async def settle():
+    """Let every runnable task reach its next await."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def start(gate, priority, order):
+    async def waiter():
+        await gate.acquire(priority)
+        order.append(priority)
+
+    return asyncio.create_task(waiter())
+
+
+def test_free_slots_are_taken_without_waiting():
+    async def run():
+        gate = PriorityGate(2)
+        await gate.acquire()
+        assert not gate.locked()
+        await gate.acquire(BATCH)
+        assert gate.locked()
+
+    asyncio.run(run())
+
+
+def test_release_hands_the_slot_to_the_heavier_class():
+    async def run():
+        gate = PriorityGate(1)
+        await gate.acquire()
+        order = []
+        tasks = [start(gate, BATCH, order), start(gate, INTERACTIVE, order)]
+        await settle()
+
+        gate.release()
+        await settle()
+        # The slot passed straight to a waiter: none is left free to barge in on
+        assert order == [INTERACTIVE] and gate._free == 0 and gate.locked()
+
+        gate.release()
+        await asyncio.gather(*tasks)
+        assert order == [INTERACTIVE, BATCH]
+
+    asyncio.run(run())
+
+
+def test_cancel_during_hand_off_passes_the_slot_on():
+    async def run():
+        gate = PriorityGate(1)
+        await gate.acquire()
+        order = []
+        first = start(gate, INTERACTIVE, order)
+        second = start(gate, BATCH, order)
+        await settle()
+
+        # The slot is handed to `first`, which is cancelled before it resumes
+        gate.release()
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.wait_for(second, timeout=1)
+        assert order == [BATCH] and gate._free == 0
+
+        gate.release()
+        assert gate._free == 1 and not gate.locked()
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def run():
+        gate = PriorityGate(1)
+        await gate.acquire()
+        waiter = start(gate, INTERACTIVE, [])
+        await settle()
+        waiter.cancel()
+        await settle()
+        assert not any(gate._waiters.values())
+
+        gate.release()
+        assert gate._free == 1 and not gate.locked()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize('waited, first', [(5, INTERACTIVE), (6.5, BATCH)])
+def test_aging_keeps_lighter_waiters_from_starving(clock, waited, first):
+    async def run():
+        gate = PriorityGate(1, weights={INTERACTIVE: 4.0, BATCH: 1.0}, aging=2.0)
+        await gate.acquire()
+        order = []
+        tasks = [start(gate, BATCH, order)]
+        await settle()
+        # A batch call that waited 6s scores 1 * (1 + 6 / 2) == 4, a fresh
+        # interactive call's weight
+        clock.now += waited
+        tasks.append(start(gate, INTERACTIVE, order))
+        await settle()
+
+        gate.release()
+        await settle()
+        gate.release()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run())[0] == first
+
+
+def hold(controller, key, release, priority=INTERACTIVE):
+    """Task that keeps a slot for `key` until `release` is set."""
+    async def holder():
+        async with controller.slot(key, priority):
+            await release.wait()
+
+    return asyncio.create_task(holder())
+
+
+def test_full_queue_rejects_at_once():
+    async def run():
+        controller = AdmissionController(global_limit=1, per_key_limit=1, max_queue=1, max_wait=5)
+        release = asyncio.Event()
+        holder = hold(controller, 'a', release)
+        queued = hold(controller, 'b', release)
+        await settle()
+        assert controller.stats()['waiting'] == 1
+
+        with pytest.raises(AdmissionError, match='too many queries waiting'):
+            async with controller.slot('c'):
+                pass
+        release.set()
+        await asyncio.gather(holder, queued)
+        return controller.stats()
+
+    stats = asyncio.run(run())
+    assert stats['rejected_full'] == 1 and stats['rejected_timeout'] == 0
+    assert stats['admitted'] == 2 and stats['queued'] == 1
+    assert stats['in_flight'] == stats['waiting'] == stats['callers'] == 0
+
+
+@pytest.mark.parametrize('key', ['a', 'b'])
+def test_wait_timeout_rejects_and_frees_the_caller_slot(key):
+    # 'a' times out on its own per-caller slot, 'b' on the global one
+    async def run():
+        controller = AdmissionController(global_limit=1, per_key_limit=1, max_queue=10, max_wait=0.05)
+        release = asyncio.Event()
+        holder = hold(controller, 'a', release)
+        await settle()
+
+        with pytest.raises(AdmissionError, match='waited more than 0.05s'):
+            async with controller.slot(key):
+                pass
+        stats = controller.stats()
+        assert stats['rejected_timeout'] == 1 and stats['waiting'] == 0
+        assert not any(controller._global._waiters.values())
+
+        release.set()
+        await holder
+        # Neither slot leaked: the same caller is admitted without queueing
+        async with controller.slot(key):
+            pass
+        return controller.stats()
+
+    stats = asyncio.run(run())
+    assert stats['admitted'] == 2 and stats['queued'] == 1
+    assert stats['in_flight'] == 0 and stats['callers'] == 0
+
+
+def test_global_wait_timeout_returns_the_caller_slot():
+    async def run():
+        controller = AdmissionController(global_limit=1, per_key_limit=2, max_queue=10, max_wait=0.05)
+        release = asyncio.Event()
+        holder = hold(controller, 'a', release)
+        await settle()
+
+        # The caller slot is taken, then the global wait times out
+        with pytest.raises(AdmissionError):
+            async with controller.slot('a'):
+                pass
+        assert not controller._keys['a'].semaphore.locked()
+        release.set()
+        await holder
+
+    asyncio.run(run())
@@ -0,0 +1,99 @@
+"""
+Result cache partitioning: a cache hit must never stand in for the backend's
+token check
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import FORGED_KEY, VALID_KEY, bearer
+from fastmcp.server.auth import AccessToken
+from mcp.server.auth.middleware.auth_context import auth_context_var
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+
+from utils.api_client import SHARED_SCOPE
+from utils.auth import KEY_VERIFIED_CLAIM
+
+QUERY = "SELECT global_event_id FROM gdelt_events WHERE day = '2024-01-01' LIMIT 1"
+ROWS = [{'global_event_id': 1}]
+
+
+def backend_accepting(*tokens):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = bearer(request)
+        calls.append(token)
+        if token not in tokens:
+            return httpx.Response(401, json={'error': 'Invalid API key'})
+        return httpx.Response(200, json={'success': True, 'data': ROWS, 'rowCount': 1})
+
+    return handler, calls
+
+
+def as_verified(token, **claims):
+    """Mark `token` as verified for the current request."""
+    access_token = AccessToken(token=token, client_id='test', scopes=[], claims=claims)
+    auth_context_var.set(AuthenticatedUser(access_token))
+
+
+@pytest.mark.parametrize('scope', [None, 'token', 'shared'])
+def test_forged_key_is_not_served_cached_rows(make_client, monkeypatch, scope):
+    if scope:
+        monkeypatch.setenv('GDELT_CACHE_SCOPE', scope)
+    handler, calls = backend_accepting(VALID_KEY)
+    client = make_client(handler)
+
+    async def run():
+        first = await client.execute_query(QUERY, auth_token=VALID_KEY)
+        # A well-formed key passes the verifier's format check only
+        as_verified(FORGED_KEY)
+        forged = await client.execute_query(QUERY, auth_token=FORGED_KEY)
+        return first, forged
+
+    first, forged = asyncio.run(run())
+    assert first.error is None and first.data == ROWS
+    assert forged.error is not None and forged.data == []
+    assert not forged.cached
+    assert calls == [VALID_KEY, FORGED_KEY]
+
+
+def test_same_token_reuses_its_own_results(make_client):
+    handler, calls = backend_accepting(VALID_KEY)
+    client = make_client(handler)
+
+    async def run():
+        await client.execute_query(QUERY, auth_token=VALID_KEY)
+        return await client.execute_query(QUERY, auth_token=VALID_KEY)
+
+    assert asyncio.run(run()).cached
+    assert calls == [VALID_KEY]
+
+
+def test_shared_scope_only_for_verified_callers(make_client, monkeypatch):
+    monkeypatch.setenv('GDELT_CACHE_SCOPE', 'shared')
+    handler, calls = backend_accepting('jwt-a', 'jwt-b', VALID_KEY)
+    client = make_client(handler)
+
+    async def run():
+        as_verified('jwt-a')
+        await client.execute_query(QUERY, auth_token='jwt-a')
+        as_verified('jwt-b')
+        jwt_hit = await client.execute_query(QUERY, auth_token='jwt-b')
+        as_verified(VALID_KEY, **{KEY_VERIFIED_CLAIM: True})
+        key_hit = await client.execute_query(QUERY, auth_token=VALID_KEY)
+        return jwt_hit, key_hit
+
+    jwt_hit, key_hit = asyncio.run(run())
+    assert jwt_hit.cached and key_hit.cached
+    assert calls == ['jwt-a']
+
+
+def test_scope_outside_a_verified_request(make_client, monkeypatch):
+    monkeypatch.setenv('GDELT_CACHE_SCOPE', 'shared')
+    client = make_client(backend_accepting()[0])
+    # Also covers the time series and range-split caches, which use _scope
+    assert client._scope(VALID_KEY) != SHARED_SCOPE
+    assert client._scope(VALID_KEY) != client._scope(FORGED_KEY)
+    assert client._scope(None) != SHARED_SCOPE
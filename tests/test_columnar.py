@@ -0,0 +1,61 @@
+"""
+Columnar result layout
+"""
+
+import asyncio
+import json
+from array import array
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+from utils import api_client
+from utils.columnar import ColumnarRows, encode_rows
+
+QUERY = "SELECT day, goldstein_scale, num_mentions FROM gdelt_events WHERE day = '2024-01-01' LIMIT 3"
+ROWS = [
+    {'day': '2024-01-01', 'goldstein_scale': -2.0, 'num_mentions': 4},
+    {'day': '2024-01-01', 'goldstein_scale': 3.4, 'num_mentions': 10},
+    {'day': '2024-01-02', 'goldstein_scale': 1.0, 'num_mentions': 1},
+]
+
+
+def test_numeric_columns_are_typed_arrays():
+    table = ColumnarRows.from_rows(ROWS)
+    assert table.column('goldstein_scale') == array('d', [-2.0, 3.4, 1.0])
+    assert table.column('num_mentions') == array('q', [4, 10, 1])
+    assert table.column('day') == ['2024-01-01', '2024-01-01', '2024-01-02']
+    assert table.to_rows() == ROWS and list(table) == ROWS and table[1] == ROWS[1]
+    assert ColumnarRows.from_dict(json.loads(json.dumps(table.to_dict()))) == table
+
+
+def test_mismatched_columns_are_rejected():
+    with pytest.raises(ValueError):
+        ColumnarRows(['a', 'b'], [[1, 2], [3]])
+
+
+def test_dictionary_layout():
+    payload = encode_rows(ROWS * 2, 'dictionary')
+    assert payload['dictionaries'] == {'day': ['2024-01-01', '2024-01-02']}
+    assert payload['rows'][0] == [0, -2.0, 4]
+
+
+@pytest.mark.parametrize('sized', [True, False])
+def test_columnar_results_skip_the_row_list(make_client, monkeypatch, sized):
+    body = json.dumps({'success': True, 'data': ROWS, 'rowCount': 3}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if sized:
+            return httpx.Response(200, content=body)
+
+        async def chunks():
+            yield body
+
+        return httpx.Response(200, content=chunks())
+
+    # Converting afterwards would hold every row dict alongside the columns
+    monkeypatch.setattr(api_client.ColumnarRows, 'from_rows', pytest.fail)
+    result = asyncio.run(make_client(handler).execute_query(QUERY, auth_token=VALID_KEY, columnar=True))
+    assert isinstance(result.data, ColumnarRows)
+    assert result.data == ROWS and result.count == 3
@@ -0,0 +1,40 @@
+"""
+Transport compression
+"""
+
+import gzip
+import sys
+import types
+
+from httpx._decoders import SUPPORTED_DECODERS
+
+from utils.compression import accept_encoding, available_encodings, compress_body
+
+
+def test_offered_encodings_are_decodable_by_httpx():
+    # Guards the package probe against httpx changing its optional decoders
+    assert set(available_encodings()) <= set(SUPPORTED_DECODERS)
+    assert {'gzip', 'deflate'} <= set(available_encodings())
+
+
+def test_optional_encodings_follow_installed_packages(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'zstandard', types.ModuleType('zstandard'))
+    monkeypatch.setitem(sys.modules, 'brotli', None)
+    monkeypatch.setitem(sys.modules, 'brotlicffi', None)
+    assert available_encodings() == ['zstd', 'gzip', 'deflate']
+
+
+def test_accept_encoding(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'zstandard', None)
+    assert accept_encoding('none') == 'identity'
+    assert accept_encoding('zstd, gzip') == 'gzip'
+    assert accept_encoding('zstd') == 'identity'
+
+
+def test_compress_body():
+    body = b'x' * 2048
+    assert compress_body(body, None) == (body, {})
+    assert compress_body(body, 4096) == (body, {})
+    compressed, headers = compress_body(body, 1024)
+    assert headers == {'Content-Encoding': 'gzip'} and gzip.decompress(compressed) == body
+
@@ -0,0 +1,64 @@
+"""
+Persistent result cache
+"""
+
+import asyncio
+import zlib
+
+import httpx
+from conftest import VALID_KEY
+
+from utils.disk_cache import DiskCache
+
+QUERY = "SELECT global_event_id FROM gdelt_events WHERE day = '2024-01-01' LIMIT 1"
+
+
+def corrupt_all(cache: DiskCache, blob: bytes = b'not zlib') -> None:
+    cache._connect().execute('UPDATE entries SET value = ?', (blob,))
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('k', {'rows': [1, 2, 3]}, ttl=60)
+    value, remaining = cache.get('k')
+    assert value == {'rows': [1, 2, 3]}
+    assert 0 < remaining <= 60
+
+
+def test_corrupt_entry_is_a_miss_and_evicted(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('k', {'rows': [1]})
+    corrupt_all(cache)
+
+    assert cache.get('k') is None
+    assert cache._connect().execute('SELECT COUNT(*) FROM entries').fetchone()[0] == 0
+    stats = cache.stats()
+    assert stats['corrupt'] == 1 and stats['misses'] == 1 and stats['hits'] == 0
+    assert stats['bytes'] == 0
+
+
+def test_undecodable_json_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('k', [1])
+    corrupt_all(cache, zlib.compress(b'{"truncated": '))
+    assert cache.get('k') is None
+
+
+def test_corrupt_disk_entry_falls_through_to_backend(make_client, tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={'success': True, 'data': [{'n': 1}], 'rowCount': 1})
+
+    disk = DiskCache(str(tmp_path))
+    first = make_client(handler, disk_cache=disk)
+    asyncio.run(first.execute_query(QUERY, auth_token=VALID_KEY))
+    corrupt_all(disk)
+
+    # A fresh process: empty memory tier, shared (now corrupt) disk tier
+    second = make_client(handler, disk_cache=disk)
+    result = asyncio.run(second.execute_query(QUERY, auth_token=VALID_KEY))
+    assert result.error is None and result.data == [{'n': 1}]
+    assert not result.cached
+    assert len(calls) == 2
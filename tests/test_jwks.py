@@ -0,0 +1,124 @@
+"""
+In-memory JWKS key management
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import ISSUER, JWKS_URI, JWKSServer, jwk
+from fastmcp.server.auth.providers.jwt import RSAKeyPair
+
+from utils.jwks import JWKSManager, JWKSUnavailableError, JWKSVerifier
+
+
+@pytest.fixture(scope='module')
+def key_pairs():
+    return RSAKeyPair.generate(), RSAKeyPair.generate()
+
+
+def make_manager(server, **kwargs):
+    return JWKSManager(JWKS_URI, client=server.client(), **kwargs)
+
+
+def test_start_prefetches_keys(key_pairs):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    manager = make_manager(server)
+
+    async def run():
+        await manager.start()
+        try:
+            return await manager.get_key('key-1')
+        finally:
+            await manager.stop()
+
+    assert asyncio.run(run()) is not None
+    assert server.requests == 1
+    assert manager.stats()['keys'] == 1
+
+
+def test_start_survives_an_unreachable_endpoint(key_pairs):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    server.down = True
+    manager = make_manager(server)
+
+    async def run():
+        await manager.start()
+        await manager.stop()
+
+    asyncio.run(run())
+    assert manager.stats()['keys'] == 0 and manager.stats()['fetch_errors'] == 1
+
+
+def test_unknown_kid_refetches_then_throttles(key_pairs, clock):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    manager = make_manager(server, min_refetch_interval=30)
+    asyncio.run(manager.refresh())
+
+    # The provider rotates in a new key
+    server.keys.append(jwk(key_pairs[1], 'key-2'))
+    clock.now += 31
+    assert asyncio.run(manager.get_key('key-2')) is not None
+    assert server.requests == 2
+
+    # Unknown kids right after a fetch do not hit the endpoint again, and are
+    # not reported as definitively missing
+    for _ in range(5):
+        with pytest.raises(JWKSUnavailableError, match='throttled'):
+            asyncio.run(manager.get_key('key-9'))
+    assert server.requests == 2
+    assert manager.stats()['unknown_kid_throttled'] == 5
+
+    clock.now += 31
+    with pytest.raises(ValueError, match='not found') as excinfo:
+        asyncio.run(manager.get_key('key-9'))
+    assert not isinstance(excinfo.value, JWKSUnavailableError)
+    assert server.requests == 3
+
+
+def test_concurrent_lookups_share_one_fetch(key_pairs):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    manager = make_manager(server)
+
+    async def run():
+        return await asyncio.gather(*(manager.get_key('key-1') for _ in range(10)))
+
+    assert all(key is not None for key in asyncio.run(run()))
+    assert server.requests == 1
+
+
+def test_failed_refresh_keeps_old_keys(key_pairs, clock):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    manager = make_manager(server, min_refetch_interval=0)
+    asyncio.run(manager.refresh())
+
+    server.down = True
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(manager.refresh())
+    assert asyncio.run(manager.get_key('key-1')) is not None
+    # A key that would need a fetch reports the outage, not a bad token
+    with pytest.raises(JWKSUnavailableError):
+        asyncio.run(manager.get_key('key-2'))
+
+
+def test_no_keys_yet_is_unavailable(key_pairs):
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    server.down = True
+    with pytest.raises(JWKSUnavailableError):
+        asyncio.run(make_manager(server).get_key('key-1'))
+
+
+def test_verifier_reads_keys_through_the_manager(key_pairs):
+    """
+    JWKSVerifier plugs into JWTVerifier by overriding its private
+    _get_jwks_key. load_access_token is JWTVerifier's own path (without
+    JWKSVerifier's pre-lookup); the JWKS URI is only reachable through the
+    manager's mock client, so this fails if fastmcp stops calling the hook.
+    """
+    server = JWKSServer(jwk(key_pairs[0], 'key-1'))
+    verifier = JWKSVerifier(make_manager(server), issuer=ISSUER, audience='authenticated')
+    token = key_pairs[0].create_token(kid='key-1', issuer=ISSUER, audience='authenticated')
+
+    access_token = asyncio.run(verifier.load_access_token(token))
+    assert access_token is not None and access_token.claims['iss'] == ISSUER
+    assert server.requests == 1
@@ -0,0 +1,148 @@
+"""
+API key introspection: cached answers, outages left to the backend, and
+coalesced concurrent checks
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import FORGED_KEY, VALID_KEY, bearer
+
+from utils.auth import hash_token
+from utils.key_introspection import APIKeyIntrospector
+
+URL = 'https://api.gdelt.test/v1/keys/introspect'
+
+
+class Endpoint:
+    """Introspection endpoint answering with the given response factory."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.tokens = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.tokens.append(bearer(request))
+        await asyncio.sleep(0)
+        return self.respond(request)
+
+
+def make_introspector(endpoint, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(endpoint))
+    return APIKeyIntrospector(URL, ttl=60, negative_ttl=300, client=client, **kwargs)
+
+
+def check_twice(introspector, api_key=VALID_KEY):
+    async def run():
+        return await introspector.check(api_key), await introspector.check(api_key)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('response, expected', [
+    (lambda request: httpx.Response(200, json={'active': True, 'key_id': 'k1'}), True),
+    (lambda request: httpx.Response(200, json={}), True),
+    (lambda request: httpx.Response(200, text='ok'), True),
+    (lambda request: httpx.Response(200, json={'active': False}), False),
+    (lambda request: httpx.Response(401, json={'error': 'Invalid API key'}), False),
+    (lambda request: httpx.Response(403, json={'error': 'Key revoked'}), False),
+])
+def test_definitive_answers_are_cached(response, expected):
+    endpoint = Endpoint(response)
+    introspector = make_introspector(endpoint)
+
+    assert check_twice(introspector) == (expected, expected)
+    assert endpoint.tokens == [VALID_KEY]
+    stats = introspector.stats()
+    assert stats['checks'] == 1 and stats['errors'] == 0
+    cache = introspector._valid if expected else introspector._invalid
+    # Cached under the key's hash, never the key itself
+    assert hash_token(VALID_KEY) in cache and VALID_KEY not in cache
+
+
+def raise_connect_error(request):
+    raise httpx.ConnectError('connection refused', request=request)
+
+
+def raise_timeout(request):
+    raise httpx.ReadTimeout('timed out', request=request)
+
+
+@pytest.mark.parametrize('response', [
+    lambda request: httpx.Response(500, text='Internal Server Error'),
+    lambda request: httpx.Response(503, json={'error': 'Unavailable'}),
+    lambda request: httpx.Response(429, json={'error': 'Too many requests'}),
+    raise_connect_error,
+    raise_timeout,
+])
+def test_outages_are_unknown_and_not_cached(response):
+    endpoint = Endpoint(response)
+    introspector = make_introspector(endpoint)
+
+    assert check_twice(introspector) == (None, None)
+    assert endpoint.tokens == [VALID_KEY, VALID_KEY]
+    stats = introspector.stats()
+    assert stats['checks'] == stats['errors'] == 2
+    assert len(introspector._valid) == len(introspector._invalid) == 0
+
+
+def test_recovery_after_an_outage_is_picked_up_at_once():
+    down = True
+
+    def respond(request):
+        return httpx.Response(503) if down else httpx.Response(200, json={'active': True})
+
+    introspector = make_introspector(Endpoint(respond))
+    assert check_twice(introspector) == (None, None)
+    down = False
+    assert check_twice(introspector) == (True, True)
+
+
+def test_keys_are_cached_separately():
+    endpoint = Endpoint(lambda request: httpx.Response(
+        200 if bearer(request) == VALID_KEY else 401, json={'active': True}
+    ))
+    introspector = make_introspector(endpoint)
+
+    async def run():
+        return [await introspector.check(key) for key in (VALID_KEY, FORGED_KEY, VALID_KEY, FORGED_KEY)]
+
+    assert asyncio.run(run()) == [True, False, True, False]
+    assert endpoint.tokens == [VALID_KEY, FORGED_KEY]
+
+
+def test_valid_answer_expires_after_ttl(clock):
+    endpoint = Endpoint(lambda request: httpx.Response(200, json={'active': True}))
+    introspector = make_introspector(endpoint)
+    assert check_twice(introspector) == (True, True)
+
+    # A key revoked meanwhile is rechecked once the positive TTL runs out
+    endpoint.respond = lambda request: httpx.Response(401)
+    clock.now += 61
+    assert check_twice(introspector) == (False, False)
+    assert len(endpoint.tokens) == 2
+
+
+def test_concurrent_checks_share_one_request():
+    endpoint = Endpoint(lambda request: httpx.Response(200, json={'active': True}))
+    introspector = make_introspector(endpoint)
+
+    async def run():
+        return await asyncio.gather(*(introspector.check(VALID_KEY) for _ in range(10)))
+
+    assert asyncio.run(run()) == [True] * 10
+    assert endpoint.tokens == [VALID_KEY]
+    stats = introspector.stats()
+    assert stats['checks'] == 1 and stats['coalesced'] == 9
+
+
+def test_concurrent_checks_during_an_outage_share_one_failure():
+    endpoint = Endpoint(lambda request: httpx.Response(502))
+    introspector = make_introspector(endpoint)
+
+    async def run():
+        return await asyncio.gather(*(introspector.check(VALID_KEY) for _ in range(5)))
+
+    assert asyncio.run(run()) == [None] * 5
+    assert introspector.stats()['errors'] == 1
@@ -0,0 +1,71 @@
+"""
+Keyset pagination cursors
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+from utils.pagination import MAX_PAGE_SIZE, decode_cursor, encode_cursor
+
+
+def state(**overrides):
+    return {'table': 'gdelt_events', 'where': None, 'select': '*', 'page_size': 10, 'after': None, **overrides}
+
+
+def test_round_trip():
+    cursor = encode_cursor(state(after=['2024-01-02', 42]))
+    assert decode_cursor(cursor) == state(after=['2024-01-02', 42])
+
+
+@pytest.mark.parametrize('page_size, expected', [(50000, MAX_PAGE_SIZE), (0, 1), (-5, 1), (10, 10)])
+def test_page_size_is_clamped(page_size, expected):
+    assert decode_cursor(encode_cursor(state(page_size=page_size)))['page_size'] == expected
+
+
+@pytest.mark.parametrize('overrides', [
+    {'page_size': None},
+    {'page_size': '10'},
+    {'page_size': 1.5},
+    {'page_size': True},
+    {'table': 'system.tables'},
+    {'where': 1},
+    {'select': ['*']},
+    {'after': ['2024-01-02']},
+    {'after': '2024-01-02,42'},
+    {'after': [None, {}]},
+])
+def test_malformed_state_is_rejected(overrides):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        decode_cursor(encode_cursor(state(**overrides)))
+
+
+@pytest.mark.parametrize('cursor', ['', '!!!', 'bm90IGpzb24', encode_cursor([1, 2])])
+def test_garbage_is_rejected(cursor):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        decode_cursor(cursor)
+
+
+def test_forged_page_size_is_clamped_end_to_end(make_client):
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.read().decode())
+        return httpx.Response(200, json={'success': True, 'data': [], 'rowCount': 0})
+
+    client = make_client(handler)
+    for page_size in (50000, 0):
+        result = asyncio.run(client.query_page(cursor=encode_cursor(state(page_size=page_size)), auth_token=VALID_KEY))
+        assert result.error is None
+    assert f'LIMIT {MAX_PAGE_SIZE + 1}' in queries[0]
+    assert 'LIMIT 2' in queries[1]
+
+
+def test_malformed_cursor_gives_clean_error(make_client):
+    client = make_client(lambda request: httpx.Response(500))
+    result = asyncio.run(client.query_page(cursor=encode_cursor(state(page_size='x')), auth_token=VALID_KEY))
+    assert result.error == 'Invalid cursor'
+    result = asyncio.run(client.query_page(cursor=encode_cursor(state(after=['2024-01-02', 'x'])), auth_token=VALID_KEY))
+    assert result.error == 'Invalid cursor'
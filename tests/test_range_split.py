@@ -0,0 +1,178 @@
+"""
+Date range splitting and merging of partial results
+"""
+
+import asyncio
+import json
+import re
+from datetime import date, timedelta
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+from utils.range_split import (
+    merge_rows,
+    parse_order_by,
+    select_is_splittable,
+    select_outputs,
+    split_window,
+)
+
+D = date.fromisoformat
+
+
+def test_split_window_is_calendar_aligned():
+    assert split_window(D('2024-01-30'), D('2024-03-02'), 'month') == [
+        (D('2024-01-30'), D('2024-01-31')),
+        (D('2024-02-01'), D('2024-02-29')),
+        (D('2024-03-01'), D('2024-03-02')),
+    ]
+    # 2024-01-03 is a Wednesday
+    assert split_window(D('2024-01-03'), D('2024-01-10'), 'week') == [
+        (D('2024-01-03'), D('2024-01-07')),
+        (D('2024-01-08'), D('2024-01-10')),
+    ]
+    with pytest.raises(ValueError):
+        split_window(D('2024-01-01'), D('2024-01-02'), 'year')
+
+
+def test_merge_order_and_limit():
+    parts = [
+        [{'id': 1, 'tone': 5.0}, {'id': 2, 'tone': 1.0}],
+        [{'id': 3, 'tone': 3.0}, {'id': 4, 'tone': 0.5}],
+    ]
+    assert [row['id'] for row in merge_rows(parts, [('tone', True)], 3)] == [1, 3, 2]
+    assert [row['id'] for row in merge_rows(parts, [('tone', False)], 10)] == [4, 2, 3, 1]
+
+
+def test_merge_multiple_keys():
+    parts = [
+        [{'day': '2024-01-01', 'id': 1}, {'day': '2024-01-01', 'id': 2}],
+        [{'day': '2024-01-02', 'id': 3}, {'day': '2024-01-02', 'id': 4}],
+    ]
+    merged = merge_rows(parts, [('day', True), ('id', False)], 10)
+    assert [row['id'] for row in merged] == [3, 4, 1, 2]
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_merge_sorts_nulls_last(descending):
+    parts = [[{'id': 1, 'tone': None}, {'id': 2, 'tone': 2.0}], [{'id': 3}, {'id': 4, 'tone': 1.0}]]
+    merged = merge_rows(parts, [('tone', descending)], 10)
+    assert [row['id'] for row in merged][2:] == [1, 3]
+    assert [row['id'] for row in merged][:2] == ([2, 4] if descending else [4, 2])
+
+
+def test_select_outputs():
+    assert select_outputs('day, avg_tone AS tone, e.actor1_name, count() AS n') == {'day', 'tone', 'actor1_name', 'n'}
+    assert select_outputs('*') is None
+    assert select_outputs('day, e.*') is None
+
+
+@pytest.mark.parametrize('select, splittable', [
+    ('day, global_event_id, avg_tone', True),
+    ('toStartOfMonth(day) AS month, actor1_name', True),
+    ('count() AS n', False),
+    ('day, sum(num_mentions) AS mentions', False),
+    ('DISTINCT actor1_name', False),
+    ('uniqExact(actor1_name)', False),
+])
+def test_select_is_splittable(select, splittable):
+    assert select_is_splittable(select) is splittable
+
+
+@pytest.mark.parametrize('order_by, expected', [
+    ('day DESC, global_event_id', [('day', True), ('global_event_id', False)]),
+    ('avg_tone asc', [('avg_tone', False)]),
+    ('abs(avg_tone) DESC', None),
+    ('avg_tone DESC NULLS FIRST', None),
+    ('day + 1', None),
+    ('', None),
+])
+def test_parse_order_by(order_by, expected):
+    assert parse_order_by(order_by) == expected
+
+
+# Mock backend holding one event per day for Q1 2024
+EVENTS = [
+    {'day': (D('2024-01-01') + timedelta(days=n)).isoformat(), 'global_event_id': n, 'avg_tone': float((n * 7) % 13)}
+    for n in range(91)
+]
+ORDER = re.compile(r'ORDER BY (\w+) (ASC|DESC) LIMIT (\d+)')
+
+
+class Backend:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.read())['query']
+        self.queries.append(query)
+        rows = EVENTS
+        match = re.search(r"day BETWEEN '([\d-]+)' AND '([\d-]+)'", query)
+        if match:
+            rows = [row for row in rows if match.group(1) <= row['day'] <= match.group(2)]
+        order = ORDER.search(query)
+        if order:
+            column, direction, limit = order.groups()
+            rows = sorted(rows, key=lambda row: row.get(column, 0), reverse=direction == 'DESC')[:int(limit)]
+        return httpx.Response(200, json={'success': True, 'data': rows, 'rowCount': len(rows)})
+
+
+def split(make_client, backend, **kwargs):
+    arguments = {
+        'table': 'gdelt_events',
+        'where_clause': "day >= '2024-01-01' AND day <= '2024-03-31' AND global_event_id >= 0",
+        'select_fields': 'day, global_event_id, avg_tone',
+        'limit': 5,
+        'order_by': 'avg_tone DESC',
+        'split_by': 'month',
+        **kwargs,
+    }
+    client = make_client(backend)
+    return asyncio.run(client.query_split(auth_token=VALID_KEY, **arguments))
+
+
+def test_query_split_merges_ranges(make_client):
+    backend = Backend()
+    result = split(make_client, backend)
+
+    assert result.error is None
+    expected = sorted(EVENTS, key=lambda row: row['avg_tone'], reverse=True)[:5]
+    assert [row['avg_tone'] for row in result.data] == [row['avg_tone'] for row in expected]
+    assert len(result.data) == 5
+    assert len(backend.queries) == 3
+    for query, month in zip(sorted(backend.queries), ('01', '02', '03'), strict=True):
+        assert f"day BETWEEN '2024-{month}-01'" in query
+        # Whole-day bounds of the original window are replaced, other filters kept
+        assert "day >= '2024-01-01'" not in query and 'global_event_id >= 0' in query
+
+
+@pytest.mark.parametrize('overrides', [
+    {'select_fields': 'count() AS n', 'order_by': 'n DESC'},
+    {'select_fields': 'DISTINCT actor1_name', 'order_by': 'actor1_name'},
+    {'select_fields': 'day, global_event_id', 'order_by': 'avg_tone DESC'},
+    {'order_by': 'abs(avg_tone) DESC'},
+    {'where_clause': "day >= '2024-01-01'"},
+    {'where_clause': "day = '2024-01-01' OR day = '2024-03-01'"},
+    {'where_clause': "day BETWEEN '2024-01-05' AND '2024-01-20'"},
+])
+def test_query_split_falls_back_to_one_query(make_client, overrides):
+    backend = Backend()
+    result = split(make_client, backend, **overrides)
+    assert result.error is None
+    assert len(backend.queries) == 1
+    where = overrides.get('where_clause', "day >= '2024-01-01'")
+    assert where in backend.queries[0]
+
+
+def test_query_split_rejects_too_many_ranges(make_client, monkeypatch):
+    monkeypatch.setenv('GDELT_SPLIT_MAX_RANGES', '10')
+    backend = Backend()
+    result = split(make_client, backend, split_by='day')
+    assert 'sub-ranges' in result.error
+    assert backend.queries == []
+
+
+def test_query_split_rejects_unknown_unit(make_client):
+    assert 'Invalid split_by' in split(make_client, Backend(), split_by='year').error
@@ -0,0 +1,60 @@
+"""
+Per-caller, per-tool token buckets
+"""
+
+import asyncio
+
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import DEFAULT_LIMITS, InMemoryRateLimitBackend, parse_limits
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock)
+    return clock
+
+
+def take(backend, key, rate, burst):
+    return asyncio.run(backend.take(key, rate, burst))
+
+
+def test_burst_then_refill(clock):
+    backend = InMemoryRateLimitBackend()
+    assert [take(backend, 'a', 1.0, 2)[0] for _ in range(3)] == [True, True, False]
+    assert take(backend, 'a', 1.0, 2) == (False, 1.0)
+    clock.now += 1
+    assert take(backend, 'a', 1.0, 2)[0]
+
+
+def test_prune_uses_each_buckets_own_refill_time(clock):
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    # Slow tool: empty after one call, 100s to refill
+    assert take(backend, 'slow', 0.01, 1)[0]
+    # Fast tool: full again after 1s
+    assert take(backend, 'fast', 1.0, 1)[0]
+
+    clock.now += 10
+    # Pruning for a new fast-tool caller must not reset the slow bucket
+    assert take(backend, 'other', 1.0, 1)[0]
+    assert 'fast' not in backend._buckets
+    assert take(backend, 'slow', 0.01, 1)[0] is False
+
+
+def test_parse_limits():
+    limits = parse_limits('query_gdelt_gkg=6/2, *=240')
+    assert limits['query_gdelt_gkg'] == (6, 2)
+    assert limits['*'] == (240, 240)
+    assert limits['query_gdelt_events'] == DEFAULT_LIMITS['query_gdelt_events']
+    with pytest.raises(ValueError):
+        parse_limits('query_gdelt_gkg')
@@ -0,0 +1,98 @@
+"""
+Circuit breaker, retries and hedging around backend calls
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+QUERY = "SELECT global_event_id FROM gdelt_events WHERE day = '2024-01-01' LIMIT 1"
+
+
+def run_queries(client, count):
+    async def run():
+        return [await client.execute_query(QUERY, auth_token=VALID_KEY, use_cache=False) for _ in range(count)]
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def breaker_env(monkeypatch):
+    monkeypatch.setenv('GDELT_BREAKER_MIN_CALLS', '3')
+    monkeypatch.setenv('GDELT_RETRY_MAX_ATTEMPTS', '1')
+
+
+def raising(error):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error('backend', request=request)
+    return handler
+
+
+def test_read_timeouts_do_not_trip_the_breaker(make_client, breaker_env):
+    client = make_client(raising(httpx.ReadTimeout))
+    results = run_queries(client, 5)
+    assert all('timeout' in result.error for result in results)
+    assert client.breaker.state == 'closed'
+    assert client.breaker.stats()['window_calls'] == 0
+
+
+@pytest.mark.parametrize('error', [httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError])
+def test_connection_errors_trip_the_breaker(make_client, breaker_env, error):
+    client = make_client(raising(error))
+    run_queries(client, 3)
+    assert client.breaker.state == 'open'
+    assert 'unavailable' in run_queries(client, 1)[0].error
+
+
+def test_server_errors_trip_the_breaker(make_client, breaker_env):
+    client = make_client(lambda request: httpx.Response(502, text='bad gateway'))
+    run_queries(client, 3)
+    assert client.breaker.state == 'open'
+
+
+def test_client_errors_do_not_trip_the_breaker(make_client, breaker_env):
+    client = make_client(lambda request: httpx.Response(400, json={'error': 'Missing date filter'}))
+    run_queries(client, 5)
+    assert client.breaker.state == 'closed'
+
+
+@pytest.fixture
+def hedged(make_client, monkeypatch):
+    monkeypatch.setenv('GDELT_HEDGE_ENABLED', 'true')
+    monkeypatch.setenv('GDELT_HEDGE_MAX_RATIO', '1')
+    monkeypatch.setenv('GDELT_HEDGE_MIN_DELAY', '0.01')
+    monkeypatch.setenv('GDELT_RETRY_BASE_DELAY', '0')
+
+    def factory(hedge_response):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(0.2)
+                return httpx.Response(200, json={'success': True, 'data': [{'n': 'primary'}], 'rowCount': 1})
+            return hedge_response()
+
+        client = make_client(handler)
+        client.hedge._latencies.extend([0.01] * client.hedge.min_samples)
+        return client, calls
+
+    return factory
+
+
+def test_hedge_is_not_retried_or_counted_by_the_retry_budget(hedged):
+    client, calls = hedged(lambda: httpx.Response(503, text='unavailable'))
+    result = run_queries(client, 1)[0]
+    assert result.data == [{'n': 'primary'}]
+    assert len(calls) == 2
+    assert client.hedge.hedges == 1
+    budget = client.retry_budget.stats()
+    assert budget['retries'] == 0 and budget['window_requests'] == 1
+
+
+def test_successful_hedge_wins(hedged):
+    client, calls = hedged(lambda: httpx.Response(200, json={'success': True, 'data': [{'n': 'hedge'}], 'rowCount': 1}))
+    assert run_queries(client, 1)[0].data == [{'n': 'hedge'}]
+    assert client.hedge.hedge_wins == 1
+    assert client.retry_budget.stats()['window_requests'] == 1
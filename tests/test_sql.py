@@ -0,0 +1,140 @@
+"""
+SQL normalization and date-predicate analysis
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from utils.cache import CachePolicy
+from utils.sql import extract_date_window, normalize_sql, remove_date_bounds
+
+BASE = "SELECT * FROM gdelt_events WHERE day = '2024-01-01' AND actor1_name = {}"
+
+
+def key(literal):
+    return normalize_sql(BASE.format(literal))
+
+
+def test_cosmetic_differences_share_a_key():
+    assert normalize_sql("select *  from gdelt_events -- note\nwhere day='2024-01-01'") == \
+        normalize_sql("SELECT * FROM gdelt_events WHERE day = '2024-01-01'")
+    assert normalize_sql('SELECT 1.50, 007') == normalize_sql('SELECT 1.5, 7')
+
+
+def test_quote_spellings_share_a_key():
+    assert key("'O''Brien'") == key("'O\\'Brien'")
+
+
+@pytest.mark.parametrize('escape, plain', [
+    ('\\n', 'n'), ('\\t', 't'), ('\\0', '0'), ('\\r', 'r'), ('\\b', 'b'),
+    ('\\f', 'f'), ('\\a', 'a'), ('\\v', 'v'), ('\\x41', 'x41'), ('\\\\', '\\\\\\\\'),
+])
+def test_escapes_keep_their_meaning(escape, plain):
+    assert key(f"'a{escape}b'") != key(f"'a{plain}b'")
+
+
+def test_identifiers_keep_their_case():
+    assert normalize_sql('SELECT Day FROM gdelt_events') != normalize_sql('SELECT day FROM gdelt_events')
+
+
+def window(where, table='gdelt_events', tail=''):
+    found = extract_date_window(f"SELECT * FROM {table} WHERE {where}{tail}")
+    return found.start, found.end
+
+
+D = date.fromisoformat
+
+
+@pytest.mark.parametrize('where, expected', [
+    ("day = '2024-01-05'", ('2024-01-05', '2024-01-05')),
+    ("day >= '2024-01-01' AND day < '2024-02-01'", ('2024-01-01', '2024-01-31')),
+    ("day > '2024-01-01' AND day <= '2024-01-31'", ('2024-01-02', '2024-01-31')),
+    ("day BETWEEN '2024-01-01' AND '2024-01-31' AND event_code = '14'", ('2024-01-01', '2024-01-31')),
+    ("day IN ('2024-01-05', '2024-01-02', toDate('2024-01-09'))", ('2024-01-02', '2024-01-09')),
+    ("'2024-01-10' >= day AND '2024-01-01' < day", ('2024-01-02', '2024-01-10')),
+    ("toDate('2024-01-01') <= day", ('2024-01-01', None)),
+    # Nested parentheses around AND groups are flattened
+    ("((day >= '2024-01-01') AND (event_code = '14' AND (day <= '2024-01-31')))", ('2024-01-01', '2024-01-31')),
+    # The tightest of several bounds wins
+    ("day >= '2024-01-01' AND day >= '2024-01-10' AND day <= '2024-03-01' AND day < '2024-02-01'",
+     ('2024-01-10', '2024-01-31')),
+])
+def test_date_window(where, expected):
+    assert window(where) == tuple(D(value) if value else None for value in expected)
+
+
+@pytest.mark.parametrize('where, expected', [
+    # Non-midnight times still touch their day
+    ("date >= toDateTime('2024-01-01 12:00:00') AND date < toDateTime('2024-01-03 06:00:00')",
+     ('2024-01-01', '2024-01-03')),
+    ("date > '2024-01-01 00:00:00' AND date <= '2024-01-03 00:00:00'", ('2024-01-01', '2024-01-03')),
+    ("date >= '2024-01-01' AND date < '2024-01-03'", ('2024-01-01', '2024-01-02')),
+    ("date BETWEEN toDateTime('2024-01-01 08:00:00', 'UTC') AND toDateTime('2024-01-02 08:00:00', 'UTC')",
+     ('2024-01-01', '2024-01-02')),
+    ("toDate(date) = '2024-01-05'", ('2024-01-05', '2024-01-05')),
+])
+def test_gkg_datetime_window(where, expected):
+    assert window(where, 'gdelt_gkg') == tuple(D(value) for value in expected)
+
+
+@pytest.mark.parametrize('where', [
+    # OR anywhere at the top level: no condition is guaranteed
+    "day = '2024-01-01' OR day = '2024-03-01'",
+    "(day >= '2024-01-01' AND day < '2024-02-01') OR event_code = '14'",
+    # Relative dates are never settled
+    "day >= today() - 7",
+    "day = yesterday()",
+    "day >= toDate(now()) - 30",
+    # Not a plain comparison of the date column
+    "NOT day >= '2024-01-01'",
+    "day >= '2024-01-01' + 1",
+    "day IN (SELECT day FROM gdelt_events WHERE day = '2024-01-01')",
+    "toYYYYMM(day) = 202401",
+    "other_day = '2024-01-01'",
+])
+def test_unbounded(where):
+    assert window(where) == (None, None)
+
+
+def test_or_inside_an_and_keeps_the_other_bounds():
+    assert window("day >= '2024-01-01' AND (event_code = '14' OR day <= '2024-01-05')") == (D('2024-01-01'), None)
+
+
+def test_where_ends_at_group_and_order():
+    assert window("day = '2024-01-05'", tail=" GROUP BY day ORDER BY day LIMIT 10") == (D('2024-01-05'),) * 2
+
+
+def test_only_gdelt_tables():
+    assert extract_date_window("SELECT * FROM other WHERE day = '2024-01-01'") is None
+    assert extract_date_window("SELECT * FROM db.gdelt_gkg WHERE date = '2024-01-01'").table == 'gdelt_gkg'
+
+
+def test_ttl_for_settled_and_live_windows():
+    policy = CachePolicy(live_ttl=300, settled_ttl=None, settled_days=2)
+    today = datetime.now(timezone.utc).date()
+    old = (today - timedelta(days=10)).isoformat()
+    recent = (today - timedelta(days=1)).isoformat()
+    query = "SELECT * FROM gdelt_events WHERE {}"
+    assert policy.ttl_for(query.format(f"day BETWEEN '{old}' AND '{old}'")) is None
+    assert policy.ttl_for(query.format(f"day BETWEEN '{old}' AND '{recent}'")) == 300
+    assert policy.ttl_for(query.format(f"day >= '{old}'")) == 300
+    assert policy.ttl_for(query.format(f"day = '{old}' OR day = '{old}'")) == 300
+    assert policy.ttl_for(query.format("day >= today() - 30 AND day < today() - 10")) == 300
+
+
+@pytest.mark.parametrize('where, expected', [
+    ("day >= '2024-01-01' AND day < '2024-02-01' AND event_code = '14'", "event_code = '14'"),
+    ("day BETWEEN '2024-01-01' AND '2024-01-31'", ''),
+    # Not exact whole-day ranges: kept
+    ("day IN ('2024-01-01', '2024-01-03') AND event_code = '14'", "day IN ('2024-01-01', '2024-01-03') AND event_code = '14'"),
+    ("day >= '2024-01-01' AND (a = 1 OR b = 2) AND c = 3", "(a = 1 OR b = 2) AND c = 3"),
+    ("day >= today() - 7 AND day >= '2024-01-01'", "day >= today() - 7"),
+])
+def test_remove_date_bounds(where, expected):
+    assert remove_date_bounds(where, 'gdelt_events') == expected
+
+
+def test_remove_date_bounds_keeps_partial_day_times():
+    where = "date >= '2024-01-01 12:00:00' AND date < '2024-01-03 00:00:00' AND date <= '2024-01-02 23:00:00'"
+    assert remove_date_bounds(where, 'gdelt_gkg') == "date >= '2024-01-01 12:00:00' AND date <= '2024-01-02 23:00:00'"
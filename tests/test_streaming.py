@@ -0,0 +1,141 @@
+"""
+Incremental response decoding and stream_query
+"""
+
+import asyncio
+import gzip
+import json
+import random
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+from utils import json_codec
+from utils.api_client import QueryError
+from utils.streaming import JSONArrayDecoder, NDJSONDecoder
+
+QUERY = "SELECT day, avg_tone FROM gdelt_events WHERE day = '2024-01-01' LIMIT 3"
+
+ROWS = [
+    2.5, -17, 1e-3, True, False, None, 'a,]"b', 0,
+    {'day': '2024-01-01', 'avg_tone': -3.25, 'v2_themes': 'TAX_FNCACT;WB_2433'},
+    [1.5, [2, {'x': ']'}]],
+]
+BODY = json.dumps({'success': True, 'data': ROWS, 'rowCount': len(ROWS)}, indent=1)
+
+
+def decode_in_chunks(decoder, text, cuts):
+    rows = []
+    for start, end in zip([0, *cuts], [*cuts, len(text)], strict=True):
+        rows += decoder.feed(text[start:end])
+    return rows + decoder.close()
+
+
+@pytest.mark.parametrize('text', ['2.', '-', '1e', 'tr', '2.5e-'])
+def test_partial_scalar_is_held_back(text):
+    decoder = JSONArrayDecoder()
+    assert decoder.feed('{"data": [' + text) == []
+
+
+def test_scalar_split_across_chunks():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed('{"data": [1, 2.') == [1]
+    assert decoder.feed('5') == []
+    assert decoder.feed(' , tr') == [2.5]
+    assert decoder.feed('ue]}') == [True]
+    assert decoder.close() == []
+
+
+def test_every_split_point():
+    for cut in range(len(BODY)):
+        decoder = JSONArrayDecoder()
+        assert decode_in_chunks(decoder, BODY, [cut]) == ROWS, cut
+        assert decoder.envelope == {'success': True, 'data': [], 'rowCount': len(ROWS)}
+
+
+def test_random_chunkings():
+    rng = random.Random(0)
+    for _ in range(200):
+        cuts = sorted(rng.sample(range(1, len(BODY)), rng.randint(1, 40)))
+        assert decode_in_chunks(JSONArrayDecoder(), BODY, cuts) == ROWS
+
+
+def test_truncated_body_is_an_error():
+    decoder = JSONArrayDecoder()
+    decoder.feed(BODY[:len(BODY) // 2])
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_ndjson_split_lines():
+    text = '\n'.join(json.dumps(row) for row in ROWS)
+    cuts = list(range(3, len(text), 7))
+    assert decode_in_chunks(NDJSONDecoder(), text, cuts) == ROWS
+
+
+def stream(client):
+    async def run():
+        return [row async for row in client.stream_query(QUERY, auth_token=VALID_KEY)]
+    return asyncio.run(run())
+
+
+async def chunked(text, size=5):
+    data = text.encode()
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+@pytest.mark.parametrize('content_type, body', [
+    ('application/json', BODY),
+    ('application/x-ndjson', '\n'.join(json.dumps(row) for row in ROWS) + '\n'),
+])
+def test_stream_query(make_client, content_type, body):
+    accepts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        accepts.append(request.headers['accept'])
+        return httpx.Response(200, headers={'content-type': content_type}, content=chunked(body))
+
+    assert stream(make_client(handler)) == ROWS
+    assert 'application/x-ndjson' in accepts[0]
+
+
+def test_stream_query_error_envelope(make_client):
+    body = json.dumps({'success': False, 'error': 'Unknown column', 'data': []})
+    client = make_client(lambda request: httpx.Response(200, content=chunked(body)))
+    with pytest.raises(QueryError, match='Unknown column'):
+        stream(client)
+
+
+def test_stream_query_http_error(make_client):
+    client = make_client(lambda request: httpx.Response(401, json={'error': 'Invalid API key'}))
+    with pytest.raises(QueryError):
+        stream(client)
+
+
+def test_stream_query_truncated_body(make_client):
+    client = make_client(lambda request: httpx.Response(200, content=chunked(BODY[:-40])))
+    with pytest.raises(QueryError, match='invalid response'):
+        stream(client)
+
+
+@pytest.mark.parametrize('encoding, whole', [(None, True), ('identity', True), ('gzip', False)])
+def test_whole_body_decode_only_for_uncompressed_bodies(make_client, monkeypatch, encoding, whole):
+    body = BODY.encode()
+    headers = {'content-type': 'application/json'}
+    if encoding == 'gzip':
+        body = gzip.compress(body)
+    if encoding:
+        headers['content-encoding'] = encoding
+    # The wire size fits the limit; a gzip body decodes to well past it
+    monkeypatch.setenv('GDELT_WHOLE_DECODE_MAX_BYTES', str(len(body)))
+    assert len(gzip.compress(BODY.encode())) < len(BODY)
+    client = make_client(lambda request: httpx.Response(200, headers=headers, content=body))
+    decoded = []
+    loads = json_codec.loads
+    monkeypatch.setattr(json_codec, 'loads', lambda data: decoded.append(data) or loads(data))
+
+    result = asyncio.run(client.execute_query(QUERY, auth_token=VALID_KEY))
+    assert result.error is None and result.data == ROWS
+    assert (BODY.encode() in decoded) is whole
@@ -0,0 +1,180 @@
+"""
+Daily time series: per-day slices are cached and stitched so that a sliding
+window only queries the days it has not seen
+"""
+
+import asyncio
+import json
+import re
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+import pytest
+from conftest import VALID_KEY
+
+from utils.cache import CachePolicy
+from utils.time_series import missing_runs
+
+METRICS = 'count() AS event_count'
+EMPTY = {date(2024, 1, 3), date(2024, 1, 11)}
+POLICY = CachePolicy(live_ttl=300, settled_ttl=86400, settled_days=2)
+
+
+class Backend:
+    """Answers per-day aggregates, without rows for the days in `empty`."""
+
+    def __init__(self, empty=()):
+        self.empty = set(empty)
+        self.ranges = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)['query']
+        match = re.search(r"day BETWEEN '([\d-]+)' AND '([\d-]+)'", query)
+        first, last = date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))
+        self.ranges.append((first, last))
+        rows = []
+        day = first
+        while day <= last:
+            if day not in self.empty:
+                rows.append({'day': day.isoformat(), 'event_count': day.day})
+            day += timedelta(days=1)
+        return httpx.Response(200, json={'success': True, 'data': rows, 'rowCount': len(rows)})
+
+
+def series(client, first, last, **kwargs):
+    return client.query_time_series('gdelt_events', METRICS, first, last, auth_token=VALID_KEY, **kwargs)
+
+
+def days_of(result):
+    return [row['day'] for row in result.data]
+
+
+def test_missing_runs_groups_consecutive_days():
+    days = [date(2024, 1, d) for d in range(1, 8)]
+    cached = {date(2024, 1, 3): {}, date(2024, 1, 4): {}, date(2024, 1, 7): {}}
+    assert missing_runs(days, cached) == [
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (date(2024, 1, 5), date(2024, 1, 6)),
+    ]
+
+
+def test_sliding_window_queries_only_new_days(make_client):
+    backend = Backend(empty=EMPTY)
+    client = make_client(backend, cache_policy=POLICY)
+
+    async def run():
+        first = await series(client, date(2024, 1, 1), date(2024, 1, 10))
+        slid = await series(client, date(2024, 1, 3), date(2024, 1, 12))
+        again = await series(client, date(2024, 1, 3), date(2024, 1, 12))
+        return first, slid, again
+
+    first, slid, again = asyncio.run(run())
+    assert backend.ranges == [
+        (date(2024, 1, 1), date(2024, 1, 10)),
+        (date(2024, 1, 11), date(2024, 1, 12)),
+    ]
+    assert not slid.cached and again.cached
+    # Cached and fetched days are stitched in order; days without rows are left out
+    expected = [f'2024-01-{d:02d}' for d in range(3, 13) if date(2024, 1, d) not in EMPTY]
+    assert days_of(slid) == days_of(again) == expected
+    assert slid.count == len(expected)
+    assert days_of(first)[:2] == ['2024-01-01', '2024-01-02']
+
+
+def test_empty_days_are_cached(make_client):
+    backend = Backend(empty={date(2024, 1, 3)})
+    client = make_client(backend, cache_policy=POLICY)
+
+    async def run():
+        await series(client, date(2024, 1, 1), date(2024, 1, 5))
+        return await series(client, date(2024, 1, 3), date(2024, 1, 3))
+
+    result = asyncio.run(run())
+    assert result.cached and result.data == [] and result.error is None
+    assert backend.ranges == [(date(2024, 1, 1), date(2024, 1, 5))]
+
+
+def test_gaps_between_cached_days_are_fetched_as_runs(make_client):
+    backend = Backend()
+    client = make_client(backend, cache_policy=POLICY)
+
+    async def run():
+        await series(client, date(2024, 1, 3), date(2024, 1, 4))
+        await series(client, date(2024, 1, 7), date(2024, 1, 7))
+        return await series(client, date(2024, 1, 1), date(2024, 1, 8))
+
+    result = asyncio.run(run())
+    assert sorted(backend.ranges[2:]) == [
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (date(2024, 1, 5), date(2024, 1, 6)),
+        (date(2024, 1, 8), date(2024, 1, 8)),
+    ]
+    assert days_of(result) == [f'2024-01-{d:02d}' for d in range(1, 9)]
+
+
+def test_fragmented_runs_fall_back_to_one_span(make_client, monkeypatch):
+    monkeypatch.setenv('GDELT_SPLIT_MAX_RANGES', '2')
+    backend = Backend()
+    client = make_client(backend, cache_policy=POLICY)
+
+    async def run():
+        for day in (2, 4, 6):
+            await series(client, date(2024, 1, day), date(2024, 1, day))
+        return await series(client, date(2024, 1, 1), date(2024, 1, 7))
+
+    result = asyncio.run(run())
+    # Four missing runs exceed the limit: one query spans all of them
+    assert backend.ranges[3:] == [(date(2024, 1, 1), date(2024, 1, 7))]
+    assert days_of(result) == [f'2024-01-{d:02d}' for d in range(1, 8)]
+
+
+def test_settled_and_live_days_get_their_own_ttl(make_client, monkeypatch):
+    client = make_client(Backend(), cache_policy=POLICY)
+    ttls = {}
+    set_slice = client.series_cache.set
+
+    def spy(key, value, ttl=...):
+        ttls[key[-1]] = ttl
+        set_slice(key, value, ttl=ttl)
+
+    monkeypatch.setattr(client.series_cache, 'set', spy)
+    today = datetime.now(timezone.utc).date()
+    asyncio.run(series(client, today - timedelta(days=4), today))
+
+    horizon = POLICY.horizon()
+    assert len(ttls) == 5
+    for day, ttl in ttls.items():
+        assert ttl == (POLICY.settled_ttl if day < horizon else POLICY.live_ttl)
+    assert set(ttls.values()) == {POLICY.settled_ttl, POLICY.live_ttl}
+
+
+def test_backend_error_is_returned_and_not_cached(make_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(400, json={'success': False, 'error': 'bad metric'})
+
+    client = make_client(handler, cache_policy=POLICY)
+
+    async def run():
+        first = await series(client, date(2024, 1, 1), date(2024, 1, 3))
+        second = await series(client, date(2024, 1, 1), date(2024, 1, 3))
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.error and second.error
+    assert len(client.series_cache) == 0 and len(calls) == 2
+
+
+@pytest.mark.parametrize('start, end, message', [
+    (date(2024, 1, 2), date(2024, 1, 1), 'must not be before'),
+    (date(2024, 1, 1), date(2024, 1, 20), 'max 10'),
+])
+def test_invalid_windows_are_rejected(make_client, monkeypatch, start, end, message):
+    monkeypatch.setenv('GDELT_SERIES_MAX_DAYS', '10')
+    backend = Backend()
+    client = make_client(backend, cache_policy=POLICY)
+    result = asyncio.run(series(client, start, end))
+    assert message in result.error
+    assert backend.ranges == []
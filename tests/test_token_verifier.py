@@ -0,0 +1,100 @@
+"""
+JWT verification and its caches
+"""
+
+import asyncio
+
+import pytest
+from conftest import ISSUER, JWKS_URI, JWKSServer, jwk
+from fastmcp.server.auth.providers.jwt import JWTVerifier, RSAKeyPair
+
+from utils.dual_token_verifier import DualTokenVerifier
+from utils.jwks import JWKSManager, JWKSVerifier
+
+
+@pytest.fixture(scope='module')
+def key_pair():
+    return RSAKeyPair.generate()
+
+
+def make_token(key_pair, kid='key-1', **kwargs):
+    kwargs.setdefault('issuer', ISSUER)
+    kwargs.setdefault('audience', 'authenticated')
+    return key_pair.create_token(kid=kid, **kwargs)
+
+
+def make_verifier(server, min_refetch_interval=0, **kwargs):
+    manager = JWKSManager(JWKS_URI, min_refetch_interval=min_refetch_interval, client=server.client())
+    jwt_verifier = JWKSVerifier(manager, issuer=ISSUER, audience='authenticated')
+    return DualTokenVerifier(jwt_verifier, cache_size=100, negative_ttl=300, **kwargs)
+
+
+def verify(verifier, token):
+    return asyncio.run(verifier.verify_token(token))
+
+
+def test_valid_token_is_cached(key_pair):
+    server = JWKSServer(jwk(key_pair, 'key-1'))
+    verifier = make_verifier(server)
+    token = make_token(key_pair)
+    assert verify(verifier, token).claims['sub'] == 'fastmcp-user'
+    assert verify(verifier, token) is not None
+    assert verifier.cache_stats()['verified']['hits'] == 1
+
+
+def test_jwks_outage_is_not_cached_as_rejection(key_pair):
+    server = JWKSServer(jwk(key_pair, 'key-1'))
+    server.down = True
+    verifier = make_verifier(server)
+    token = make_token(key_pair)
+
+    assert verify(verifier, token) is None
+    assert verifier.cache_stats()['rejected']['size'] == 0
+
+    # Keys reachable again: the same token verifies at once
+    server.down = False
+    assert verify(verifier, token) is not None
+
+
+@pytest.mark.parametrize('case', ['bad_signature', 'expired', 'wrong_audience', 'wrong_issuer', 'unknown_kid'])
+def test_definitive_rejections_are_cached(key_pair, case):
+    server = JWKSServer(jwk(key_pair, 'key-1'))
+    verifier = make_verifier(server)
+    token = {
+        'bad_signature': lambda: make_token(RSAKeyPair.generate()),
+        'expired': lambda: make_token(key_pair, expires_in_seconds=-60),
+        'wrong_audience': lambda: make_token(key_pair, audience='anon'),
+        'wrong_issuer': lambda: make_token(key_pair, issuer='https://elsewhere.test'),
+        'unknown_kid': lambda: make_token(key_pair, kid='key-9'),
+    }[case]()
+
+    assert verify(verifier, token) is None
+    requests = server.requests
+    assert verify(verifier, token) is None
+    assert verifier.cache_stats()['rejected']['size'] == 1
+    assert server.requests == requests
+
+
+def test_throttled_unknown_kid_is_not_cached_as_rejection(key_pair, clock):
+    server = JWKSServer(jwk(key_pair, 'key-1'))
+    verifier = make_verifier(server, min_refetch_interval=30)
+    assert verify(verifier, make_token(key_pair)) is not None
+
+    # A token signed with a newly rotated key arrives within the refetch window
+    rotated = RSAKeyPair.generate()
+    server.keys.append(jwk(rotated, 'key-2'))
+    token = make_token(rotated, kid='key-2')
+    assert verify(verifier, token) is None
+    assert verifier.cache_stats()['rejected']['size'] == 0
+    assert server.requests == 1
+
+    clock.now += 31
+    assert verify(verifier, token) is not None
+    assert server.requests == 2
+
+
+def test_no_negative_cache_when_failures_are_indistinguishable():
+    # JWTVerifier answers None for JWKS fetch errors too
+    jwt_verifier = JWTVerifier(jwks_uri=JWKS_URI, issuer=ISSUER, audience='authenticated')
+    verifier = DualTokenVerifier(jwt_verifier, cache_size=100, negative_ttl=300)
+    assert verifier.cache_stats()['rejected'] is None
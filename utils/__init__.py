@@ -2,22 +2,55 @@
 Utility modules for GDELT Cloud MCP Server
 """
 
-from .api_client import GDELTCloudAPIClient, QueryResult
+from .api_client import GDELTCloudAPIClient, QueryResult, QueryError
 from .auth import (
     get_auth_token,
     validate_api_key,
     is_api_key,
+    hash_token,
+    get_caller_identity,
+    get_request_token,
     AuthContext,
 )
+from .cache import TTLCache, CachePolicy
+from .disk_cache import DiskCache
+from .single_flight import SingleFlight
+from .sql import normalize_sql, extract_date_window, DateWindow
+from .columnar import ColumnarRows, as_rows, encode_rows, RESULT_FORMATS
+from .pagination import encode_cursor, decode_cursor, PrefetchStore
 
 __all__ = [
     # API Client
     'GDELTCloudAPIClient',
     'QueryResult',
+    'QueryError',
+    'ColumnarRows',
+    'as_rows',
+    'encode_rows',
+    'RESULT_FORMATS',
     
     # Authentication
     'get_auth_token',
     'validate_api_key',
     'is_api_key',
+    'hash_token',
+    'get_caller_identity',
+    'get_request_token',
     'AuthContext',
+    
+    # Caching
+    'TTLCache',
+    'CachePolicy',
+    'DiskCache',
+    'SingleFlight',
+    
+    # SQL analysis
+    'normalize_sql',
+    'extract_date_window',
+    'DateWindow',
+    
+    # Pagination
+    'encode_cursor',
+    'decode_cursor',
+    'PrefetchStore',
 ]
@@ -0,0 +1,273 @@
+"""
+Admission control for GDELT Cloud MCP Server
+Bounds concurrent backend queries globally and per caller, with a bounded
+wait queue served by priority
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Hashable, Optional, Tuple
+
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+
+DEFAULT_WEIGHTS = {INTERACTIVE: 4.0, BATCH: 1.0}
+
+
+def parse_weights(spec: Optional[str]) -> Dict[str, float]:
+    """
+    Parse priority weights, e.g. 'interactive=4,batch=1'.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    weights = dict(DEFAULT_WEIGHTS)
+    if not spec:
+        return weights
+    for entry in spec.split(','):
+        if not entry.strip():
+            continue
+        try:
+            name, value = entry.split('=', 1)
+            weights[name.strip()] = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid priority weight '{entry}'. Use name=weight") from None
+    return weights
+
+
+class AdmissionError(Exception):
+    """Raised when a query cannot be admitted (queue full or wait too long)"""
+
+
+class _KeySlot:
+    """Per-caller semaphore with a count of users, so idle ones can be dropped."""
+
+    __slots__ = ('semaphore', 'users')
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class PriorityGate:
+    """
+    Counting semaphore whose waiters are served by priority.
+
+    Each waiter belongs to a priority class with a weight. When a slot
+    frees up, the class whose oldest waiter has the highest
+    ``weight * (1 + waited / aging)`` goes next: a heavier class jumps
+    ahead of queued lighter ones, while a lighter waiter's score grows the
+    longer it waits, so it cannot starve. With weights 4 and 1 and
+    aging=2s, a batch call that has waited 6s ranks with a fresh
+    interactive call.
+    """
+
+    def __init__(self, limit: int, weights: Optional[Dict[str, float]] = None, aging: float = 2.0):
+        """
+        Initialize gate.
+
+        Args:
+            limit: Concurrent holders allowed
+            weights: Priority class -> weight (default DEFAULT_WEIGHTS)
+            aging: Seconds of waiting that add one weight's worth of priority
+        """
+        self.weights = weights or dict(DEFAULT_WEIGHTS)
+        self.aging = aging
+        self._free = limit
+        self._waiters: Dict[str, Deque[Tuple[float, asyncio.Future]]] = {}
+
+    def locked(self) -> bool:
+        """Whether an acquire would wait."""
+        return self._free <= 0 or any(self._waiters.values())
+
+    async def acquire(self, priority: str = INTERACTIVE) -> None:
+        """Take a slot, waiting behind higher-ranked waiters."""
+        if not self.locked():
+            self._free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (time.monotonic(), future)
+        self._waiters.setdefault(priority, deque()).append(entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the wait was cancelled
+                self.release()
+            else:
+                queue = self._waiters.get(priority)
+                if queue and entry in queue:
+                    queue.remove(entry)
+            raise
+
+    def release(self) -> None:
+        """Return a slot and hand it to the best-ranked waiter."""
+        self._free += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        while self._free > 0:
+            best: Optional[Deque[Tuple[float, asyncio.Future]]] = None
+            best_score = 0.0
+            for priority, queue in self._waiters.items():
+                while queue and queue[0][1].done():
+                    queue.popleft()
+                if not queue:
+                    continue
+                waited = now - queue[0][0]
+                score = self.weights.get(priority, 1.0) * (1 + waited / self.aging)
+                if best is None or score > best_score:
+                    best, best_score = queue, score
+            if best is None:
+                return
+            _, future = best.popleft()
+            self._free -= 1
+            future.set_result(None)
+
+
+class AdmissionController:
+    """
+    Concurrency limiter for backend calls.
+
+    Each call needs a slot for its caller (at most `per_key_limit` at once,
+    so one API key cannot take the whole process) and a global slot (at
+    most `global_limit` in total). Global slots go to waiting calls by
+    priority (see PriorityGate), so interactive callers are served ahead
+    of queued batch work. Calls that cannot start immediately wait in a
+    queue of at most `max_queue`; when the queue is full, or a call waited
+    `max_wait` seconds, it is rejected with AdmissionError.
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 32,
+        per_key_limit: int = 4,
+        max_queue: int = 100,
+        max_wait: float = 30.0,
+        weights: Optional[Dict[str, float]] = None,
+        aging: float = 2.0
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            global_limit: Max concurrent calls across all callers
+            per_key_limit: Max concurrent calls per caller
+            max_queue: Max calls waiting for a slot
+            max_wait: Max seconds a call may wait before being rejected
+            weights: Priority class -> weight for global slots
+            aging: Seconds of waiting that add one weight's worth of priority
+        """
+        self.global_limit = global_limit
+        self.per_key_limit = per_key_limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._global = PriorityGate(global_limit, weights, aging)
+        self._keys: Dict[Hashable, _KeySlot] = {}
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+        self._class_waits: Dict[str, Tuple[int, float]] = {}
+
+    def _would_wait(self, slot: _KeySlot) -> bool:
+        return slot.semaphore.locked() or self._global.locked()
+
+    @asynccontextmanager
+    async def slot(self, key: Hashable, priority: str = INTERACTIVE) -> AsyncIterator[None]:
+        """
+        Hold a slot for `key` for the duration of the block.
+
+        Args:
+            key: Caller identity
+            priority: Priority class ('interactive' or 'batch')
+
+        Raises:
+            AdmissionError: If the queue is full or the wait timed out
+        """
+        slot = self._keys.get(key)
+        if slot is None:
+            slot = self._keys[key] = _KeySlot(self.per_key_limit)
+        slot.users += 1
+        try:
+            wait = await self._acquire(slot, priority)
+            self.admitted += 1
+            self.in_flight += 1
+            if wait is not None:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait_seen = max(self.max_wait_seen, wait)
+                count, total = self._class_waits.get(priority, (0, 0.0))
+                self._class_waits[priority] = (count + 1, total + wait)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self._global.release()
+                slot.semaphore.release()
+        finally:
+            slot.users -= 1
+            if slot.users == 0 and self._keys.get(key) is slot:
+                del self._keys[key]
+
+    async def _acquire(self, slot: _KeySlot, priority: str) -> Optional[float]:
+        """Take the caller and global slots, queueing if needed; returns the wait time."""
+        if not self._would_wait(slot):
+            await slot.semaphore.acquire()
+            await self._global.acquire(priority)
+            return None
+
+        if self.waiting >= self.max_queue:
+            self.rejected_full += 1
+            raise AdmissionError('Server is busy: too many queries waiting. Please retry shortly.')
+
+        self.waiting += 1
+        self.queued += 1
+        started = time.monotonic()
+        key_acquired = False
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await slot.semaphore.acquire()
+                key_acquired = True
+                await self._global.acquire(priority)
+        except TimeoutError:
+            if key_acquired:
+                slot.semaphore.release()
+            self.rejected_timeout += 1
+            raise AdmissionError(
+                f'Server is busy: query waited more than {self.max_wait:g}s for a slot. Please retry shortly.'
+            ) from None
+        except BaseException:
+            if key_acquired:
+                slot.semaphore.release()
+            raise
+        finally:
+            self.waiting -= 1
+        return time.monotonic() - started
+
+    def stats(self) -> Dict[str, object]:
+        """Get concurrency, queue and wait-time counters."""
+        return {
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'callers': len(self._keys),
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'rejected_full': self.rejected_full,
+            'rejected_timeout': self.rejected_timeout,
+            'avg_queue_time': round(self.total_wait / self.waited, 4) if self.waited else 0.0,
+            'max_queue_time': round(self.max_wait_seen, 4),
+            'avg_queue_time_by_priority': {
+                priority: round(total / count, 4)
+                for priority, (count, total) in self._class_waits.items()
+            },
+        }
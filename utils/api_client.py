@@ -4,38 +4,331 @@ Handles HTTP requests to GDELT Cloud ClickHouse query endpoints
 """
 
 import os
+import asyncio
+import codecs
+import hashlib
+import sqlite3
 import httpx
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Union
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+
+from .auth import hash_token, is_api_key, is_verified_token
+from .cache import TTLCache, CachePolicy
+from .disk_cache import DiskCache
+from .single_flight import SingleFlight
+from .columnar import ColumnarRows, ColumnarBuilder
+from . import json_codec
+from .compression import TransferStats, accept_encoding, compress_body
+from .streaming import NDJSONDecoder, JSONArrayDecoder, is_ndjson
+from .sql import normalize_sql, extract_date_window, remove_date_bounds, tokenize_sql
+from .admission import AdmissionController, AdmissionError, BATCH, INTERACTIVE, parse_weights
+from .circuit_breaker import CircuitBreaker
+from .hedging import HedgePolicy
+from .retry import RetryPolicy, RetryBudget, RETRYABLE_ERRORS, parse_retry_after
+from .time_series import (
+    build_time_series_query,
+    series_signature,
+    missing_runs,
+    row_day,
+)
+from .pagination import (
+    PAGE_KEYS,
+    MAX_PAGE_SIZE,
+    PrefetchStore,
+    build_page_query,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+from .range_split import (
+    SPLIT_UNITS,
+    split_window,
+    range_predicate,
+    select_is_splittable,
+    select_outputs,
+    parse_order_by,
+    merge_rows,
+)
+from .log import get_logger
+
+
+logger = get_logger(__name__)
+
+# Cache partition of results reused across verified callers
+SHARED_SCOPE = 'shared'
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment."""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment."""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _http2_available() -> bool:
+    """Check whether the optional HTTP/2 dependency (h2) is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _timeout_from_env() -> httpx.Timeout:
+    """Build the request timeout from the GDELT_HTTP_*_TIMEOUT settings."""
+    return httpx.Timeout(
+        connect=_env_float('GDELT_HTTP_CONNECT_TIMEOUT', 5.0),
+        read=_env_float('GDELT_HTTP_READ_TIMEOUT', 30.0),
+        write=_env_float('GDELT_HTTP_WRITE_TIMEOUT', 10.0),
+        pool=_env_float('GDELT_HTTP_POOL_TIMEOUT', 10.0)
+    )
+
+
+def _response_decoder(response: httpx.Response) -> Union[NDJSONDecoder, JSONArrayDecoder]:
+    """Pick the incremental decoder matching a response's Content-Type."""
+    if is_ndjson(response.headers.get('content-type', '')):
+        return NDJSONDecoder()
+    return JSONArrayDecoder('data')
+
+
+async def _decode_rows(
+    response: httpx.Response,
+    decoder: Union[NDJSONDecoder, JSONArrayDecoder],
+    transfer: Optional[TransferStats] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield result rows as the response body arrives."""
+    text = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    decoded = 0
+    async for chunk in response.aiter_bytes():
+        decoded += len(chunk)
+        for row in decoder.feed(text.decode(chunk)):
+            yield row
+    if transfer is not None:
+        transfer.record_response(response, decoded)
+    for row in decoder.feed(text.decode(b'', final=True)) + decoder.close():
+        yield row
+
+
+class QueryError(Exception):
+    """Query failure raised while streaming results (see stream_query)"""
 
 
 @dataclass
 class QueryResult:
     """Result from a ClickHouse query"""
-    data: List[Dict[str, Any]]
+    data: Union[List[Dict[str, Any]], ColumnarRows]
     count: int
     execution_time: Optional[float] = None
     error: Optional[str] = None
+    cached: bool = False
+    next_cursor: Optional[str] = None
+
+
+def _with_layout(result: QueryResult, columnar: bool) -> QueryResult:
+    """Return a result whose rows are in the requested layout."""
+    if columnar and not isinstance(result.data, ColumnarRows):
+        return replace(result, data=ColumnarRows.from_rows(result.data))
+    if not columnar and isinstance(result.data, ColumnarRows):
+        return replace(result, data=result.data.to_rows())
+    return result
 
 
 class GDELTCloudAPIClient:
-    """Client for interacting with GDELT Cloud API"""
+    """
+    Client for interacting with GDELT Cloud API.
     
-    def __init__(self, base_url: Optional[str] = None, auth_token: Optional[str] = None):
+    A single instance is meant to be shared by the whole process: the
+    underlying connection pool is reused across tool calls and the auth
+    token is passed per request, so one client can serve every user.
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        cache: Optional[TTLCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        disk_cache: Optional[DiskCache] = None
+    ):
         """
         Initialize API client.
         
         Args:
             base_url: Base URL for GDELT Cloud API (default from env)
-            auth_token: Authentication token (OAuth or API key)
+            auth_token: Default authentication token (OAuth or API key), used
+                when a request does not supply its own
+            max_connections: Maximum pooled connections (default from
+                GDELT_HTTP_MAX_CONNECTIONS, 100)
+            max_keepalive_connections: Maximum idle keep-alive connections
+                (default from GDELT_HTTP_MAX_KEEPALIVE, 20)
+            keepalive_expiry: Seconds an idle connection is kept open
+                (default from GDELT_HTTP_KEEPALIVE_EXPIRY, 30)
+            http2: Multiplex requests over HTTP/2 connections (default from
+                GDELT_HTTP2, off). Requires the optional ``h2`` package;
+                falls back to HTTP/1.1 when it is not installed.
+            timeout: Connect/read/write/pool timeouts (default from the
+                GDELT_HTTP_*_TIMEOUT settings)
+            cache: Result cache (default built from the GDELT_CACHE_*
+                settings; disabled with GDELT_CACHE_ENABLED=false)
+            cache_policy: Date-aware TTL policy for cached results (default
+                from GDELT_CACHE_SETTLED_DAYS / GDELT_CACHE_SETTLED_TTL)
+            disk_cache: Persistent second cache tier shared across processes
+                (default: enabled when GDELT_DISK_CACHE_DIR is set)
         """
         self.base_url = base_url or os.getenv('GDELT_CLOUD_API_URL', 'https://gdeltcloud.com')
         self.auth_token = auth_token
-        self.client = httpx.AsyncClient(timeout=30.0)
+        
+        if max_connections is None:
+            max_connections = _env_int('GDELT_HTTP_MAX_CONNECTIONS', 100)
+        if max_keepalive_connections is None:
+            max_keepalive_connections = _env_int('GDELT_HTTP_MAX_KEEPALIVE', 20)
+        if keepalive_expiry is None:
+            keepalive_expiry = _env_float('GDELT_HTTP_KEEPALIVE_EXPIRY', 30.0)
+        
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        
+        if http2 is None:
+            http2 = _env_bool('GDELT_HTTP2', False)
+        if http2 and not _http2_available():
+            logger.warning("GDELT_HTTP2 enabled but 'h2' is not installed. Falling back to HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self.timeout = timeout or _timeout_from_env()
+        
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2
+        )
+        
+        # Response compression (zstd/br when their decoders are installed,
+        # else gzip) and optional gzip of large request bodies
+        self.accept_encoding = accept_encoding(os.getenv('GDELT_HTTP_COMPRESSION', 'auto'))
+        min_bytes = os.getenv('GDELT_REQUEST_COMPRESSION_MIN_BYTES')
+        self.request_compression_min_bytes = int(min_bytes) if min_bytes else None
+        self.transfer = TransferStats()
+        
+        # Retries of idempotent queries on transient failures
+        self.retry_policy = RetryPolicy(
+            max_attempts=max(1, _env_int('GDELT_RETRY_MAX_ATTEMPTS', 3)),
+            base_delay=_env_float('GDELT_RETRY_BASE_DELAY', 0.2),
+            max_delay=_env_float('GDELT_RETRY_MAX_DELAY', 5.0)
+        )
+        self.retry_budget = RetryBudget(
+            ratio=_env_float('GDELT_RETRY_BUDGET_RATIO', 0.2),
+            min_per_second=_env_float('GDELT_RETRY_BUDGET_MIN_PER_SEC', 1.0)
+        )
+        
+        # Fail fast while the backend is down instead of waiting on timeouts
+        self.breaker = CircuitBreaker(
+            failure_rate=_env_float('GDELT_BREAKER_FAILURE_RATE', 0.5),
+            min_calls=_env_int('GDELT_BREAKER_MIN_CALLS', 10),
+            window=_env_float('GDELT_BREAKER_WINDOW', 30.0),
+            open_seconds=_env_float('GDELT_BREAKER_OPEN_SECONDS', 15.0)
+        ) if _env_bool('GDELT_BREAKER_ENABLED', True) else None
+        
+        # Opt-in: duplicate slow queries after the observed latency percentile
+        self.hedge = HedgePolicy(
+            percentile=_env_float('GDELT_HEDGE_PERCENTILE', 95.0),
+            min_delay=_env_float('GDELT_HEDGE_MIN_DELAY', 0.05),
+            max_ratio=_env_float('GDELT_HEDGE_MAX_RATIO', 0.05),
+            min_samples=_env_int('GDELT_HEDGE_MIN_SAMPLES', 20)
+        ) if _env_bool('GDELT_HEDGE_ENABLED', False) else None
+        
+        # Bound concurrent backend queries, globally and per caller;
+        # interactive (OAuth) callers are served ahead of batch (API key) ones
+        self.admission = AdmissionController(
+            global_limit=_env_int('GDELT_MAX_CONCURRENT_QUERIES', 32),
+            per_key_limit=_env_int('GDELT_MAX_CONCURRENT_PER_TOKEN', 4),
+            max_queue=_env_int('GDELT_QUERY_QUEUE_SIZE', 100),
+            max_wait=_env_float('GDELT_QUERY_QUEUE_TIMEOUT', 30.0),
+            weights=parse_weights(os.getenv('GDELT_PRIORITY_WEIGHTS')),
+            aging=_env_float('GDELT_PRIORITY_AGING', 2.0)
+        ) if _env_bool('GDELT_ADMISSION_ENABLED', True) else None
+        
+        if cache is None and _env_bool('GDELT_CACHE_ENABLED', True):
+            cache = TTLCache(
+                max_size=_env_int('GDELT_CACHE_MAX_ENTRIES', 256),
+                ttl=_env_float('GDELT_CACHE_TTL', 300.0),
+                max_weight=_env_int('GDELT_CACHE_MAX_ROWS', 100_000),
+                weigher=lambda result: max(1, len(result.data))
+            )
+        self.cache = cache
+        
+        if cache_policy is None:
+            settled_ttl = os.getenv('GDELT_CACHE_SETTLED_TTL')
+            cache_policy = CachePolicy(
+                live_ttl=cache.ttl if cache is not None else _env_float('GDELT_CACHE_TTL', 300.0),
+                settled_ttl=float(settled_ttl) if settled_ttl else None,
+                settled_days=_env_int('GDELT_CACHE_SETTLED_DAYS', 2)
+            )
+        self.cache_policy = cache_policy
+        
+        disk_cache_dir = os.getenv('GDELT_DISK_CACHE_DIR')
+        if disk_cache is None and disk_cache_dir:
+            disk_cache = DiskCache(
+                disk_cache_dir,
+                max_bytes=_env_int('GDELT_DISK_CACHE_MAX_MB', 512) * 1024 * 1024
+            )
+        self.disk_cache = disk_cache
+        
+        # Concurrent identical queries from the same caller share one request
+        self.single_flight = SingleFlight() if _env_bool('GDELT_SINGLE_FLIGHT', True) else None
+        
+        # Range-split execution (query_split)
+        self.split_max_parallel = _env_int('GDELT_SPLIT_MAX_PARALLEL', 4)
+        self.split_max_ranges = _env_int('GDELT_SPLIT_MAX_RANGES', 64)
+        
+        # Per-day slices of daily time series (query_time_series)
+        self.series_cache = TTLCache(
+            max_size=_env_int('GDELT_SERIES_CACHE_MAX_DAYS', 50_000),
+            ttl=self.cache_policy.live_ttl
+        )
+        self.series_max_days = _env_int('GDELT_SERIES_MAX_DAYS', 3660)
+        
+        # Uncompressed JSON row results up to this size are read whole and
+        # decoded with the fast codec; larger, unsized or compressed bodies,
+        # and columnar results, are decoded incrementally
+        self.whole_decode_max_bytes = _env_int('GDELT_WHOLE_DECODE_MAX_BYTES', 8 * 1024 * 1024)
+        
+        # Background prefetch of the next page for query_page
+        self.prefetch = PrefetchStore() if _env_bool('GDELT_PAGE_PREFETCH', True) else None
+        self._background: set = set()
+        # 'token': results are cached per caller; 'shared': reused across
+        # callers whose token was verified for the request (see _scope)
+        self.cache_scope = os.getenv('GDELT_CACHE_SCOPE', 'token')
     
     async def close(self):
         """Close the HTTP client"""
+        for task in list(self._background):
+            task.cancel()
         await self.client.aclose()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
     
     async def __aenter__(self):
         return self
@@ -43,104 +336,511 @@ class GDELTCloudAPIClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
     
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self, auth_token: Optional[str] = None) -> Dict[str, str]:
         """Get HTTP headers with authentication"""
         headers = {
             'Content-Type': 'application/json',
+            'Accept-Encoding': self.accept_encoding,
         }
         
-        if self.auth_token:
-            # Support both Bearer token and direct API key
-            if self.auth_token.startswith('gdelt_sk_'):
-                headers['Authorization'] = f'Bearer {self.auth_token}'
-            else:
-                headers['Authorization'] = f'Bearer {self.auth_token}'
+        token = auth_token or self.auth_token
+        if token:
+            # OAuth tokens and API keys (gdelt_sk_*) are both sent as Bearer tokens
+            headers['Authorization'] = f'Bearer {token}'
         
         return headers
     
+    def _scope(self, auth_token: Optional[str] = None) -> str:
+        """
+        Cache partition for a caller.
+        
+        A cache hit is served without asking the backend, which is where
+        tokens are ultimately checked, so by default each token has its own
+        partition: it only holds results the backend already returned for
+        that token. With GDELT_CACHE_SCOPE=shared, callers whose token was
+        verified for this request (signature-checked JWT or introspected
+        API key) share one partition; all others keep their own.
+        """
+        token = auth_token or self.auth_token
+        if self.cache_scope == 'shared' and is_verified_token(token):
+            return SHARED_SCOPE
+        return hash_token(token) if token else ''
+    
+    def _cache_key(self, query: str, auth_token: Optional[str] = None) -> Tuple[str, str]:
+        """Build the result cache key: (caller scope, normalized SQL)."""
+        return self._scope(auth_token), normalize_sql(query)
+    
+    async def _cache_get(self, cache_key: Tuple[str, str]) -> Optional[QueryResult]:
+        """Look a result up in memory, then on disk (promoting disk hits to memory)."""
+        if self.cache is not None:
+            result = self.cache.get(cache_key)
+            if result is not None:
+                return result
+        
+        if self.disk_cache is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk_cache.get, self._disk_key(cache_key))
+            except sqlite3.Error as e:
+                logger.warning("Disk cache read failed: %s", e)
+                return None
+            if entry is not None:
+                payload, ttl = entry
+                if isinstance(payload['data'], dict):
+                    payload['data'] = ColumnarRows.from_dict(payload['data'])
+                result = QueryResult(**payload)
+                if self.cache is not None:
+                    self.cache.set(cache_key, result, ttl=ttl)
+                return result
+        
+        return None
+    
+    async def _cache_set(self, cache_key: Tuple[str, str], result: QueryResult, ttl: Optional[float]):
+        """Store a result in every configured cache tier."""
+        if self.cache is not None:
+            self.cache.set(cache_key, result, ttl=ttl)
+        
+        if self.disk_cache is not None:
+            data = result.data
+            payload = {
+                'data': data.to_dict() if isinstance(data, ColumnarRows) else data,
+                'count': result.count,
+                'execution_time': result.execution_time
+            }
+            try:
+                await asyncio.to_thread(self.disk_cache.set, self._disk_key(cache_key), payload, ttl)
+            except sqlite3.Error as e:
+                logger.warning("Disk cache write failed: %s", e)
+    
+    @staticmethod
+    def _disk_key(cache_key: Tuple[str, str]) -> str:
+        """Fixed-length disk cache key for a (scope, normalized SQL) pair."""
+        return hashlib.sha256('\n'.join(cache_key).encode('utf-8')).hexdigest()
+    
     async def execute_query(
         self,
         query: str,
-        source: str = 'mcp'
+        source: str = 'mcp',
+        auth_token: Optional[str] = None,
+        use_cache: bool = True,
+        columnar: bool = False
     ) -> QueryResult:
         """
         Execute a ClickHouse SQL query via GDELT Cloud query execution API.
         
+        Successful results are cached under the normalized SQL; a cache hit
+        returns the stored result with ``cached=True``. Results for fully
+        historical date windows are kept longer (see CachePolicy).
+        Identical queries already in flight for the same caller are joined
+        rather than sent again.
+        
         Args:
             query: SQL query string (SELECT only)
             source: Source identifier ('mcp', 'api', or 'app')
+            auth_token: Token for this request (defaults to the client's token)
+            use_cache: Serve from and populate the result cache
+            columnar: Return ``data`` as ColumnarRows (one typed array per
+                column, rows built on demand) instead of a list of dicts
         
         Returns:
             QueryResult with data and metadata
         """
-        try:
-            response = await self.client.post(
-                f'{self.base_url}/api/query/execute',
-                headers=self._get_headers(),
-                json={
-                    'query': query,
-                    'source': source
-                }
-            )
-            
-            if response.status_code == 401:
-                return QueryResult(
-                    data=[],
-                    count=0,
-                    error='Authentication required. Please provide valid OAuth token or API key.'
-                )
-            
-            if response.status_code == 400:
-                error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                return QueryResult(
-                    data=[],
-                    count=0,
-                    error=error_data.get('error', 'Invalid query. Check syntax and ensure date filters are included.')
-                )
-            
-            if response.status_code != 200:
-                error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                return QueryResult(
-                    data=[],
-                    count=0,
-                    error=error_data.get('error', f'HTTP {response.status_code}: {response.text}')
-                )
-            
-            result = response.json()
-            
-            # Handle response format
-            if result.get('success'):
-                return QueryResult(
-                    data=result.get('data', []),
-                    count=result.get('rowCount', len(result.get('data', []))),
-                    execution_time=result.get('executionTime')
-                )
+        cache_key = None
+        if use_cache and (self.cache is not None or self.disk_cache is not None):
+            cache_key = self._cache_key(query, auth_token)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return replace(_with_layout(cached, columnar), cached=True)
+        
+        async def fetch() -> QueryResult:
+            if self.hedge is not None and self._is_idempotent(query):
+                result = await self._send_hedged(query, source, auth_token, columnar)
             else:
-                return QueryResult(
-                    data=[],
-                    count=0,
-                    error=result.get('error', 'Query execution failed')
-                )
+                result = await self._send_query(query, source, auth_token, columnar)
+            if cache_key is not None and result.error is None:
+                await self._cache_set(cache_key, result, self.cache_policy.ttl_for(query))
+            return result
+        
+        if self.single_flight is None:
+            return await fetch()
+        
+        token = auth_token or self.auth_token
+        flight_key = (hash_token(token) if token else '', source, columnar, normalize_sql(query))
+        return await self.single_flight.do(flight_key, fetch)
+    
+    def _post_query(self, query: str, source: str, headers: Dict[str, str]):
+        """Open a streamed POST of a query, compressing large bodies if enabled."""
+        body = json_codec.dumps_bytes({
+            'query': query,
+            'source': source
+        })
+        content, extra_headers = compress_body(body, self.request_compression_min_bytes)
+        self.transfer.record_request(len(body), len(content))
+        return self.client.stream(
+            'POST',
+            f'{self.base_url}/api/query/execute',
+            headers={**headers, **extra_headers},
+            content=content
+        )
+    
+    async def stream_query(
+        self,
+        query: str,
+        source: str = 'mcp',
+        auth_token: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a query and yield result rows as the response arrives.
+        
+        Rows are decoded incrementally from an NDJSON body, or from the
+        ``data`` array of the regular JSON response, so large results
+        (e.g. GKG rows with wide ``v2_themes``) are never held in memory
+        as a whole and processing can start on the first rows. Streamed
+        queries bypass the result cache and request coalescing.
+        
+        Args:
+            query: SQL query string (SELECT only)
+            source: Source identifier ('mcp', 'api', or 'app')
+            auth_token: Token for this request (defaults to the client's token)
+        
+        Yields:
+            Result rows
+        
+        Raises:
+            QueryError: If the query fails, including after some rows were yielded
+        """
+        breaker_error = await self._check_breaker(auth_token)
+        if breaker_error:
+            raise QueryError(breaker_error)
+        
+        headers = self._get_headers(auth_token)
+        headers['Accept'] = 'application/x-ndjson, application/json;q=0.9'
+        try:
+            async with AsyncExitStack() as stack:
+                if self.admission is not None:
+                    await stack.enter_async_context(self.admission.slot(self._caller_key(auth_token), self._priority(auth_token)))
+                response = await stack.enter_async_context(self._post_query(query, source, headers))
+                if response.status_code != 200:
+                    result = await self._read_response(response)
+                    raise QueryError(result.error)
+                
+                decoder = _response_decoder(response)
+                async for row in _decode_rows(response, decoder, self.transfer):
+                    yield row
+                if not decoder.envelope.get('success'):
+                    raise QueryError(decoder.envelope.get('error', 'Query execution failed'))
+        
+        except AdmissionError as e:
+            raise QueryError(str(e)) from e
+        except httpx.PoolTimeout as e:
+            raise QueryError('Too many concurrent queries. Please retry shortly.') from e
+        except httpx.ConnectTimeout as e:
+            raise QueryError('Could not connect to GDELT Cloud API. Please retry shortly.') from e
+        except httpx.TimeoutException as e:
+            raise QueryError('Query timeout. Try reducing query scope or adding more specific filters.') from e
+        except httpx.HTTPError as e:
+            raise QueryError(f'Query failed: {str(e)}') from e
+        except ValueError as e:
+            raise QueryError(f'Query failed: invalid response ({str(e)})') from e
+    
+    async def _send_query(
+        self,
+        query: str,
+        source: str,
+        auth_token: Optional[str],
+        columnar: bool = False,
+        hedge: bool = False
+    ) -> QueryResult:
+        """
+        POST a query to the execution API and convert the response.
+        
+        Read-only queries are retried on transient failures (see
+        _retry_delay); the last failure is converted as usual. A hedge
+        copy (see _send_hedged) is sent once and not counted by the
+        retry budget.
+        """
+        breaker_error = await self._check_breaker(auth_token)
+        if breaker_error:
+            return QueryResult(data=[], count=0, error=breaker_error)
+        
+        if self.admission is None:
+            return await self._send_admitted(query, source, auth_token, columnar, hedge)
+        try:
+            async with self.admission.slot(self._caller_key(auth_token), self._priority(auth_token)):
+                return await self._send_admitted(query, source, auth_token, columnar, hedge)
+        except AdmissionError as e:
+            return QueryResult(data=[], count=0, error=str(e))
+    
+    def _caller_key(self, auth_token: Optional[str] = None) -> str:
+        """Identity used to limit a caller's concurrent queries."""
+        token = auth_token or self.auth_token
+        return hash_token(token) if token else ''
+    
+    def _priority(self, auth_token: Optional[str] = None) -> str:
+        """Scheduling class: API keys are batch callers, OAuth users interactive."""
+        token = auth_token or self.auth_token
+        return BATCH if token and is_api_key(token) else INTERACTIVE
+    
+    async def _send_admitted(
+        self,
+        query: str,
+        source: str,
+        auth_token: Optional[str],
+        columnar: bool = False,
+        hedge: bool = False
+    ) -> QueryResult:
+        """Send a query (with retries) once it holds an admission slot."""
+        headers = self._get_headers(auth_token)
+        # Hedges are limited by the hedge policy; they neither retry nor
+        # raise the retry allowance as if they were new requests
+        retryable = not hedge and self._is_idempotent(query)
+        if not hedge:
+            self.retry_budget.record_request()
+        # Whether the backend answered properly (None: not the backend's fault)
+        backend_ok: Optional[bool] = None
+        try:
+            attempt = 0
+            while True:
+                try:
+                    async with self._post_query(query, source, headers) as response:
+                        delay = self._retry_delay(attempt, response=response) if retryable else None
+                        if delay is None:
+                            backend_ok = response.status_code < 500
+                            return await self._read_response(response, columnar)
+                except RETRYABLE_ERRORS:
+                    delay = self._retry_delay(attempt) if retryable else None
+                    if delay is None:
+                        raise
+                attempt += 1
+                await asyncio.sleep(delay)
             
+        except httpx.PoolTimeout:
+            return QueryResult(
+                data=[],
+                count=0,
+                error='Too many concurrent queries. Please retry shortly.'
+            )
+        except httpx.ConnectTimeout:
+            backend_ok = False
+            return QueryResult(
+                data=[],
+                count=0,
+                error='Could not connect to GDELT Cloud API. Please retry shortly.'
+            )
         except httpx.TimeoutException:
+            # Read/write timeouts are mostly expensive queries, not an
+            # unhealthy backend; they do not count toward the breaker
             return QueryResult(
                 data=[],
                 count=0,
                 error='Query timeout. Try reducing query scope or adding more specific filters.'
             )
         except Exception as e:
+            if isinstance(e, httpx.TransportError):
+                backend_ok = False
             return QueryResult(
                 data=[],
                 count=0,
                 error=f'Query failed: {str(e)}'
             )
+        finally:
+            if self.breaker is not None and backend_ok is not None:
+                self.breaker.record(backend_ok)
+    
+    async def _send_hedged(
+        self,
+        query: str,
+        source: str,
+        auth_token: Optional[str],
+        columnar: bool = False
+    ) -> QueryResult:
+        """
+        Send a query, and a backup copy if it is slower than usual.
+        
+        If the first request has not finished after the hedge delay (the
+        observed latency percentile), a second identical request is sent
+        and the first successful answer wins; the other is cancelled.
+        """
+        self.hedge.record_query()
+        delay = self.hedge.delay()
+        started = asyncio.get_running_loop().time()
+        primary = asyncio.ensure_future(self._send_query(query, source, auth_token, columnar))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self.hedge.try_hedge():
+                tasks.add(asyncio.ensure_future(self._send_query(query, source, auth_token, columnar, hedge=True)))
+            
+            while True:
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a successful answer; an error only wins if nothing else is left
+                winner = next((task for task in done if task.result().error is None), None)
+                if winner is None and not pending:
+                    winner = primary if primary in done else done.pop()
+                if winner is not None:
+                    break
+                tasks = pending
+            
+            result = winner.result()
+            if result.error is None:
+                self.hedge.observe(asyncio.get_running_loop().time() - started)
+                if winner is not primary:
+                    self.hedge.hedge_wins += 1
+            return result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _check_breaker(self, auth_token: Optional[str] = None) -> Optional[str]:
+        """
+        Consult the circuit breaker before a query.
+        
+        When the circuit is half-open, the first caller probes the backend
+        with health_check() and closes the circuit if it succeeds.
+        
+        Returns:
+            Error message to fail fast with, or None to proceed
+        """
+        if self.breaker is None:
+            return None
+        if self.breaker.try_probe():
+            healthy = False
+            try:
+                healthy = await self.health_check(auth_token)
+            finally:
+                self.breaker.probe_result(healthy)
+        if self.breaker.allow():
+            return None
+        return (
+            'GDELT Cloud API is currently unavailable (too many recent failures). '
+            f'Please retry in {max(1, round(self.breaker.retry_in()))}s.'
+        )
+    
+    @staticmethod
+    def _is_idempotent(query: str) -> bool:
+        """Only plain reads (SELECT / WITH ... SELECT) are safe to repeat."""
+        tokens = tokenize_sql(query)
+        return bool(tokens) and tokens[0][1].upper() in ('SELECT', 'WITH')
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+        
+        Args:
+            attempt: Number of the failed attempt (0-based)
+            response: Response received, or None after a network error
+        
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+            (not transient, attempts used up, or retry budget exhausted)
+        """
+        retry_after = None
+        if response is not None:
+            if response.status_code not in self.retry_policy.retry_statuses:
+                return None
+            retry_after = parse_retry_after(response.headers.get('retry-after'))
+        delay = self.retry_policy.delay(attempt, retry_after)
+        if delay is None or not self.retry_budget.try_acquire():
+            return None
+        return delay
+    
+    async def _read_response(self, response: httpx.Response, columnar: bool = False) -> QueryResult:
+        """Convert a query execution response, decoding rows as they arrive."""
+        if response.status_code != 200:
+            await response.aread()
+            self.transfer.record_response(response, len(response.content))
+        
+        if response.status_code == 401:
+            return QueryResult(
+                data=[],
+                count=0,
+                error='Authentication required. Please provide valid OAuth token or API key.'
+            )
+        
+        if response.status_code == 400:
+            error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
+            return QueryResult(
+                data=[],
+                count=0,
+                error=error_data.get('error', 'Invalid query. Check syntax and ensure date filters are included.')
+            )
+        
+        if response.status_code != 200:
+            error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
+            return QueryResult(
+                data=[],
+                count=0,
+                error=error_data.get('error', f'HTTP {response.status_code}: {response.text}')
+            )
+        
+        decoder = _response_decoder(response)
+        # Content-Length is the size on the wire, so it only bounds the decoded
+        # body when the response is not compressed
+        length = response.headers.get('content-length', '')
+        encoding = response.headers.get('content-encoding', 'identity').strip().lower()
+        if (not columnar and isinstance(decoder, JSONArrayDecoder) and encoding in ('', 'identity')
+                and length.isdigit() and int(length) <= self.whole_decode_max_bytes):
+            await response.aread()
+            self.transfer.record_response(response, len(response.content))
+            result = json_codec.loads(response.content)
+            if not isinstance(result, dict):
+                raise ValueError('Response is not a JSON object')
+            data = result.get('data') or []
+        else:
+            if columnar:
+                # Fill the columns directly; each decoded row dict is dropped at once
+                builder = ColumnarBuilder()
+                async for row in _decode_rows(response, decoder, self.transfer):
+                    builder.append(row)
+                data = builder.build()
+            else:
+                data = [row async for row in _decode_rows(response, decoder, self.transfer)]
+            result = decoder.envelope
+        
+        # Handle response format
+        if result.get('success'):
+            return QueryResult(
+                data=data,
+                count=result.get('rowCount', len(data)),
+                execution_time=result.get('executionTime')
+            )
+        else:
+            return QueryResult(
+                data=[],
+                count=0,
+                error=result.get('error', 'Query execution failed')
+            )
+    
+    @staticmethod
+    def _build_query(
+        table: str,
+        where_clause: Optional[str],
+        select_fields: str,
+        limit: int,
+        order_by: str
+    ) -> str:
+        """Build a SELECT against a GDELT table with clamped LIMIT."""
+        query = f"SELECT {select_fields} FROM {table}"
+        
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        
+        query += f" ORDER BY {order_by}"
+        
+        # Enforce limit bounds
+        limit = max(1, min(limit, 1000))
+        query += f" LIMIT {limit}"
+        return query
     
     async def query_events(
         self,
         where_clause: Optional[str] = None,
         select_fields: str = '*',
         limit: int = 100,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        split_by: Optional[str] = None,
+        columnar: bool = False
     ) -> QueryResult:
         """
         Query GDELT events table.
@@ -150,33 +850,34 @@ class GDELTCloudAPIClient:
             select_fields: Comma-separated field names
             limit: Maximum rows to return (1-1000)
             order_by: ORDER BY clause (without ORDER BY keyword)
+            auth_token: Token for this request (defaults to the client's token)
+            split_by: Run the date window as parallel 'day', 'week' or
+                'month' sub-ranges (see query_split)
+            columnar: Return ``data`` as ColumnarRows (see execute_query)
         
         Returns:
             QueryResult with events data
         """
-        # Build query
-        query = f"SELECT {select_fields} FROM gdelt_events"
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        else:
-            query += " ORDER BY day DESC"
-        
-        # Enforce limit bounds
-        limit = max(1, min(limit, 1000))
-        query += f" LIMIT {limit}"
+        order_by = order_by or 'day DESC'
+        if split_by:
+            result = await self.query_split(
+                'gdelt_events', where_clause, select_fields, limit, order_by,
+                split_by, auth_token=auth_token
+            )
+            return _with_layout(result, columnar)
         
-        return await self.execute_query(query)
+        query = self._build_query('gdelt_events', where_clause, select_fields, limit, order_by)
+        return await self.execute_query(query, auth_token=auth_token, columnar=columnar)
     
     async def query_gkg(
         self,
         where_clause: Optional[str] = None,
         select_fields: str = '*',
         limit: int = 100,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        split_by: Optional[str] = None,
+        columnar: bool = False
     ) -> QueryResult:
         """
         Query GDELT GKG table.
@@ -186,38 +887,346 @@ class GDELTCloudAPIClient:
             select_fields: Comma-separated field names
             limit: Maximum rows to return (1-1000)
             order_by: ORDER BY clause (without ORDER BY keyword)
+            auth_token: Token for this request (defaults to the client's token)
+            split_by: Run the date window as parallel 'day', 'week' or
+                'month' sub-ranges (see query_split)
+            columnar: Return ``data`` as ColumnarRows (see execute_query)
         
         Returns:
             QueryResult with GKG data
         """
-        # Build query
-        query = f"SELECT {select_fields} FROM gdelt_gkg"
+        order_by = order_by or 'date DESC'
+        if split_by:
+            result = await self.query_split(
+                'gdelt_gkg', where_clause, select_fields, limit, order_by,
+                split_by, auth_token=auth_token
+            )
+            return _with_layout(result, columnar)
         
-        if where_clause:
-            query += f" WHERE {where_clause}"
+        query = self._build_query('gdelt_gkg', where_clause, select_fields, limit, order_by)
+        return await self.execute_query(query, auth_token=auth_token, columnar=columnar)
+    
+    async def query_split(
+        self,
+        table: str,
+        where_clause: Optional[str],
+        select_fields: str,
+        limit: int,
+        order_by: str,
+        split_by: str,
+        auth_token: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Run a query as parallel date sub-ranges and merge the results.
+        
+        The date window from where_clause (both a start and an end date are
+        required) is split into calendar-aligned day/week/month ranges.
+        Each range runs as its own query with the same ORDER BY and LIMIT,
+        through execute_query, so every range is cached independently; the
+        original whole-day date conditions are replaced by the range's own,
+        so later overlapping queries reuse the ranges they share. The partial results are merged
+        by ORDER BY and cut to LIMIT.
+        
+        Queries that cannot be merged row-wise (aggregates, DISTINCT,
+        ORDER BY on expressions or unselected columns) or whose window is
+        open-ended run as a single query instead.
+        
+        Args:
+            table: 'gdelt_events' or 'gdelt_gkg'
+            where_clause: SQL WHERE clause (without WHERE keyword)
+            select_fields: Comma-separated field names
+            limit: Maximum rows to return (1-1000)
+            order_by: ORDER BY clause (without ORDER BY keyword)
+            split_by: 'day', 'week' or 'month'
+            auth_token: Token for this request (defaults to the client's token)
+        
+        Returns:
+            Merged QueryResult (execution_time is the slowest sub-range's)
+        """
+        if split_by not in SPLIT_UNITS:
+            return QueryResult(
+                data=[],
+                count=0,
+                error=f"Invalid split_by '{split_by}'. Use one of: {', '.join(SPLIT_UNITS)}"
+            )
+        
+        single_query = self._build_query(table, where_clause, select_fields, limit, order_by)
+        window = extract_date_window(single_query)
+        order = parse_order_by(order_by)
+        outputs = select_outputs(select_fields)
+        
+        if (
+            window is None or window.start is None or window.end is None
+            or order is None
+            or not select_is_splittable(select_fields)
+            or (outputs is not None and any(column not in outputs for column, _ in order))
+        ):
+            return await self.execute_query(single_query, auth_token=auth_token)
+        
+        ranges = split_window(window.start, window.end, split_by)
+        if len(ranges) <= 1:
+            return await self.execute_query(single_query, auth_token=auth_token)
+        if len(ranges) > self.split_max_ranges:
+            return QueryResult(
+                data=[],
+                count=0,
+                error=(
+                    f"Date window splits into {len(ranges)} sub-ranges "
+                    f"(max {self.split_max_ranges}). Use a coarser split_by."
+                )
+            )
+        
+        # Conditions implied by every sub-range are dropped so that interior
+        # ranges produce the same SQL (and cache key) for overlapping windows
+        remaining_where = remove_date_bounds(where_clause, table)
+        semaphore = asyncio.Semaphore(self.split_max_parallel)
+        
+        async def run_range(first, last) -> QueryResult:
+            range_where = range_predicate(table, first, last)
+            if remaining_where:
+                range_where = f"({remaining_where}) AND {range_where}"
+            query = self._build_query(table, range_where, select_fields, limit, order_by)
+            async with semaphore:
+                return await self.execute_query(query, auth_token=auth_token)
+        
+        results = await asyncio.gather(*(run_range(first, last) for first, last in ranges))
+        
+        for result in results:
+            if result.error:
+                return result
+        
+        data = merge_rows([result.data for result in results], order, max(1, min(limit, 1000)))
+        times = [result.execution_time for result in results if result.execution_time is not None]
+        return QueryResult(
+            data=data,
+            count=len(data),
+            execution_time=max(times) if times else None,
+            cached=all(result.cached for result in results)
+        )
+    
+    async def query_time_series(
+        self,
+        table: str,
+        metrics: str,
+        start_date: date,
+        end_date: date,
+        where_clause: Optional[str] = None,
+        auth_token: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Query a daily aggregate series, fetching only days not already cached.
+        
+        Each day of a series (identified by table, metrics and filters) is
+        cached as its own slice, including days without rows. A request
+        fetches only the contiguous runs of missing days and stitches them
+        with the cached slices, so sliding a window forward costs one query
+        for the new days. Settled days are kept per the CachePolicy.
+        
+        Args:
+            table: 'gdelt_events' or 'gdelt_gkg'
+            metrics: Comma-separated aggregate expressions computed per day
+            start_date: First day (inclusive)
+            end_date: Last day (inclusive)
+            where_clause: Additional filters (without WHERE keyword and
+                without date conditions)
+            auth_token: Token for this request (defaults to the client's token)
+        
+        Returns:
+            QueryResult with one row per day that has data, ordered by day
+        """
+        if end_date < start_date:
+            return QueryResult(data=[], count=0, error='end_date must not be before start_date')
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if len(days) > self.series_max_days:
+            return QueryResult(
+                data=[],
+                count=0,
+                error=f'Date window spans {len(days)} days (max {self.series_max_days}).'
+            )
+        
+        scope = self._scope(auth_token)
+        signature = series_signature(table, metrics, where_clause)
+        slices: Dict[date, Dict[str, Any]] = {}
+        for day in days:
+            row = self.series_cache.get((scope, signature, day))
+            if row is not None:
+                slices[day] = row
+        
+        runs = missing_runs(days, slices)
+        if len(runs) > self.split_max_ranges:
+            # Too fragmented: fetch one span covering every missing day
+            runs = [(runs[0][0], runs[-1][1])]
+        
+        semaphore = asyncio.Semaphore(self.split_max_parallel)
+        
+        async def fetch_run(first: date, last: date) -> QueryResult:
+            query = build_time_series_query(table, metrics, where_clause, first, last)
+            async with semaphore:
+                return await self.execute_query(query, auth_token=auth_token)
         
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        results = await asyncio.gather(*(fetch_run(first, last) for first, last in runs))
+        
+        for (first, last), result in zip(runs, results, strict=True):
+            if result.error:
+                return result
+            by_day = {row_day(row): row for row in result.data}
+            day = first
+            while day <= last:
+                row = by_day.get(day, {})
+                slices[day] = row
+                ttl = (
+                    self.cache_policy.settled_ttl
+                    if self.cache_policy.is_settled(day)
+                    else self.cache_policy.live_ttl
+                )
+                self.series_cache.set((scope, signature, day), row, ttl=ttl)
+                day += timedelta(days=1)
+        
+        data = [slices[day] for day in days if slices.get(day)]
+        times = [result.execution_time for result in results if result.execution_time is not None]
+        return QueryResult(
+            data=data,
+            count=len(data),
+            execution_time=max(times) if times else None,
+            cached=not runs or all(result.cached for result in results)
+        )
+    
+    async def query_page(
+        self,
+        table: Optional[str] = None,
+        where_clause: Optional[str] = None,
+        select_fields: str = '*',
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        auth_token: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Fetch one page of rows using keyset pagination.
+        
+        Rows are ordered newest first by (day, global_event_id) for events
+        or (date, gkg_record_id) for GKG. The returned ``next_cursor`` is an
+        opaque token carrying the query and the last key seen; pass it back
+        alone to get the following page. While the caller processes a page,
+        the next one is fetched in the background.
+        
+        Args:
+            table: 'gdelt_events' or 'gdelt_gkg' (ignored with a cursor)
+            where_clause: SQL WHERE clause (ignored with a cursor)
+            select_fields: Comma-separated field names (ignored with a cursor)
+            page_size: Rows per page, 1-1000 (ignored with a cursor)
+            cursor: Continuation token from a previous page
+            auth_token: Token for this request (defaults to the client's token)
+        
+        Returns:
+            QueryResult for the page; next_cursor is None on the last page
+        """
+        if cursor:
+            try:
+                state = decode_cursor(cursor)
+            except ValueError as e:
+                return QueryResult(data=[], count=0, error=str(e))
         else:
-            query += " ORDER BY date DESC"
+            if table not in PAGE_KEYS:
+                return QueryResult(data=[], count=0, error=f"Invalid table '{table}'")
+            state = {
+                'table': table,
+                'where': where_clause,
+                'select': select_fields,
+                'page_size': max(1, min(page_size, MAX_PAGE_SIZE)),
+                'after': None
+            }
         
-        # Enforce limit bounds
-        limit = max(1, min(limit, 1000))
-        query += f" LIMIT {limit}"
+        token = auth_token or self.auth_token
+        prefetch_key = (hash_token(token) if token else '', cursor or encode_cursor(state))
+        page = self.prefetch.pop(prefetch_key) if self.prefetch is not None and cursor else None
+        if page is None:
+            page = await self._fetch_page(state, auth_token)
+        
+        if page.next_cursor and self.prefetch is not None:
+            self._prefetch_page(prefetch_key[0], page.next_cursor, auth_token)
+        return page
+    
+    async def _fetch_page(self, state: Dict[str, Any], auth_token: Optional[str]) -> QueryResult:
+        """Run the query for one page and derive the next cursor."""
+        try:
+            after = tuple(state['after']) if state.get('after') else None
+            query = build_page_query(
+                state['table'], state.get('where'), state.get('select') or '*',
+                int(state['page_size']), after
+            )
+        except (KeyError, TypeError, ValueError):
+            return QueryResult(data=[], count=0, error='Invalid cursor')
+        
+        result = await self.execute_query(query, auth_token=auth_token)
+        if result.error:
+            return result
+        
+        try:
+            cursor = next_cursor(state, result.data)
+        except KeyError:
+            return QueryResult(data=[], count=0, error='Result rows are missing the pagination key columns')
+        data = result.data[:state['page_size']]
+        return QueryResult(
+            data=data,
+            count=len(data),
+            execution_time=result.execution_time,
+            cached=result.cached,
+            next_cursor=cursor
+        )
+    
+    def _prefetch_page(self, scope: str, cursor: str, auth_token: Optional[str]) -> None:
+        """Fetch the page for `cursor` in the background and keep it for the caller."""
+        async def prefetch():
+            page = await self._fetch_page(decode_cursor(cursor), auth_token)
+            if not page.error:
+                self.prefetch.put((scope, cursor), page)
+        
+        task = asyncio.ensure_future(prefetch())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get runtime counters for the client's caching, coalescing and
+        transport layers.
         
-        return await self.execute_query(query)
+        Returns:
+            Dictionary of per-component statistics (absent components omitted)
+        """
+        stats: Dict[str, Any] = {}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        if self.disk_cache is not None:
+            stats['disk_cache'] = self.disk_cache.stats()
+        if self.single_flight is not None:
+            stats['single_flight'] = self.single_flight.stats()
+        stats['series_cache'] = self.series_cache.stats()
+        if self.prefetch is not None:
+            stats['page_prefetch'] = self.prefetch.stats()
+        stats['transfer'] = self.transfer.stats()
+        stats['retry'] = self.retry_budget.stats()
+        if self.breaker is not None:
+            stats['breaker'] = self.breaker.stats()
+        if self.hedge is not None:
+            stats['hedge'] = self.hedge.stats()
+        if self.admission is not None:
+            stats['admission'] = self.admission.stats()
+        return stats
     
-    async def health_check(self) -> bool:
+    async def health_check(self, auth_token: Optional[str] = None) -> bool:
         """
         Check if API is accessible.
         
+        Args:
+            auth_token: Token for this request (defaults to the client's token)
+        
         Returns:
             True if API is healthy, False otherwise
         """
         try:
             response = await self.client.get(
                 f'{self.base_url}/api/health',
-                headers=self._get_headers(),
+                headers=self._get_headers(auth_token),
                 timeout=5.0
             )
             return response.status_code == 200
@@ -7,15 +7,97 @@ This module provides token validation and context management for API calls.
 """
 
 import os
-from typing import Optional
-from fastmcp.server.dependencies import get_http_headers
+import hashlib
+from contextvars import ContextVar
+from typing import Any, Optional, Union
+import mcp.types as mt
+from fastmcp.server.auth import AccessToken
+from fastmcp.server.dependencies import get_http_headers, get_access_token
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from .log import get_logger
+
+
+logger = get_logger(__name__)
+
+# Verified token of the request being handled, set once by RequestAuthMiddleware
+_UNRESOLVED = object()
+_request_token: ContextVar[Union[AccessToken, None, object]] = ContextVar('gdelt_request_token', default=_UNRESOLVED)
+
+
+def get_request_token() -> Optional[AccessToken]:
+    """
+    Get the verified access token of the current request.
+    
+    Inside a request handled by RequestAuthMiddleware this is a context
+    variable read; elsewhere the token is looked up from FastMCP.
+    
+    Returns:
+        AccessToken from the token verifier, or None if unauthenticated
+    """
+    access_token = _request_token.get()
+    if access_token is not _UNRESOLVED:
+        return access_token
+    try:
+        return get_access_token()
+    except Exception:
+        return None
+
+
+class RequestAuthMiddleware(Middleware):
+    """
+    Resolve the caller's verified access token once per MCP request.
+    
+    The token is kept in a context variable for the duration of the
+    request, so AuthContext, get_auth_token() and get_caller_identity()
+    read it directly instead of re-parsing headers or checking the
+    environment. Install it before other middleware that needs identity.
+    """
+    
+    async def on_request(
+        self,
+        context: MiddlewareContext[mt.Request],
+        call_next: CallNext[mt.Request, Any],
+    ) -> Any:
+        try:
+            access_token = get_access_token()
+        except Exception:
+            access_token = None
+        reset = _request_token.set(access_token)
+        try:
+            return await call_next(context)
+        finally:
+            _request_token.reset(reset)
+
+
+# Claim set on API-key access tokens the backend confirmed as active
+KEY_VERIFIED_CLAIM = 'gdelt_key_verified'
+
+
+def is_verified_token(token: Optional[str]) -> bool:
+    """
+    Check whether `token` was verified for the current request.
+    
+    OAuth JWTs count once the token verifier checked their signature; API
+    keys only once the backend confirmed them (see APIKeyIntrospector), as
+    the local check covers their format alone.
+    
+    Args:
+        token: Token the caller is using
+    """
+    access_token = get_request_token()
+    if not token or access_token is None or access_token.token != token:
+        return False
+    if is_api_key(token):
+        return bool((getattr(access_token, 'claims', None) or {}).get(KEY_VERIFIED_CLAIM))
+    return True
 
 
 def get_auth_token() -> Optional[str]:
     """
     Get authentication token with priority:
-    1. HTTP Authorization header (Bearer token)
-    2. Environment variables (for development/testing)
+    1. Verified token of the current request (see get_request_token)
+    2. HTTP Authorization header (Bearer token)
+    3. Environment variables (for development/testing)
     
     For development/testing, set one of:
     - GDELT_API_KEY: API key (gdelt_sk_*)
@@ -26,31 +108,26 @@ def get_auth_token() -> Optional[str]:
     Returns:
         Authentication token (OAuth or API key) or None
     """
-    print("\n=== GET_AUTH_TOKEN CALLED ===")
+    access_token = get_request_token()
+    if access_token is not None:
+        return access_token.token
     
-    # First, try to get token from HTTP headers
+    # Then try the HTTP headers (unverified, e.g. when running without auth)
     try:
-        headers = get_http_headers()
-        print(f"Headers retrieved: {dict(headers)}")
+        headers = get_http_headers(include_all=True)
         auth_header = headers.get("authorization", "")
-        print(f"Authorization header: {auth_header[:50] if auth_header else 'None'}...")
         
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]  # Remove "Bearer " prefix
-            print(f"Token extracted from header: {token[:20]}..." if token else "No token")
             if token:
                 return token
     except Exception as e:
         # If get_http_headers() fails (e.g., not in request context), 
         # fall through to environment variables
-        print(f"Exception getting headers: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("No request headers available: %s", e)
     
     # Fall back to environment variables for development/testing
-    env_token = os.getenv('GDELT_API_KEY') or os.getenv('GDELT_OAUTH_TOKEN')
-    print(f"Env token: {env_token[:20] if env_token else 'None'}...")
-    return env_token
+    return os.getenv('GDELT_API_KEY') or os.getenv('GDELT_OAUTH_TOKEN')
 
 
 def validate_api_key(token: str) -> bool:
@@ -97,6 +174,46 @@ def is_api_key(token: str) -> bool:
     return token and isinstance(token, str) and token.startswith('gdelt_sk_')
 
 
+def hash_token(token: str) -> str:
+    """
+    Derive a stable, non-reversible identifier for a token.
+    
+    Used wherever a token needs to key shared state (caches, limits)
+    without keeping the raw secret around.
+    
+    Args:
+        token: Token to hash (OAuth or API key)
+    
+    Returns:
+        Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def get_caller_identity() -> Optional[str]:
+    """
+    Get a stable identity for the caller of the current request.
+    
+    OAuth users are identified by their JWT `sub` claim, so all of a user's
+    tokens share one identity; API keys (and tokens without a subject) by
+    their hash. Falls back to the token from get_auth_token() when the
+    server runs without an auth provider.
+    
+    Returns:
+        'sub:<subject>' or 'key:<token hash>', or None if unauthenticated
+    """
+    access_token = get_request_token()
+    if access_token is not None:
+        token = access_token.token
+        subject = (getattr(access_token, 'claims', None) or {}).get('sub')
+        if subject and not is_api_key(token):
+            return f"sub:{subject}"
+    else:
+        token = get_auth_token()
+    
+    return f"key:{hash_token(token)}" if token else None
+
+
 class AuthContext:
     """Context manager for authentication state"""
     
@@ -105,8 +222,12 @@ class AuthContext:
         Initialize auth context.
         
         Args:
-            token: Authentication token (OAuth or API key)
+            token: Authentication token (OAuth or API key); defaults to the
+                verified token of the current request
         """
+        self.access_token = get_request_token()
+        if not token and self.access_token is not None:
+            token = self.access_token.token
         self.token = token or get_auth_token()
         self.is_authenticated = bool(self.token)
         self.auth_type = 'api_key' if is_api_key(self.token or '') else 'oauth'
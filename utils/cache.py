@@ -0,0 +1,188 @@
+"""
+Query result caching for GDELT Cloud MCP Server
+Provides an in-process LRU cache with per-entry TTL and date-aware expiry
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .sql import extract_date_window
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache with per-entry expiry.
+
+    Entries are evicted least-recently-used first once either the entry
+    count or the total weight (e.g. row count) exceeds its bound. Each
+    entry carries its own TTL; a TTL of None means the entry never expires.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: Optional[float] = 300.0,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl: Default time-to-live in seconds (None = no expiry)
+            max_weight: Optional bound on the summed weight of all entries
+            weigher: Function returning the weight of a value (default 1)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigher = weigher or (lambda value: 1)
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    @staticmethod
+    def _expired(entry: tuple) -> bool:
+        expires_at = entry[1]
+        return expires_at is not None and time.monotonic() >= expires_at
+
+    def _remove(self, key: Hashable) -> None:
+        value, _, weight = self._entries.pop(key)
+        self._weight -= weight
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a value, refreshing its LRU position.
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self._expired(entry):
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Any = ...) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds for this entry (defaults to the
+                cache TTL; None = no expiry)
+        """
+        if ttl is ...:
+            ttl = self.ttl
+        weight = self.weigher(value)
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at, weight)
+        self._weight += weight
+
+        while self._entries and (
+            len(self._entries) > self.max_size
+            or (self.max_weight is not None and self._weight > self.max_weight)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a value if present."""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
+        self._weight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'weight': self._weight,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachePolicy:
+    """
+    Date-aware TTL selection for query results.
+
+    GDELT data for closed days does not change, so a result whose date
+    window ends before the settled horizon (today minus ``settled_days``,
+    UTC) is kept for ``settled_ttl`` — by default until LRU eviction.
+    Windows that are open-ended or reach the horizon use ``live_ttl``.
+    """
+
+    def __init__(
+        self,
+        live_ttl: Optional[float] = 300.0,
+        settled_ttl: Optional[float] = None,
+        settled_days: int = 2
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            live_ttl: TTL in seconds for windows touching recent days
+            settled_ttl: TTL in seconds for fully historical windows
+                (None = no expiry)
+            settled_days: Number of most recent days (including today)
+                that may still receive late data
+        """
+        self.live_ttl = live_ttl
+        self.settled_ttl = settled_ttl
+        self.settled_days = settled_days
+
+    def horizon(self) -> date:
+        """First day that is not yet settled."""
+        today = datetime.now(timezone.utc).date()
+        return today - timedelta(days=self.settled_days)
+
+    def is_settled(self, last_day: Optional[date]) -> bool:
+        """Check whether data up to and including `last_day` is final."""
+        return last_day is not None and last_day < self.horizon()
+
+    def ttl_for(self, query: str) -> Optional[float]:
+        """
+        Choose the cache TTL for a query's result.
+
+        Args:
+            query: SQL query string
+
+        Returns:
+            TTL in seconds (None = no expiry)
+        """
+        window = extract_date_window(query)
+        if window is not None and self.is_settled(window.end):
+            return self.settled_ttl
+        return self.live_ttl
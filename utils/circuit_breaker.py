@@ -0,0 +1,127 @@
+"""
+Circuit breaker for GDELT Cloud MCP Server
+Stops sending queries to a failing backend and fails fast until a health
+probe succeeds
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker driven by failure rate.
+
+    Closed: calls go through and their outcomes are tracked over a sliding
+    window. Once at least `min_calls` outcomes are in the window and the
+    failure share reaches `failure_rate`, the circuit opens.
+
+    Open: calls are rejected immediately for `open_seconds`.
+
+    Half-open: one caller is allowed to probe the backend; success closes
+    the circuit, failure opens it for another `open_seconds`.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 30.0,
+        open_seconds: float = 15.0
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_rate: Share of failed calls (0-1) that opens the circuit
+            min_calls: Outcomes needed in the window before it can open
+            window: Sliding window length in seconds
+            open_seconds: How long to fail fast before probing
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state ('closed', 'open' or 'half_open')."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.open_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """Check whether a call may go through (only when closed)."""
+        if self.state == self.CLOSED:
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call made while closed."""
+        if self._opened_at is not None:
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, success))
+        if not success:
+            self._failures += 1
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, old_success = self._outcomes.popleft()
+            if not old_success:
+                self._failures -= 1
+        if len(self._outcomes) >= self.min_calls and self._failures >= self.failure_rate * len(self._outcomes):
+            self._open()
+
+    def try_probe(self) -> bool:
+        """Claim the half-open probe; only one caller gets it at a time."""
+        if self.state != self.HALF_OPEN or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def probe_result(self, healthy: bool) -> None:
+        """Close the circuit after a healthy probe, or keep it open."""
+        self._probing = False
+        if healthy:
+            self._opened_at = None
+            self._outcomes.clear()
+            self._failures = 0
+        else:
+            self._open()
+
+    def _open(self) -> None:
+        if self._opened_at is None:
+            self.trips += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._failures = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Get state and counters."""
+        return {
+            'state': self.state,
+            'trips': self.trips,
+            'rejected': self.rejected,
+            'window_calls': len(self._outcomes),
+            'window_failures': self._failures,
+        }
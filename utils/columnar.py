@@ -0,0 +1,242 @@
+"""
+Columnar query results for GDELT Cloud MCP Server
+Stores result rows as one array per column instead of one dict per row;
+numeric columns use compact typed arrays
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+ColumnValues = Union[array, List[Any]]
+
+# Integers beyond this cannot be stored in a float column without loss
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _pack(values: List[Any]) -> ColumnValues:
+    """
+    Store a column compactly.
+
+    All-integer columns become array('q'), numeric columns with floats
+    become array('d'); anything else (strings, NULLs, nested values) stays
+    a list.
+    """
+    has_float = False
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            has_float = True
+        elif kind is not int:
+            return values
+    if not values:
+        return values
+    if not has_float:
+        if all(_INT64_MIN <= value <= _INT64_MAX for value in values):
+            return array('q', values)
+        return values
+    if all(type(value) is float or abs(value) <= _MAX_EXACT_FLOAT_INT for value in values):
+        return array('d', values)
+    return values
+
+
+class ColumnarBuilder:
+    """
+    Accumulate rows into columns, e.g. while a response is being decoded.
+
+    Columns are added in order of first appearance; rows missing a column
+    get None for it.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List[Any]] = {}
+        self._length = 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Add one row."""
+        for name, value in row.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [None] * self._length
+            column.append(value)
+        self._length += 1
+        for column in self._columns.values():
+            if len(column) < self._length:
+                column.append(None)
+
+    def build(self) -> 'ColumnarRows':
+        """Pack the accumulated columns."""
+        columns = list(self._columns)
+        values = [_pack(self._columns[name]) for name in columns]
+        self._columns = {}
+        self._length = 0
+        return ColumnarRows(columns, values)
+
+
+class ColumnarRows(Sequence):
+    """
+    Query result rows stored column by column.
+
+    Column names are kept once instead of per row and numeric columns are
+    typed arrays. The container is still a read-only sequence of row
+    dicts: indexing or iterating builds each row on demand, so code that
+    expects ``List[Dict[str, Any]]`` keeps working.
+    """
+
+    __slots__ = ('columns', '_values', '_index')
+
+    def __init__(self, columns: List[str], values: List[ColumnValues]):
+        if len(columns) != len(values):
+            raise ValueError('Each column needs exactly one value array')
+        lengths = {len(column) for column in values}
+        if len(lengths) > 1:
+            raise ValueError('Columns have different lengths')
+        self.columns = list(columns)
+        self._values = list(values)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+
+    @classmethod
+    def from_rows(cls, rows: Union[List[Dict[str, Any]], 'ColumnarRows']) -> 'ColumnarRows':
+        """Build from row dicts."""
+        if isinstance(rows, ColumnarRows):
+            return rows
+        builder = ColumnarBuilder()
+        for row in rows:
+            builder.append(row)
+        return builder.build()
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'ColumnarRows':
+        """Rebuild from the output of `to_dict()`."""
+        return cls(payload['columns'], [_pack(list(values)) for values in payload['values']])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form: column names plus one value list per column."""
+        return {
+            'columns': list(self.columns),
+            'values': [
+                column.tolist() if isinstance(column, array) else list(column)
+                for column in self._values
+            ],
+        }
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a dict."""
+        if not self._values:
+            return []
+        columns = self.columns
+        return [dict(zip(columns, values, strict=True)) for values in zip(*self._values, strict=True)]
+
+    def column(self, name: str) -> ColumnValues:
+        """
+        Get the values of one column.
+
+        Raises:
+            KeyError: If the column is not part of the result
+        """
+        return self._values[self._index[name]]
+
+    def __len__(self) -> int:
+        return len(self._values[0]) if self._values else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ColumnarRows(self.columns, [column[index] for column in self._values])
+        return {name: column[index] for name, column in zip(self.columns, self._values, strict=True)}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        columns = self.columns
+        for values in zip(*self._values, strict=True):
+            yield dict(zip(columns, values, strict=True))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColumnarRows):
+            return self.columns == other.columns and self.to_dict() == other.to_dict()
+        if isinstance(other, list):
+            return self.to_rows() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows(columns={self.columns!r}, rows={len(self)})"
+
+
+def as_rows(data: Union[List[Dict[str, Any]], ColumnarRows]) -> List[Dict[str, Any]]:
+    """Row dicts for either result layout."""
+    return data.to_rows() if isinstance(data, ColumnarRows) else data
+
+
+RESULT_FORMATS = ('rows', 'columnar', 'dictionary')
+
+
+def _dictionary_encode(values: ColumnValues) -> Optional[Tuple[List[str], List[Any]]]:
+    """
+    Replace the strings of a low-cardinality column with dictionary indexes.
+
+    Returns:
+        (dictionary, encoded values), or None when the column is not a
+        string column or has too many distinct values to benefit
+    """
+    if isinstance(values, array) or len(values) < 2:
+        return None
+    index: Dict[str, int] = {}
+    encoded: List[Any] = []
+    limit = len(values) // 2
+    for value in values:
+        if value is None:
+            encoded.append(None)
+            continue
+        if type(value) is not str:
+            return None
+        position = index.get(value)
+        if position is None:
+            if len(index) >= limit:
+                return None
+            position = index[value] = len(index)
+        encoded.append(position)
+    if not index:
+        return None
+    return list(index), encoded
+
+
+def encode_rows(
+    data: Union[List[Dict[str, Any]], ColumnarRows],
+    layout: str = 'rows'
+) -> Dict[str, Any]:
+    """
+    Encode result rows for a tool response.
+
+    Layouts:
+        rows: ``{"data": [{...}, ...]}``
+        columnar: ``{"columns": [...], "rows": [[...], ...]}``
+        dictionary: columnar, plus string columns with few distinct values
+            (e.g. event_code, action_geo_country_code) sent as indexes into
+            ``"dictionaries": {"column": [values]}``
+
+    Raises:
+        ValueError: If the layout is unknown
+    """
+    if layout not in RESULT_FORMATS:
+        raise ValueError(f"Invalid format '{layout}'. Use one of: {', '.join(RESULT_FORMATS)}")
+    if layout == 'rows':
+        return {'data': as_rows(data)}
+
+    table = ColumnarRows.from_rows(data)
+    values = [table.column(name) for name in table.columns]
+    dictionaries: Dict[str, List[str]] = {}
+    if layout == 'dictionary':
+        for i, name in enumerate(table.columns):
+            encoded = _dictionary_encode(values[i])
+            if encoded is not None:
+                dictionaries[name], values[i] = encoded
+
+    payload: Dict[str, Any] = {
+        'format': layout,
+        'columns': list(table.columns),
+        'rows': [list(row) for row in zip(*values, strict=True)],
+    }
+    if layout == 'dictionary':
+        payload['dictionaries'] = dictionaries
+    return payload
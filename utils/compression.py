@@ -0,0 +1,117 @@
+"""
+Transport compression for GDELT Cloud MCP Server
+Negotiates compressed responses, optionally gzips large request bodies and
+counts bytes on the wire vs. decoded
+"""
+
+import gzip
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+
+# Preferred first; httpx decodes br / zstd only when brotli / zstandard are installed
+ENCODING_PREFERENCE = ('zstd', 'br', 'gzip', 'deflate')
+
+# Packages httpx uses to decode each optional encoding (any one will do)
+_DECODER_PACKAGES = {
+    'zstd': ('zstandard',),
+    'br': ('brotli', 'brotlicffi'),
+}
+
+
+def _importable(name: str) -> bool:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def available_encodings() -> List[str]:
+    """Response encodings httpx can decode in this environment."""
+    return [
+        name for name in ENCODING_PREFERENCE
+        if name not in _DECODER_PACKAGES or any(_importable(package) for package in _DECODER_PACKAGES[name])
+    ]
+
+
+def accept_encoding(setting: str) -> str:
+    """
+    Build the Accept-Encoding header value.
+
+    Args:
+        setting: 'auto' for every decodable encoding, 'none' to disable
+            compression, or a comma-separated list (e.g. 'zstd,gzip');
+            encodings that cannot be decoded here are skipped
+
+    Returns:
+        Header value ('identity' when compression is disabled)
+    """
+    setting = setting.strip().lower()
+    if setting in ('none', 'off', 'false', 'identity'):
+        return 'identity'
+    available = available_encodings()
+    if setting == 'auto':
+        chosen = available
+    else:
+        requested = [name.strip() for name in setting.split(',') if name.strip()]
+        chosen = [name for name in requested if name in available]
+    return ', '.join(chosen) if chosen else 'identity'
+
+
+def compress_body(body: bytes, min_bytes: Optional[int], level: int = 6) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Gzip a request body when it is at least `min_bytes` long.
+
+    Args:
+        body: Encoded request body
+        min_bytes: Size threshold, or None to never compress
+        level: gzip compression level
+
+    Returns:
+        (body to send, extra headers)
+    """
+    if min_bytes is None or len(body) < min_bytes:
+        return body, {}
+    return gzip.compress(body, compresslevel=level, mtime=0), {'Content-Encoding': 'gzip'}
+
+
+class TransferStats:
+    """Byte counters for backend traffic, on the wire and after decoding."""
+
+    def __init__(self):
+        self.requests = 0
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.responses = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+
+    def record_request(self, raw: int, wire: int) -> None:
+        """Count one request body before and after compression."""
+        self.requests += 1
+        self.request_bytes += raw
+        self.request_wire_bytes += wire
+
+    def record_response(self, response: httpx.Response, decoded: int) -> None:
+        """Count one response body as received and after decompression."""
+        self.responses += 1
+        self.response_wire_bytes += response.num_bytes_downloaded
+        self.response_bytes += decoded
+
+    def stats(self) -> Dict[str, float]:
+        """Get byte totals and compression ratios."""
+        return {
+            'requests': self.requests,
+            'request_bytes': self.request_bytes,
+            'request_wire_bytes': self.request_wire_bytes,
+            'responses': self.responses,
+            'response_bytes': self.response_bytes,
+            'response_wire_bytes': self.response_wire_bytes,
+            'response_ratio': (
+                round(self.response_bytes / self.response_wire_bytes, 2)
+                if self.response_wire_bytes else None
+            ),
+        }
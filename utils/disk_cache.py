@@ -0,0 +1,233 @@
+"""
+Persistent query result cache for GDELT Cloud MCP Server
+SQLite-backed, compressed, size-capped cache shared by every server
+process pointed at the same directory
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from . import json_codec
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0);
+"""
+
+
+class DiskCache:
+    """
+    Disk-backed cache of JSON-serializable values.
+
+    Values are stored zlib-compressed in a SQLite database (WAL mode), so
+    several processes can read and write the same cache safely. The total
+    compressed size is capped; least-recently-accessed entries are evicted
+    first. The database is only opened on first use, so constructing the
+    cache costs nothing regardless of its size on disk.
+
+    Methods are blocking; call them from a worker thread in async code.
+    """
+
+    # Access times are only rewritten when older than this, to avoid
+    # turning every read into a write
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory holding the cache database
+            max_bytes: Cap on the total compressed size of cached values
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, 'query_cache.sqlite3')
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.corrupt = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(self.directory, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=30.0,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, remaining TTL in seconds or None for no expiry), or
+            None if missing, expired or unreadable
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT value, expires_at, accessed_at FROM entries WHERE key = ?',
+                (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None:
+                self.misses += 1
+                return None
+
+            blob, expires_at, accessed_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete(conn, key)
+                self.misses += 1
+                return None
+            if now - accessed_at > self.TOUCH_INTERVAL:
+                conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+
+            try:
+                value = json_codec.loads(zlib.decompress(blob))
+            except (zlib.error, ValueError):
+                # Truncated or corrupt entry: drop it and refetch
+                self._delete(conn, key)
+                self.misses += 1
+                self.corrupt += 1
+                return None
+            self.hits += 1
+            remaining = expires_at - now if expires_at is not None else None
+            return value, remaining
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting old entries if the size cap is exceeded.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (None = no expiry)
+        """
+        blob = zlib.compress(json_codec.dumps_bytes(value))
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                old = conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+                conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, blob, len(blob), expires_at, now)
+                )
+                delta = len(blob) - (old[0] if old else 0)
+                conn.execute(
+                    "UPDATE meta SET value = value + ? WHERE name = 'total_bytes'",
+                    (delta,)
+                )
+                self._evict(conn, now)
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            self.writes += 1
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _delete(self, conn: sqlite3.Connection, key: str) -> None:
+        """Delete one entry and adjust the size counter."""
+        row = conn.execute('DELETE FROM entries WHERE key = ? RETURNING size', (key,)).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE meta SET value = value - ? WHERE name = 'total_bytes'",
+                (row[0],)
+            )
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least-recently-accessed ones, until under the cap."""
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+
+        freed = conn.execute(
+            'DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ? RETURNING size',
+            (now,)
+        ).fetchall()
+        total -= sum(size for (size,) in freed)
+
+        while total > self.max_bytes:
+            batch = conn.execute(
+                'SELECT key, size FROM entries ORDER BY accessed_at LIMIT 64'
+            ).fetchall()
+            if not batch:
+                total = 0
+                break
+            for key, size in batch:
+                if total <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                total -= size
+                self.evictions += 1
+
+        conn.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (total,))
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM entries')
+            conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_bytes'")
+            conn.execute('COMMIT')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get this process's hit/miss counters and the shared cache size."""
+        with self._lock:
+            total = self._total_bytes(self._conn) if self._conn is not None else None
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'corrupt': self.corrupt,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+        }
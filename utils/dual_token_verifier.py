@@ -7,10 +7,19 @@ This enables two authentication flows:
 2. API Keys - For automated agents and developers
 """
 
-from typing import Optional
+import os
+import time
+from typing import Optional, Dict, Any
 from fastmcp.server.auth.providers.jwt import JWTVerifier
-from mcp.server.auth.provider import AccessToken
-from .auth import is_api_key, validate_api_key
+from fastmcp.server.auth import AccessToken
+from .auth import is_api_key, validate_api_key, hash_token, KEY_VERIFIED_CLAIM
+from .cache import TTLCache
+from .jwks import JWKSUnavailableError, JWKSVerifier
+from .key_introspection import APIKeyIntrospector
+from .log import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class DualTokenVerifier:
@@ -22,16 +31,55 @@ class DualTokenVerifier:
     - API key flow: Client provides API key directly (gdelt_sk_*)
     
     Both token types are passed as Bearer tokens in the Authorization header.
+    
+    Successful JWT verifications are cached by token hash until the
+    token's expiry (capped at `cache_ttl`), so repeat requests skip
+    signature verification. Rejected JWTs are remembered briefly as well,
+    but only when the verifier can tell a rejection from a failure to
+    check (a JWKSVerifier, or a static public key): a JWKS outage must not
+    lock valid tokens out for the negative TTL.
+    API keys are checked against the backend by an optional
+    APIKeyIntrospector, which keeps its own cache.
     """
     
-    def __init__(self, jwt_verifier: JWTVerifier):
+    def __init__(
+        self,
+        jwt_verifier: JWTVerifier,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        introspector: Optional[APIKeyIntrospector] = None
+    ):
         """
         Initialize dual token verifier.
         
         Args:
             jwt_verifier: JWTVerifier instance configured for Supabase OAuth tokens
+            cache_size: Max verified tokens kept (default from
+                GDELT_TOKEN_CACHE_SIZE, 10000; 0 disables caching)
+            cache_ttl: Max seconds a verification is reused, even if the
+                token expires later (default from GDELT_TOKEN_CACHE_TTL, 300)
+            negative_ttl: Seconds a rejected token is remembered (default
+                from GDELT_TOKEN_NEGATIVE_TTL, 30)
+            introspector: Backend validity check for API keys (default:
+                format check only)
         """
         self.jwt_verifier = jwt_verifier
+        self.introspector = introspector
+        
+        if cache_size is None:
+            cache_size = int(os.getenv('GDELT_TOKEN_CACHE_SIZE', '10000'))
+        if cache_ttl is None:
+            cache_ttl = float(os.getenv('GDELT_TOKEN_CACHE_TTL', '300'))
+        if negative_ttl is None:
+            negative_ttl = float(os.getenv('GDELT_TOKEN_NEGATIVE_TTL', '30'))
+        self.cache_ttl = cache_ttl
+        self._verified = TTLCache(max_size=cache_size, ttl=cache_ttl) if cache_size > 0 else None
+        definitive = isinstance(jwt_verifier, JWKSVerifier) or not getattr(jwt_verifier, 'jwks_uri', None)
+        self._rejected = (
+            TTLCache(max_size=cache_size, ttl=negative_ttl)
+            if cache_size > 0 and negative_ttl > 0 and definitive else None
+        )
     
     async def verify_token(self, token: str) -> Optional[AccessToken]:
         """
@@ -51,21 +99,58 @@ class DualTokenVerifier:
             return await self._verify_api_key(token)
         
         # Otherwise, treat as OAuth JWT token
-        return await self.jwt_verifier.verify_token(token)
+        key = hash_token(token) if self._verified is not None else None
+        if key is not None:
+            cached = self._verified.get(key)
+            if cached is not None:
+                if cached.expires_at is None or cached.expires_at > time.time():
+                    return cached
+                self._verified.delete(key)
+            if self._rejected is not None and key in self._rejected:
+                return None
+        
+        try:
+            access_token = await self.jwt_verifier.verify_token(token)
+        except JWKSUnavailableError as e:
+            # Could not check the token: refuse this request, remember nothing
+            logger.warning("Token not verified, signing keys unavailable: %s", e)
+            return None
+        if access_token is None:
+            if self._rejected is not None:
+                self._rejected.set(key, True)
+            return None
+        
+        if key is not None:
+            ttl = self.cache_ttl
+            if access_token.expires_at is not None:
+                ttl = min(ttl, access_token.expires_at - time.time())
+            if ttl > 0:
+                self._verified.set(key, access_token, ttl=ttl)
+        return access_token
     
-    async def _verify_api_key(self, token: str) -> AccessToken:
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get token cache and API key introspection counters."""
+        return {
+            'verified': self._verified.stats() if self._verified is not None else None,
+            'rejected': self._rejected.stats() if self._rejected is not None else None,
+            'api_keys': self.introspector.stats() if self.introspector is not None else None,
+        }
+    
+    async def _verify_api_key(self, token: str) -> Optional[AccessToken]:
         """
-        Verify API key format (actual validation happens in GDELT Cloud API).
+        Verify API key format, and validity if an introspector is configured.
         
-        The MCP server only validates the FORMAT of API keys here.
-        The actual key validity is checked by the GDELT Cloud API when
-        the MCP server forwards requests with the Bearer token.
+        Without an introspector the MCP server only validates the FORMAT of
+        API keys here, and the actual key validity is checked by the GDELT
+        Cloud API when the MCP server forwards requests with the Bearer token.
+        With one, keys the backend reports as revoked or unknown are
+        rejected up front (from cache after the first check).
         
         Args:
             token: API key to verify
         
         Returns:
-            AccessToken object with API key info
+            AccessToken object with API key info, or None if the key is invalid
             
         Raises:
             ValueError: If API key format is invalid
@@ -73,6 +158,11 @@ class DualTokenVerifier:
         if not validate_api_key(token):
             raise ValueError(f"Invalid API key format. Must be 'gdelt_sk_' + 64 hex chars")
         
+        # None means the backend could not be asked; let it decide per query
+        active = await self.introspector.check(token) if self.introspector is not None else None
+        if active is False:
+            return None
+        
         # Return AccessToken object for API keys
         # The actual user_id and permissions will be validated by GDELT Cloud API
         return AccessToken(
@@ -80,7 +170,8 @@ class DualTokenVerifier:
             client_id="api_key_client",  # Placeholder client ID for API keys
             scopes=["read", "write"],    # Default scopes for API keys
             expires_at=None,              # API keys don't expire (managed via revocation)
-            resource=None
+            resource=None,
+            claims={KEY_VERIFIED_CLAIM: True} if active else {}
         )
     
     @property
@@ -0,0 +1,101 @@
+"""
+Hedged requests for GDELT Cloud MCP Server
+Sends a backup copy of a slow query after a latency percentile and keeps
+whichever answer arrives first, within a cap on the extra load
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class HedgePolicy:
+    """
+    When to hedge, and how much extra load hedging may add.
+
+    The hedge delay is the `percentile` of recently observed query
+    latencies, so only the slowest few percent of queries get a backup
+    request. Hedges are capped at `max_ratio` of the queries sent over a
+    sliding window, so a backend that is slow across the board is not
+    flooded with duplicates.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        max_ratio: float = 0.05,
+        min_samples: int = 20,
+        sample_size: int = 512,
+        window: float = 60.0
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            percentile: Latency percentile (0-100) after which to hedge
+            min_delay: Never hedge sooner than this many seconds
+            max_ratio: Max hedges per query over the window
+            min_samples: Latencies needed before hedging starts
+            sample_size: Recent latencies kept for the percentile
+            window: Sliding window for the load cap, in seconds
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: Deque[float] = deque(maxlen=sample_size)
+        self._recent_queries: Deque[float] = deque()
+        self._recent_hedges: Deque[float] = deque()
+        self.queries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.capped = 0
+
+    def observe(self, latency: float) -> None:
+        """Record the latency of a completed query."""
+        self._latencies.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None until enough samples exist."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._recent_queries, self._recent_hedges):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_query(self) -> None:
+        """Count a query eligible for hedging."""
+        now = time.monotonic()
+        self._trim(now)
+        self._recent_queries.append(now)
+        self.queries += 1
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the load cap if available."""
+        now = time.monotonic()
+        self._trim(now)
+        if len(self._recent_hedges) + 1 > self.max_ratio * len(self._recent_queries):
+            self.capped += 1
+            return False
+        self._recent_hedges.append(now)
+        self.hedges += 1
+        return True
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Get hedge counters, the extra load ratio and the current delay."""
+        return {
+            'queries': self.queries,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'capped': self.capped,
+            'extra_load': round(self.hedges / self.queries, 4) if self.queries else 0.0,
+            'delay': self.delay(),
+        }
@@ -0,0 +1,102 @@
+"""
+JSON codec for GDELT Cloud MCP Server
+Uses the fastest available JSON library: orjson when installed, otherwise
+pydantic-core (always present with FastMCP), otherwise the stdlib
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _orjson() -> Tuple[Callable[[Union[str, bytes]], Any], Callable[[Any], bytes]]:
+    import orjson
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    return orjson.loads, dumps
+
+
+def _pydantic() -> Tuple[Callable[[Union[str, bytes]], Any], Callable[[Any], bytes]]:
+    import pydantic_core
+
+    def dumps(value: Any) -> bytes:
+        return pydantic_core.to_json(value, fallback=str)
+
+    return pydantic_core.from_json, dumps
+
+
+def _stdlib() -> Tuple[Callable[[Union[str, bytes]], Any], Callable[[Any], bytes]]:
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':'), default=str).encode('utf-8')
+
+    return json.loads, dumps
+
+
+_BACKENDS: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    'orjson': _orjson,
+    'pydantic': _pydantic,
+    'stdlib': _stdlib,
+}
+
+
+def _select(preference: str) -> Tuple[str, Callable, Callable]:
+    """Load the preferred backend, falling back in order of speed."""
+    names = list(_BACKENDS)
+    if preference in _BACKENDS:
+        names.remove(preference)
+        names.insert(0, preference)
+    elif preference != 'auto':
+        logger.warning("Unknown GDELT_JSON_CODEC '%s'. Using the fastest available codec.", preference)
+    for name in names:
+        try:
+            loads, dumps = _BACKENDS[name]()
+        except ImportError:
+            continue
+        return name, loads, dumps
+    raise RuntimeError('No JSON codec available')  # stdlib always imports
+
+
+def configure(preference: Optional[str] = None) -> str:
+    """
+    Select the backend; called at import and again once .env is loaded.
+
+    Args:
+        preference: 'auto', 'orjson', 'pydantic' or 'stdlib' (default from
+            GDELT_JSON_CODEC)
+
+    Returns:
+        Name of the backend in use
+    """
+    global BACKEND, _loads, _dumps
+    BACKEND, _loads, _dumps = _select((preference or os.getenv('GDELT_JSON_CODEC', 'auto')).lower())
+    return BACKEND
+
+
+configure()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON text or UTF-8 bytes.
+
+    Raises:
+        ValueError: If the input is not valid JSON
+    """
+    return _loads(data)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON; unknown types are converted with str()."""
+    return _dumps(value)
+
+
+def dumps(value: Any) -> str:
+    """Encode a value as compact JSON text (also FastMCP's tool result serializer)."""
+    return _dumps(value).decode('utf-8')
@@ -0,0 +1,296 @@
+"""
+JWKS key management for GDELT Cloud MCP Server
+Keeps the identity provider's signing keys in memory, fetched at startup
+and refreshed in the background, so token verification never waits on a
+key download
+"""
+
+import asyncio
+import base64
+import json
+import re
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from authlib.jose import JsonWebKey
+from fastmcp.server.auth import AccessToken
+from fastmcp.server.auth.providers.jwt import JWTVerifier
+
+from .log import get_logger
+
+
+logger = get_logger(__name__)
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+class JWKSUnavailableError(ValueError):
+    """The key set could not be fetched, so a token can be neither accepted nor rejected."""
+
+
+class JWKSManager:
+    """
+    In-memory JSON Web Key Set indexed by key ID.
+
+    Keys are fetched once at startup (`start`) and then refreshed by a
+    background task before they go stale: after the response's
+    Cache-Control max-age, or `refresh_interval` without one, scaled by
+    `refresh_ahead`. A failed refresh keeps serving the keys already held
+    and tries again after `retry_interval`.
+
+    A token signed with an unknown `kid` (e.g. right after the provider
+    rotates keys) triggers a refetch, at most once per
+    `min_refetch_interval`; concurrent lookups share that one fetch.
+    """
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        refresh_interval: float = 3600.0,
+        min_refetch_interval: float = 30.0,
+        retry_interval: float = 30.0,
+        refresh_ahead: float = 0.8,
+        timeout: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            jwks_uri: JWKS endpoint URL
+            refresh_interval: Seconds keys are considered fresh when the
+                response carries no max-age
+            min_refetch_interval: Min seconds between fetches triggered by
+                unknown key IDs
+            retry_interval: Seconds before retrying a failed refresh
+            refresh_ahead: Fraction of the freshness lifetime after which
+                the background task refreshes
+            timeout: HTTP timeout for a fetch, in seconds
+            client: HTTP client to use (default: one owned by the manager)
+        """
+        self.jwks_uri = jwks_uri
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self.retry_interval = retry_interval
+        self.refresh_ahead = refresh_ahead
+        self._client = client
+        self._owns_client = client is None
+        self._timeout = timeout
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._max_age = refresh_interval
+        self._fetch: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.fetch_errors = 0
+        self.unknown_kid_refetches = 0
+        self.unknown_kid_throttled = 0
+
+    async def start(self) -> None:
+        """Prefetch the keys and start the background refresher."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Serve anyway; lookups and the refresher will retry
+            logger.warning("Initial JWKS fetch from %s failed: %s", self.jwks_uri, e)
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresher and close the HTTP client."""
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.cancel()
+            try:
+                await refresher
+            except asyncio.CancelledError:
+                pass
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _next_refresh_in(self) -> float:
+        if self._fetched_at is None:
+            return self.retry_interval
+        due = self._fetched_at + self._max_age * self.refresh_ahead
+        return max(0.0, due - time.monotonic())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._next_refresh_in())
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("JWKS refresh from %s failed: %s", self.jwks_uri, e)
+                await asyncio.sleep(self.retry_interval)
+
+    async def refresh(self) -> None:
+        """
+        Fetch the key set now; concurrent callers share one request.
+
+        Raises:
+            httpx.HTTPError: If the endpoint cannot be reached or errors
+            ValueError: If the response is not a usable key set
+        """
+        if self._fetch is None or self._fetch.done():
+            self._fetch = asyncio.create_task(self._download())
+        fetch = self._fetch
+        try:
+            await asyncio.shield(fetch)
+        finally:
+            if self._fetch is fetch and fetch.done():
+                self._fetch = None
+
+    async def _download(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        self.fetches += 1
+        self._attempted_at = time.monotonic()
+        try:
+            response = await self._client.get(self.jwks_uri)
+            response.raise_for_status()
+            keys = self._parse(response.json())
+        except Exception:
+            self.fetch_errors += 1
+            raise
+        match = _MAX_AGE.search(response.headers.get('cache-control', ''))
+        self._max_age = float(match.group(1)) if match else self.refresh_interval
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+    @staticmethod
+    def _parse(jwks: Dict[str, Any]) -> Dict[str, Any]:
+        keys = {}
+        for key_data in jwks.get('keys', []):
+            if key_data.get('use', 'sig') != 'sig':
+                continue
+            public_key = JsonWebKey.import_key(key_data).get_public_key()
+            keys[key_data.get('kid') or '_default'] = public_key
+        if not keys:
+            raise ValueError('No signing keys found in JWKS')
+        return keys
+
+    async def get_key(self, kid: Optional[str]) -> Any:
+        """
+        Get the public key for `kid`.
+
+        Tokens without a `kid` are accepted only while the set holds a
+        single key.
+
+        Raises:
+            JWKSUnavailableError: If the key set could not be fetched, or
+                has no matching key and a refetch is throttled
+            ValueError: If a freshly fetched key set holds no matching key
+        """
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        fetching = self._fetch is not None and not self._fetch.done()
+        recent = self._attempted_at is not None and time.monotonic() - self._attempted_at < self.min_refetch_interval
+        if recent and not fetching:
+            self.unknown_kid_throttled += 1
+        else:
+            self.unknown_kid_refetches += 1
+            try:
+                await self.refresh()
+            except Exception as e:
+                raise JWKSUnavailableError(f'Failed to fetch JWKS: {e}') from e
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+
+        if not self._keys:
+            raise JWKSUnavailableError('No keys fetched from JWKS yet')
+        if recent and not fetching:
+            # Not checked against a fresh key set, so this is not a rejection
+            raise JWKSUnavailableError(
+                f"Key ID '{kid}' not in JWKS fetched {time.monotonic() - self._attempted_at:.0f}s ago; refetch throttled"
+            )
+        if kid:
+            raise ValueError(f"Key ID '{kid}' not found in JWKS")
+        raise ValueError('Multiple keys in JWKS but no key ID (kid) in token')
+
+    def _lookup(self, kid: Optional[str]) -> Any:
+        if kid:
+            return self._keys.get(kid)
+        if len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get key count, freshness and fetch counters."""
+        return {
+            'keys': len(self._keys),
+            'age': round(time.monotonic() - self._fetched_at, 1) if self._fetched_at is not None else None,
+            'max_age': self._max_age,
+            'fetches': self.fetches,
+            'fetch_errors': self.fetch_errors,
+            'unknown_kid_refetches': self.unknown_kid_refetches,
+            'unknown_kid_throttled': self.unknown_kid_throttled,
+        }
+
+
+def _token_kid(token: str) -> Optional[str]:
+    """
+    Read the key ID from a JWT's header.
+
+    Raises:
+        ValueError: If the token has no decodable header
+    """
+    try:
+        header_b64 = token.split('.')[0]
+        header = json.loads(base64.urlsafe_b64decode(header_b64 + '=' * (-len(header_b64) % 4)))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Malformed token header') from e
+    if not isinstance(header, dict):
+        raise ValueError('Malformed token header')
+    return header.get('kid')
+
+
+class JWKSVerifier(JWTVerifier):
+    """
+    JWTVerifier that looks keys up in a JWKSManager instead of fetching per request.
+
+    Unlike JWTVerifier, which answers None for every failure, a token that
+    cannot be checked because the key set is unavailable raises
+    JWKSUnavailableError, so callers can tell it from a rejected token.
+    """
+
+    def __init__(self, jwks: JWKSManager, **kwargs: Any):
+        """
+        Initialize verifier.
+
+        Args:
+            jwks: Key manager for the issuer's JWKS endpoint
+            **kwargs: issuer, audience, algorithm, etc. as for JWTVerifier
+        """
+        super().__init__(jwks_uri=jwks.jwks_uri, **kwargs)
+        self.jwks = jwks
+
+    async def verify_token(self, token: str) -> Optional[AccessToken]:
+        """
+        Verify a JWT against the managed key set.
+
+        Returns:
+            AccessToken if valid, None if the token is rejected (malformed,
+            unknown key, bad signature, expired, wrong issuer or audience)
+
+        Raises:
+            JWKSUnavailableError: If the key set could not be fetched
+        """
+        try:
+            await self.jwks.get_key(_token_kid(token))
+        except JWKSUnavailableError:
+            raise
+        except ValueError:
+            return None
+        # The key is in memory now, so the lookup during verification is a dict read
+        return await super().verify_token(token)
+
+    # Private JWTVerifier hook; test_verifier_reads_keys_through_the_manager
+    # fails if fastmcp stops calling it
+    async def _get_jwks_key(self, kid: Optional[str]) -> Any:
+        return await self.jwks.get_key(kid)
@@ -0,0 +1,125 @@
+"""
+API key introspection for GDELT Cloud MCP Server
+Checks gdelt_sk_ keys against the GDELT Cloud API once and remembers the
+answer, so revoked or unknown keys are rejected without a backend round-trip
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .auth import hash_token
+from .cache import TTLCache
+from .single_flight import SingleFlight
+
+
+class APIKeyIntrospector:
+    """
+    Cached validity check for API keys.
+
+    The key is sent as a Bearer token to the introspection endpoint: a 200
+    response means the key is active (unless its JSON body says
+    ``"active": false``), 401/403 means it is not. Both answers are cached
+    under the key's SHA-256 hash, never the key itself; valid keys for
+    `ttl` seconds, which bounds how long a revoked key keeps working, and
+    invalid keys for `negative_ttl`. Concurrent checks of the same key
+    share one request.
+
+    Any other outcome (network error, timeout, 5xx) is not cached and
+    reported as unknown, leaving the decision to the backend on the
+    actual query, so an introspection outage does not lock users out.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl: float = 60.0,
+        negative_ttl: float = 300.0,
+        max_size: int = 10000,
+        timeout: float = 3.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize introspector.
+
+        Args:
+            url: Introspection endpoint URL
+            ttl: Seconds a valid key is trusted without rechecking
+            negative_ttl: Seconds an invalid key is rejected locally
+            max_size: Max cached keys per result kind
+            timeout: HTTP timeout for a check, in seconds
+            client: HTTP client to use (default: one owned by the introspector)
+        """
+        self.url = url
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._valid = TTLCache(max_size=max_size, ttl=ttl)
+        self._invalid = TTLCache(max_size=max_size, ttl=negative_ttl)
+        self._inflight = SingleFlight()
+        self._client = client
+        self._owns_client = client is None
+        self._timeout = timeout
+        self.checks = 0
+        self.errors = 0
+
+    async def check(self, api_key: str) -> Optional[bool]:
+        """
+        Check whether an API key is active.
+
+        Args:
+            api_key: Well-formed gdelt_sk_ key
+
+        Returns:
+            True if active, False if revoked or unknown to the backend,
+            None if the backend could not be asked
+        """
+        key = hash_token(api_key)
+        if self._valid.get(key) is not None:
+            return True
+        if self._invalid.get(key) is not None:
+            return False
+        return await self._inflight.do(key, lambda: self._introspect(key, api_key))
+
+    async def _introspect(self, key: str, api_key: str) -> Optional[bool]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        self.checks += 1
+        try:
+            response = await self._client.post(self.url, headers={'Authorization': f'Bearer {api_key}'})
+        except httpx.HTTPError:
+            self.errors += 1
+            return None
+
+        if response.status_code in (401, 403):
+            active = False
+        elif response.status_code == 200:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            active = not isinstance(body, dict) or body.get('active', True) is not False
+        else:
+            self.errors += 1
+            return None
+
+        if active:
+            self._valid.set(key, True)
+        else:
+            self._invalid.set(key, True)
+        return active
+
+    async def close(self) -> None:
+        """Close the HTTP client if owned."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get check counters and cache stats."""
+        return {
+            'checks': self.checks,
+            'errors': self.errors,
+            'valid': self._valid.stats(),
+            'invalid': self._invalid.stats(),
+            'coalesced': self._inflight.stats()['collapsed'],
+        }
@@ -0,0 +1,158 @@
+"""
+Logging for GDELT Cloud MCP Server
+Structured, level-gated logging that never blocks a request on stderr
+writes and never lets a bearer token reach the output
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+
+ROOT = 'gdelt_cloud'
+
+# Tokens that must never be written out: API keys, JWTs, bearer headers
+_SECRETS = re.compile(
+    r'gdelt_sk_[0-9A-Za-z]+'
+    r'|eyJ[\w-]+\.[\w-]+\.[\w-]*'
+    r'|(?<=Bearer )[^\s"\',]+',
+    re.IGNORECASE
+)
+REDACTED = '[REDACTED]'
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_FIELDS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger under the server's namespace.
+
+    The logger scrubs secrets from its records itself, so whatever
+    handlers end up writing them (configure_logging's, a script's
+    basicConfig, pytest's capture) never see a token.
+
+    Args:
+        name: Module name, normally __name__
+    """
+    logger = logging.getLogger(f'{ROOT}.{name}')
+    logger.addFilter(_redacting_filter)  # no-op if already attached
+    return logger
+
+
+def redact(text: str) -> str:
+    """Replace API keys, JWTs and bearer tokens in `text`."""
+    # Substring checks are far cheaper than the regex; most lines have no secret
+    if 'gdelt_sk_' in text or 'eyJ' in text or 'earer ' in text or 'EARER ' in text:
+        return _SECRETS.sub(REDACTED, text)
+    return text
+
+
+def _extras(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_FIELDS}
+
+
+class RedactingFilter(logging.Filter):
+    """
+    Scrub secrets from a record before it leaves the calling thread.
+
+    The message is rendered once here (so arguments are not formatted
+    again later); string `extra` fields, the traceback and the stack are
+    scrubbed too. Logger filters do not apply to records from child
+    loggers, so get_logger attaches one to every logger it returns.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            # Formatters use exc_text as is once it is set
+            record.exc_text = redact(logging.Formatter().formatException(record.exc_info))
+        if record.stack_info:
+            record.stack_info = redact(record.stack_info)
+        fields = vars(record)
+        for key in fields.keys() - _RECORD_FIELDS:
+            if isinstance(fields[key], str):
+                fields[key] = redact(fields[key])
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        entry.update(_extras(record))
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines with `extra` fields appended as key=value."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = ' '.join(f'{key}={value}' for key, value in _extras(record).items())
+        return f'{line} {fields}' if fields else line
+
+
+_redacting_filter = RedactingFilter()
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the listener thread; the logger's filter has
+        # already rendered (and scrubbed) any traceback. This is the sole
+        # handler, so the record is handed over as is rather than copied.
+        record.exc_info = None
+        return record
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> None:
+    """
+    Route the server's logs through a background writer.
+
+    Records are redacted (by their logger, see get_logger) and put on an
+    in-memory queue by the calling thread; a listener thread formats and writes them to stderr (stdout
+    carries the MCP stdio transport). Records below the level are
+    dropped by the logger before any formatting happens.
+
+    Args:
+        level: Minimum level (default from GDELT_LOG_LEVEL, INFO)
+        fmt: 'json' or 'text' (default from GDELT_LOG_FORMAT, json)
+    """
+    global _listener
+    level = (level or os.getenv('GDELT_LOG_LEVEL', 'INFO')).upper()
+    fmt = (fmt or os.getenv('GDELT_LOG_FORMAT', 'json')).lower()
+
+    root = logging.getLogger(ROOT)
+    root.setLevel(level)
+    root.propagate = False
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(JSONFormatter() if fmt == 'json' else TextFormatter())
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(_QueueHandler(records))
+
+    _listener = QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -0,0 +1,189 @@
+"""
+Keyset pagination for GDELT Cloud MCP Server
+Opaque continuation cursors over (date, record id) ordering, plus a small
+store of prefetched next pages
+"""
+
+import base64
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .range_split import select_outputs
+
+
+# Keyset ordering per table: (date column, unique id column, id is numeric)
+PAGE_KEYS = {
+    'gdelt_events': ('day', 'global_event_id', True),
+    'gdelt_gkg': ('date', 'gkg_record_id', False),
+}
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode pagination state as an opaque URL-safe token."""
+    raw = json.dumps(state, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a token produced by encode_cursor.
+
+    Cursors are not signed, so a caller can hand back any state; every
+    field is type-checked and page_size is clamped to 1..MAX_PAGE_SIZE, as
+    for a first page.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(state, dict) or state.get('table') not in PAGE_KEYS:
+        raise ValueError('Invalid cursor')
+
+    page_size = state.get('page_size')
+    after = state.get('after')
+    if (
+        not isinstance(page_size, int) or isinstance(page_size, bool)
+        or not isinstance(state.get('where'), (str, type(None)))
+        or not isinstance(state.get('select'), (str, type(None)))
+        or not (after is None or _is_key(after))
+    ):
+        raise ValueError('Invalid cursor')
+    state['page_size'] = max(1, min(page_size, MAX_PAGE_SIZE))
+    return state
+
+
+def _is_key(after: Any) -> bool:
+    """Whether `after` is a (date, id) pair of scalars."""
+    return (
+        isinstance(after, list) and len(after) == 2
+        and all(isinstance(value, (str, int)) and not isinstance(value, bool) for value in after)
+    )
+
+
+def _quote(value: str) -> str:
+    """Quote a string literal for ClickHouse."""
+    escaped = str(value).replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _literal(table: str, column: str, value: Any) -> str:
+    """SQL literal for a keyset value."""
+    date_column, id_column, numeric_id = PAGE_KEYS[table]
+    if column == id_column and numeric_id:
+        return str(int(value))
+    if column == date_column and table == 'gdelt_gkg':
+        return f"toDateTime({_quote(value)})"
+    return _quote(value)
+
+
+def page_select_fields(table: str, select_fields: str) -> str:
+    """Ensure the keyset columns are part of the selected fields."""
+    outputs = select_outputs(select_fields)
+    if outputs is None:
+        return select_fields
+    date_column, id_column, _ = PAGE_KEYS[table]
+    missing = [column for column in (date_column, id_column) if column not in outputs]
+    return ', '.join(missing + [select_fields]) if missing else select_fields
+
+
+def build_page_query(
+    table: str,
+    where_clause: Optional[str],
+    select_fields: str,
+    page_size: int,
+    after: Optional[Tuple[Any, Any]] = None
+) -> str:
+    """
+    Build the query for one page, newest first.
+
+    Rows are ordered by (date column, id column) descending; `after` is the
+    key of the last row of the previous page. One extra row is requested to
+    tell whether another page exists.
+
+    Args:
+        table: 'gdelt_events' or 'gdelt_gkg'
+        where_clause: SQL WHERE clause (without WHERE keyword)
+        select_fields: Comma-separated field names
+        page_size: Rows per page (1-1000)
+        after: (date, id) key to continue after, or None for the first page
+
+    Returns:
+        SQL query string
+    """
+    date_column, id_column, _ = PAGE_KEYS[table]
+    conditions = []
+    if where_clause:
+        conditions.append(f"({where_clause})")
+    if after is not None:
+        last_date = _literal(table, date_column, after[0])
+        last_id = _literal(table, id_column, after[1])
+        conditions.append(
+            f"({date_column} < {last_date} OR "
+            f"({date_column} = {last_date} AND {id_column} < {last_id}))"
+        )
+
+    query = f"SELECT {page_select_fields(table, select_fields)} FROM {table}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" ORDER BY {date_column} DESC, {id_column} DESC LIMIT {page_size + 1}"
+    return query
+
+
+def next_cursor(state: Dict[str, Any], rows: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Cursor for the page following `rows`, or None if it was the last page.
+
+    Args:
+        state: Pagination state of the current page
+        rows: Rows returned for the page (including the look-ahead row)
+    """
+    if len(rows) <= state['page_size']:
+        return None
+    date_column, id_column, _ = PAGE_KEYS[state['table']]
+    last = rows[state['page_size'] - 1]
+    return encode_cursor({**state, 'after': [last[date_column], last[id_column]]})
+
+
+class PrefetchStore:
+    """
+    Short-lived store of next pages fetched in the background.
+
+    Entries are keyed by caller scope and cursor, expire after `ttl`
+    seconds, and are consumed on first use.
+    """
+
+    def __init__(self, ttl: float = 120.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._pages: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, key: Tuple[str, str], page: Any) -> None:
+        """Store a prefetched page."""
+        now = time.monotonic()
+        if len(self._pages) >= self.max_entries:
+            self._pages = {k: v for k, v in self._pages.items() if v[0] > now}
+            if len(self._pages) >= self.max_entries:
+                self._pages.pop(next(iter(self._pages)))
+        self._pages[key] = (now + self.ttl, page)
+
+    def pop(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Take a prefetched page if present and fresh."""
+        entry = self._pages.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def stats(self) -> Dict[str, int]:
+        """Get prefetch hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._pages)}
@@ -0,0 +1,178 @@
+"""
+Date range splitting for GDELT Cloud MCP Server
+Splits a query's date window into sub-ranges that can run in parallel,
+and merges the partial results back into one ordered, limited result
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .sql import tokenize_sql
+
+
+SPLIT_UNITS = ('day', 'week', 'month')
+
+# Aggregates combine rows across the whole window, so their per-range
+# results cannot simply be concatenated
+AGGREGATE_FUNCTIONS = frozenset({
+    'any', 'anylast', 'argmax', 'argmin', 'avg', 'count', 'groupuniqarray',
+    'grouparray', 'max', 'median', 'min', 'quantile', 'quantiles', 'stddevpop',
+    'stddevsamp', 'sum', 'topk', 'uniq', 'uniqexact', 'varpop', 'varsamp',
+})
+
+
+def split_window(start: date, end: date, unit: str) -> List[Tuple[date, date]]:
+    """
+    Split an inclusive day range into calendar-aligned sub-ranges.
+
+    Weeks start on Monday and months on the 1st, so the interior ranges of
+    overlapping windows come out identical (and hit the same cache entries);
+    only the first and last ranges are clipped to the window.
+
+    Args:
+        start: First day of the window
+        end: Last day of the window
+        unit: 'day', 'week' or 'month'
+
+    Returns:
+        List of (first day, last day) pairs in ascending order
+    """
+    if unit not in SPLIT_UNITS:
+        raise ValueError(f"Invalid split unit '{unit}'. Use one of: {', '.join(SPLIT_UNITS)}")
+
+    ranges = []
+    current = start
+    while current <= end:
+        if unit == 'day':
+            range_end = current
+        elif unit == 'week':
+            range_end = current + timedelta(days=6 - current.weekday())
+        else:
+            next_month = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+            range_end = next_month - timedelta(days=1)
+        range_end = min(range_end, end)
+        ranges.append((current, range_end))
+        current = range_end + timedelta(days=1)
+    return ranges
+
+
+def range_predicate(table: str, first: date, last: date) -> str:
+    """
+    Build the WHERE condition restricting a query to [first, last].
+
+    Args:
+        table: 'gdelt_events' (Date column `day`) or 'gdelt_gkg' (DateTime column `date`)
+        first: First day (inclusive)
+        last: Last day (inclusive)
+
+    Returns:
+        SQL condition string
+    """
+    if table == 'gdelt_gkg':
+        following = last + timedelta(days=1)
+        return (
+            f"date >= toDateTime('{first.isoformat()} 00:00:00') "
+            f"AND date < toDateTime('{following.isoformat()} 00:00:00')"
+        )
+    return f"day BETWEEN '{first.isoformat()}' AND '{last.isoformat()}'"
+
+
+def _split_top_level(tokens: List[Tuple[str, str]], separator: str) -> List[List[Tuple[str, str]]]:
+    """Split tokens on a separator that is not nested in parentheses."""
+    parts: List[List[Tuple[str, str]]] = [[]]
+    depth = 0
+    for token in tokens:
+        if token[1] == '(':
+            depth += 1
+        elif token[1] == ')':
+            depth -= 1
+        elif depth == 0 and token[1] == separator:
+            parts.append([])
+            continue
+        parts[-1].append(token)
+    return parts
+
+
+def select_is_splittable(select_fields: str) -> bool:
+    """Check that a select list produces plain rows (no aggregates or DISTINCT)."""
+    tokens = tokenize_sql(select_fields)
+    for i, (kind, text) in enumerate(tokens):
+        if kind != 'word':
+            continue
+        if text.upper() == 'DISTINCT':
+            return False
+        is_call = i + 1 < len(tokens) and tokens[i + 1][1] == '('
+        if is_call and text.lower() in AGGREGATE_FUNCTIONS:
+            return False
+    return True
+
+
+def select_outputs(select_fields: str) -> Optional[Set[str]]:
+    """
+    Get the column names a select list returns.
+
+    Returns:
+        Set of output names, or None when the list contains `*`
+    """
+    outputs = set()
+    for item in _split_top_level(tokenize_sql(select_fields), ','):
+        if not item:
+            continue
+        if item[-1][1] == '*':
+            return None
+        if item[-1][0] == 'word':
+            outputs.add(item[-1][1])
+    return outputs
+
+
+def parse_order_by(order_by: str) -> Optional[List[Tuple[str, bool]]]:
+    """
+    Parse an ORDER BY clause made of plain column names.
+
+    Args:
+        order_by: ORDER BY clause (without ORDER BY keyword)
+
+    Returns:
+        List of (column, descending) pairs, or None if the clause uses
+        expressions that cannot be evaluated on result rows
+    """
+    order = []
+    for item in _split_top_level(tokenize_sql(order_by), ','):
+        words = [text for kind, text in item if kind == 'word']
+        if len(words) != len(item) or not 1 <= len(words) <= 2:
+            return None
+        descending = False
+        if len(words) == 2:
+            direction = words[1].upper()
+            if direction not in ('ASC', 'DESC'):
+                return None
+            descending = direction == 'DESC'
+        order.append((words[0], descending))
+    return order or None
+
+
+def merge_rows(
+    parts: List[List[Dict[str, Any]]],
+    order: List[Tuple[str, bool]],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-range result rows, re-applying ORDER BY and LIMIT.
+
+    Args:
+        parts: Row lists from each sub-range query
+        order: Parsed ORDER BY as (column, descending) pairs
+        limit: Maximum rows to return
+
+    Returns:
+        Merged rows
+    """
+    rows = [row for part in parts for row in part]
+    # Stable sorts applied from the least to the most significant key;
+    # NULLs sort last like ClickHouse's default
+    for column, descending in reversed(order):
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=lambda row: row[column], reverse=descending)
+        rows = present + missing
+    return rows[:limit]
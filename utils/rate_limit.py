@@ -0,0 +1,158 @@
+"""
+Rate limiting for GDELT Cloud MCP Server
+Token buckets per caller identity and tool, enforced as FastMCP middleware
+before any backend work
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from .auth import get_caller_identity
+
+
+# Tool name -> (requests per minute, burst). '*' applies to every other tool.
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    'query_gdelt_gkg': (12, 4),
+    'query_gdelt_events': (30, 10),
+    'query_gdelt_time_series': (20, 5),
+    'query_gdelt_pages': (60, 10),
+    '*': (120, 30),
+}
+
+
+def parse_limits(spec: Optional[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse per-tool limits, e.g. 'query_gdelt_gkg=12/4,*=120/30'.
+
+    Each entry is tool=requests_per_minute/burst; entries override
+    DEFAULT_LIMITS. A rate of 0 disables limiting for that tool.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits = dict(DEFAULT_LIMITS)
+    if not spec:
+        return limits
+    for entry in spec.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            tool, values = entry.split('=', 1)
+            rate, _, burst = values.partition('/')
+            per_minute = float(rate)
+            limits[tool.strip()] = (per_minute, float(burst) if burst else max(1.0, per_minute))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit '{entry}'. Use tool=requests_per_minute/burst") from None
+    return limits
+
+
+class RateLimitBackend:
+    """Storage for token buckets."""
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        Take `cost` tokens from the bucket at `key`.
+
+        Args:
+            key: Bucket identity (caller and tool)
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+            cost: Tokens this call needs
+
+        Returns:
+            (allowed, seconds until enough tokens are available)
+        """
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets in process memory.
+
+    Each bucket is a (tokens, last refill time, seconds to refill from
+    empty) triple refilled lazily on access, so a check is O(1). Buckets
+    that have refilled completely carry no state and are dropped once the
+    table reaches `max_keys`.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float]:
+        now = time.monotonic()
+        tokens, last, _ = self._buckets.get(key, (burst, now, 0.0))
+        tokens = min(burst, tokens + (now - last) * rate)
+        # Each tool has its own rate and burst, so the refill time is per bucket
+        full_after = burst / rate if rate > 0 else float('inf')
+        if tokens >= cost:
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            self._buckets[key] = (tokens - cost, now, full_after)
+            return True, 0.0
+        self._buckets[key] = (tokens, now, full_after)
+        return False, (cost - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that would be full again anyway."""
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if now - bucket[1] < bucket[2]
+        }
+
+
+class RateLimitMiddleware(Middleware):
+    """
+    Reject tool calls beyond the caller's per-tool rate.
+
+    Callers are identified by their verified identity (JWT `sub` or API
+    key hash). Rejected calls return ``{"error": ...}`` like other tool
+    failures, without running the tool.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        backend: Optional[RateLimitBackend] = None
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            limits: Tool name -> (requests per minute, burst) (default DEFAULT_LIMITS)
+            backend: Bucket storage (default in-memory)
+        """
+        self.limits = limits if limits is not None else dict(DEFAULT_LIMITS)
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.allowed = 0
+        self.rejected = 0
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        tool = context.message.name
+        per_minute, burst = self.limits.get(tool, self.limits.get('*', (0, 0)))
+        if per_minute <= 0:
+            return await call_next(context)
+
+        identity = get_caller_identity() or 'anonymous'
+        allowed, retry_after = await self.backend.take(f"{identity}:{tool}", per_minute / 60.0, burst)
+        if not allowed:
+            self.rejected += 1
+            error = {
+                "error": f"Rate limit exceeded for {tool}. Please retry in {max(1, round(retry_after))}s."
+            }
+            return ToolResult(structured_content=error)
+        self.allowed += 1
+        return await call_next(context)
+
+    def stats(self) -> Dict[str, int]:
+        """Get allowed/rejected call counters."""
+        return {'allowed': self.allowed, 'rejected': self.rejected}
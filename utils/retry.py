@@ -0,0 +1,156 @@
+"""
+Retries for GDELT Cloud MCP Server
+Jittered exponential backoff for transient backend failures, bounded by a
+retry budget so retries cannot amplify an outage
+"""
+
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Optional
+
+import httpx
+
+
+# Network failures where the request may not have reached the backend, or
+# the connection dropped mid-response; safe to repeat for SELECTs
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before repeating a failed request.
+
+    Delays use "full jitter": a random wait between 0 and the exponential
+    backoff for the attempt, so clients that failed together do not retry
+    together. A server-provided Retry-After is honored as the minimum
+    wait; if it exceeds `max_delay` the request is not retried at all.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        retry_statuses: tuple = (429, 502, 503, 504)
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            base_delay: Backoff before the first retry, in seconds
+            max_delay: Cap on any single wait, in seconds
+            retry_statuses: HTTP statuses treated as transient
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Wait before retrying after failed attempt number `attempt` (0-based).
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is None:
+            return backoff
+        if retry_after > self.max_delay:
+            return None
+        return max(retry_after, backoff)
+
+
+class RetryBudget:
+    """
+    Cap retries to a fraction of recent traffic.
+
+    Over a sliding window, retries are allowed while they stay below
+    `ratio` times the number of requests, plus a small floor of
+    `min_per_second` so low-traffic clients can still retry. During an
+    outage every request fails, the budget runs out, and the client goes
+    back to one attempt per request instead of multiplying load.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, window: float = 10.0):
+        """
+        Initialize budget.
+
+        Args:
+            ratio: Retries allowed per request over the window
+            min_per_second: Retries always allowed per second
+            window: Sliding window length in seconds
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.retries = 0
+        self.exhausted = 0
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Count a new (first-attempt) request."""
+        now = time.monotonic()
+        self._trim(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the budget if available."""
+        now = time.monotonic()
+        self._trim(now)
+        allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            self.exhausted += 1
+            return False
+        self._retries.append(now)
+        self.retries += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Get retry counters."""
+        return {
+            'retries': self.retries,
+            'budget_exhausted': self.exhausted,
+            'window_requests': len(self._requests),
+            'window_retries': len(self._retries),
+        }
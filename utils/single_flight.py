@@ -0,0 +1,60 @@
+"""
+Request coalescing for GDELT Cloud MCP Server
+Collapses concurrent identical backend calls into a single in-flight request
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Share one execution among concurrent callers with the same key.
+
+    The first caller for a key starts the work as its own task; callers
+    arriving while it is in flight await that same task and receive the
+    same result (or exception). Cancelling one awaiter does not cancel
+    the shared work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` for `key`, or join the execution already in flight.
+
+        Args:
+            key: Identity of the call (callers with equal keys are merged)
+            fn: Coroutine function performing the work
+
+        Returns:
+            Result of the shared execution
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.collapsed += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a completed execution."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every awaiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Get executed vs. collapsed call counters."""
+        return {
+            'executions': self.executions,
+            'collapsed': self.collapsed,
+            'in_flight': len(self._inflight),
+        }
@@ -0,0 +1,453 @@
+"""
+SQL helpers for GDELT Cloud MCP Server
+Lightweight tokenizing, normalization and date-predicate analysis of the
+SELECT queries this server sends to ClickHouse
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+
+# Date column used for partition filters on each GDELT table
+DATE_COLUMNS = {
+    'gdelt_events': 'day',
+    'gdelt_gkg': 'date',
+}
+
+# SQL keywords that are case-insensitive in ClickHouse. Column names such as
+# `day` or `date` are deliberately absent: identifiers are case-sensitive.
+SQL_KEYWORDS = frozenset({
+    'ALL', 'AND', 'ANY', 'AS', 'ASC', 'BETWEEN', 'BY', 'CASE', 'CAST', 'CROSS',
+    'DESC', 'DISTINCT', 'ELSE', 'END', 'EXISTS', 'FALSE', 'FINAL', 'FIRST',
+    'FROM', 'FULL', 'GLOBAL', 'GROUP', 'HAVING', 'ILIKE', 'IN', 'INNER',
+    'INTERVAL', 'IS', 'JOIN', 'LAST', 'LEFT', 'LIKE', 'LIMIT', 'NOT', 'NULL',
+    'NULLS', 'OFFSET', 'ON', 'OR', 'ORDER', 'OUTER', 'PREWHERE', 'RIGHT',
+    'SAMPLE', 'SELECT', 'THEN', 'TRUE', 'UNION', 'USING', 'WHEN', 'WHERE',
+    'WITH',
+})
+
+_SQL_TOKEN = re.compile(r"""
+      (?P<ws>\s+)
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^'\\]|\\.|'')*')
+    | (?P<quoted>"(?:[^"\\]|\\.)*"|`(?:[^`\\]|\\.)*`)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<op><=|>=|!=|<>|==|\|\||::|->|.)
+""", re.VERBOSE | re.DOTALL)
+
+
+def tokenize_sql(query: str) -> List[Tuple[str, str]]:
+    """
+    Split a SQL query into (kind, text) tokens, dropping whitespace and comments.
+
+    Kinds are 'string', 'quoted', 'number', 'word' and 'op'.
+    """
+    return [
+        (match.lastgroup, match.group())
+        for match in _SQL_TOKEN.finditer(query)
+        if match.lastgroup not in ('ws', 'comment')
+    ]
+
+
+def _canonical_string(literal: str) -> str:
+    """
+    Re-quote a single-quoted SQL string literal in one canonical form.
+
+    Only the two spellings of a quote ('' and \\') are unified. Backslash
+    sequences are kept as written: ClickHouse gives many of them a meaning
+    of their own (\\n, \\t, \\0, \\xHH, ...), so '\\n' and 'n' must not
+    share a cache key.
+    """
+    body = literal[1:-1]
+    value = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == '\\' and i + 1 < len(body):
+            value.append(body[i:i + 2])
+            i += 2
+        elif char == "'" and body[i + 1:i + 2] == "'":
+            value.append("\\'")
+            i += 2
+        else:
+            value.append(char)
+            i += 1
+    return "'" + ''.join(value) + "'"
+
+
+def _canonical_number(literal: str) -> str:
+    """Format a numeric literal canonically (integers stay integers)."""
+    try:
+        if any(c in literal for c in '.eE'):
+            return repr(float(literal))
+        return str(int(literal))
+    except ValueError:
+        return literal
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Normalize a SQL query into a canonical form for use as a cache key.
+
+    Whitespace and comments are collapsed, keywords are upper-cased, and
+    string/number literals are re-formatted canonically, so queries that
+    differ only cosmetically map to the same key. Identifiers are left
+    untouched because they are case-sensitive in ClickHouse.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Normalized query string
+    """
+    tokens = []
+    for kind, text in tokenize_sql(query):
+        if kind == 'string':
+            text = _canonical_string(text)
+        elif kind == 'number':
+            text = _canonical_number(text)
+        elif kind == 'word' and text.upper() in SQL_KEYWORDS:
+            text = text.upper()
+        tokens.append(text)
+    return ' '.join(tokens)
+
+
+@dataclass
+class DateWindow:
+    """Range of days a query's date predicate can match (inclusive bounds)"""
+    table: str
+    column: str
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+
+# Keywords that end the WHERE clause of a SELECT
+_WHERE_END = frozenset({'GROUP', 'HAVING', 'ORDER', 'LIMIT', 'SETTINGS', 'UNION', 'FORMAT'})
+_DATE_FUNCTIONS = frozenset({'toDate', 'toDateTime', 'toDateTime64'})
+_FLIPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '=': '=', '==': '='}
+
+Token = Tuple[str, str]
+
+
+def _is_word(token: Token, word: str) -> bool:
+    return token[0] == 'word' and token[1].upper() == word
+
+
+def _find_table_and_where(tokens: List[Token]) -> Tuple[Optional[str], List[Token]]:
+    """Locate the top-level FROM table and WHERE clause tokens."""
+    depth = 0
+    table = None
+    where_start = None
+    for i, token in enumerate(tokens):
+        text = token[1]
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+        elif depth == 0 and token[0] == 'word':
+            keyword = text.upper()
+            if keyword == 'FROM' and table is None and i + 1 < len(tokens):
+                table = tokens[i + 1][1]
+                # Database-qualified name: db.table
+                if i + 3 < len(tokens) and tokens[i + 2][1] == '.':
+                    table = tokens[i + 3][1]
+            elif keyword == 'WHERE' and where_start is None:
+                where_start = i + 1
+            elif keyword in _WHERE_END and where_start is not None:
+                return table, tokens[where_start:i]
+    if where_start is None:
+        return table, []
+    return table, tokens[where_start:]
+
+
+def _is_wrapped(tokens: List[Token]) -> bool:
+    """Check whether a token list is one parenthesized group."""
+    if len(tokens) < 2 or tokens[0][1] != '(' or tokens[-1][1] != ')':
+        return False
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token[1] == '(':
+            depth += 1
+        elif token[1] == ')':
+            depth -= 1
+            if depth == 0 and i < len(tokens) - 1:
+                return False
+    return True
+
+
+def split_conjuncts(tokens: List[Token]) -> List[List[Token]]:
+    """
+    Split a WHERE clause into its top-level AND-ed conditions.
+
+    Every returned condition must hold for a row to match, so bounds read
+    from any one of them are safe to apply. Parenthesized AND groups are
+    flattened; a clause or group joined by OR is kept whole as a single
+    condition. Together the conditions are equivalent to the clause.
+    """
+    parts: List[List[Token]] = [[]]
+    depth = 0
+    in_between = False
+    for token in tokens:
+        if token[1] == '(':
+            depth += 1
+        elif token[1] == ')':
+            depth -= 1
+        elif depth == 0 and token[0] == 'word':
+            keyword = token[1].upper()
+            if keyword == 'OR':
+                return [tokens] if tokens else []
+            if keyword == 'BETWEEN':
+                in_between = True
+            elif keyword == 'AND':
+                if in_between:
+                    in_between = False
+                else:
+                    parts.append([])
+                    continue
+        parts[-1].append(token)
+
+    conjuncts = []
+    for part in parts:
+        if _is_wrapped(part):
+            conjuncts.extend(split_conjuncts(part[1:-1]))
+        elif part:
+            conjuncts.append(part)
+    return conjuncts
+
+
+def join_tokens(tokens: List[Token]) -> str:
+    """Render tokens back into SQL text."""
+    parts = []
+    previous: Optional[Token] = None
+    for kind, text in tokens:
+        if previous is not None:
+            prev_kind, prev_text = previous
+            glued = (
+                text in (')', ',', '.')
+                or prev_text in ('(', '.')
+                or (text == '(' and prev_kind == 'word' and prev_text.upper() not in SQL_KEYWORDS)
+            )
+            if not glued:
+                parts.append(' ')
+        parts.append(text)
+        previous = (kind, text)
+    return ''.join(parts)
+
+
+def _parse_temporal(text: str) -> Optional[datetime]:
+    """Parse 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS' string literal content."""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _match_column(tokens: List[Token], i: int, column: str) -> Optional[Tuple[int, bool]]:
+    """
+    Match `column` or `toDate(column)` at position i.
+
+    Returns:
+        (next index, whether the expression is a whole-day Date value),
+        or None if there is no match
+    """
+    if i < len(tokens) and tokens[i] == ('word', column):
+        return i + 1, column == 'day'
+    if (
+        i + 3 < len(tokens)
+        and tokens[i] == ('word', 'toDate')
+        and tokens[i + 1][1] == '('
+        and tokens[i + 2] == ('word', column)
+        and tokens[i + 3][1] == ')'
+    ):
+        return i + 4, True
+    return None
+
+
+def _match_value(tokens: List[Token], i: int) -> Optional[Tuple[datetime, int]]:
+    """Match a date literal ('...' or toDate/toDateTime('...')); return it and the next index."""
+    if i < len(tokens) and tokens[i][0] == 'string':
+        value = _parse_temporal(tokens[i][1][1:-1])
+        return (value, i + 1) if value else None
+    if (
+        i + 3 < len(tokens)
+        and tokens[i][0] == 'word'
+        and tokens[i][1] in _DATE_FUNCTIONS
+        and tokens[i + 1][1] == '('
+        and tokens[i + 2][0] == 'string'
+    ):
+        value = _parse_temporal(tokens[i + 2][1][1:-1])
+        # Skip optional extra arguments (precision, timezone) up to ')'
+        j = i + 3
+        while j < len(tokens) and tokens[j][1] != ')':
+            j += 1
+        if value and j < len(tokens):
+            return value, j + 1
+    return None
+
+
+# (first day, last day, exact): `exact` means the condition matches
+# precisely the whole days from first to last, nothing more or less
+Bounds = Tuple[Optional[date], Optional[date], bool]
+_NO_BOUNDS: Bounds = (None, None, False)
+
+
+def _comparison_bounds(op: str, value: datetime, day_typed: bool) -> Bounds:
+    """Bounds implied by `<date expression> op value`."""
+    day = value.date()
+    midnight = value.time() == time.min
+    one_day = timedelta(days=1)
+
+    if day_typed and midnight:
+        # Whole-day Date comparisons are exact
+        if op in ('=', '=='):
+            return day, day, True
+        if op == '>=':
+            return day, None, True
+        if op == '>':
+            return day + one_day, None, True
+        if op == '<=':
+            return None, day, True
+        return None, day - one_day, True
+
+    # DateTime comparisons: only midnight >= and < cover whole days
+    if op in ('=', '=='):
+        return day, day, False
+    if op in ('>', '>='):
+        return day, None, op == '>=' and midnight
+    if op == '<' and midnight:
+        return None, day - one_day, True
+    return None, day, False
+
+
+def _conjunct_bounds(tokens: List[Token], column: str) -> Bounds:
+    """Read the day bounds implied by one condition, if any."""
+    matched_column = _match_column(tokens, 0, column)
+
+    if matched_column is not None:
+        i, day_typed = matched_column
+
+        # column BETWEEN a AND b
+        if i < len(tokens) and _is_word(tokens[i], 'BETWEEN'):
+            low = _match_value(tokens, i + 1)
+            if low and low[1] < len(tokens) and _is_word(tokens[low[1]], 'AND'):
+                high = _match_value(tokens, low[1] + 1)
+                if high and high[1] == len(tokens):
+                    exact = (
+                        day_typed
+                        and low[0].time() == time.min
+                        and high[0].time() == time.min
+                    )
+                    return low[0].date(), high[0].date(), exact
+            return _NO_BOUNDS
+
+        # column IN (a, b, ...)
+        if i + 1 < len(tokens) and _is_word(tokens[i], 'IN') and tokens[i + 1][1] == '(':
+            values = []
+            j = i + 2
+            while j < len(tokens):
+                matched = _match_value(tokens, j)
+                if not matched:
+                    return _NO_BOUNDS
+                values.append(matched[0].date())
+                j = matched[1]
+                if j < len(tokens) and tokens[j][1] == ',':
+                    j += 1
+                elif j == len(tokens) - 1 and tokens[j][1] == ')':
+                    return min(values), max(values), False
+                else:
+                    return _NO_BOUNDS
+            return _NO_BOUNDS
+
+        # column op value
+        if i < len(tokens) and tokens[i][1] in _FLIPPED:
+            matched = _match_value(tokens, i + 1)
+            if matched and matched[1] == len(tokens):
+                return _comparison_bounds(tokens[i][1], matched[0], day_typed)
+        return _NO_BOUNDS
+
+    # value op column
+    matched = _match_value(tokens, 0)
+    if not matched or matched[1] >= len(tokens) or tokens[matched[1]][1] not in _FLIPPED:
+        return _NO_BOUNDS
+    matched_column = _match_column(tokens, matched[1] + 1, column)
+    if matched_column is None or matched_column[0] != len(tokens):
+        return _NO_BOUNDS
+    op = _FLIPPED[tokens[matched[1]][1]]
+    return _comparison_bounds(op, matched[0], matched_column[1])
+
+
+def extract_date_window(query: str) -> Optional[DateWindow]:
+    """
+    Find the range of days a GDELT query can touch from its date predicate.
+
+    Only conditions on the table's date column (`day` for gdelt_events,
+    `date` for gdelt_gkg) that are AND-ed at the top level of the WHERE
+    clause are used; anything else (OR branches, relative dates such as
+    today()) leaves the corresponding bound open.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        DateWindow (bounds may be None when open-ended), or None if the
+        query does not read a GDELT table
+    """
+    table, where = _find_table_and_where(tokenize_sql(query))
+    column = DATE_COLUMNS.get(table or '')
+    if column is None:
+        return None
+
+    window = DateWindow(table=table, column=column)
+    for conjunct in split_conjuncts(where):
+        start, end, _ = _conjunct_bounds(conjunct, column)
+        if start is not None and (window.start is None or start > window.start):
+            window.start = start
+        if end is not None and (window.end is None or end < window.end):
+            window.end = end
+    return window
+
+
+def remove_date_bounds(where_clause: str, table: str) -> str:
+    """
+    Drop the conditions that only bound a table's date column to whole days.
+
+    Used when a query is re-issued for a sub-range of its date window:
+    the sub-range condition implies the dropped ones, and removing them
+    makes the sub-range query identical across overlapping windows.
+    Conditions that are not exactly whole-day ranges (IN lists, DateTime
+    comparisons at non-midnight times, OR groups) are kept.
+
+    Args:
+        where_clause: SQL WHERE clause (without WHERE keyword)
+        table: 'gdelt_events' or 'gdelt_gkg'
+
+    Returns:
+        Remaining WHERE clause ('' if nothing remains)
+    """
+    column = DATE_COLUMNS[table]
+    kept = [
+        conjunct
+        for conjunct in split_conjuncts(tokenize_sql(where_clause))
+        if not _conjunct_bounds(conjunct, column)[2]
+    ]
+    return ' AND '.join(
+        f"({join_tokens(conjunct)})" if len(kept) > 1 and _has_top_level_or(conjunct)
+        else join_tokens(conjunct)
+        for conjunct in kept
+    )
+
+
+def _has_top_level_or(tokens: List[Token]) -> bool:
+    """Check whether a condition contains an OR outside parentheses."""
+    depth = 0
+    for token in tokens:
+        if token[1] == '(':
+            depth += 1
+        elif token[1] == ')':
+            depth -= 1
+        elif depth == 0 and _is_word(token, 'OR'):
+            return True
+    return False
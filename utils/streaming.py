@@ -0,0 +1,177 @@
+"""
+Incremental response decoding for GDELT Cloud MCP Server
+Parses result rows out of a response body as it arrives, either as NDJSON
+(one row per line) or from the `data` array of the usual JSON envelope
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from . import json_codec
+
+
+NDJSON_TYPES = ('application/x-ndjson', 'application/jsonl', 'application/json-seq')
+
+_WHITESPACE = ' \t\r\n'
+_decoder = json.JSONDecoder()
+
+
+def is_ndjson(content_type: str) -> bool:
+    """Check whether a Content-Type header denotes newline-delimited JSON."""
+    return content_type.split(';', 1)[0].strip().lower() in NDJSON_TYPES
+
+
+class NDJSONDecoder:
+    """
+    Decode newline-delimited JSON rows from text chunks.
+
+    Blank lines are ignored; a trailing line without a newline is decoded
+    by `close()`.
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        # Rows arrive without an envelope; errors come as non-200 statuses
+        self.envelope: Dict[str, Any] = {'success': True}
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add a chunk of text and return the rows completed by it."""
+        self._buffer += chunk
+        lines = self._buffer.split('\n')
+        self._buffer = lines.pop()
+        return [json_codec.loads(line) for line in lines if line.strip()]
+
+    def close(self) -> List[Any]:
+        """Decode whatever is left once the body has ended."""
+        rest, self._buffer = self._buffer, ''
+        return [json_codec.loads(rest)] if rest.strip() else []
+
+
+class JSONArrayDecoder:
+    """
+    Decode the elements of one top-level array in a JSON object from text
+    chunks, e.g. the `data` rows of ``{"success": true, "data": [...]}``.
+
+    Elements are returned as soon as they are complete. The other fields
+    of the object are collected and available as `envelope` after
+    `close()`, so large bodies never have to be held as a whole.
+    """
+
+    def __init__(self, key: str = 'data'):
+        self.key = key
+        self.envelope: Dict[str, Any] = {}
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'prefix'
+        # Text of the object outside the array, parsed once the body ends
+        self._outside: List[str] = []
+        # Scanner state while looking for the array's key
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key: Optional[str] = None
+        self._after_colon = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add a chunk of text and return the elements completed by it."""
+        self._buffer += chunk
+        items: List[Any] = []
+        if self._state == 'prefix':
+            self._scan_prefix()
+        if self._state == 'items':
+            items = self._scan_items()
+        if self._state == 'suffix':
+            self._outside.append(self._buffer[self._pos:])
+            self._buffer, self._pos = '', 0
+        return items
+
+    def close(self) -> List[Any]:
+        """
+        Finish decoding once the body has ended.
+
+        Raises:
+            ValueError: If the body was not a complete JSON object
+        """
+        if self._state == 'prefix':
+            # No array under the key: the whole body is the envelope
+            self._outside.append(self._buffer)
+        elif self._state == 'items':
+            raise ValueError('Response ended inside the result rows')
+        self._buffer, self._pos = '', 0
+        envelope = json_codec.loads(''.join(self._outside))
+        if not isinstance(envelope, dict):
+            raise ValueError('Response is not a JSON object')
+        self.envelope = envelope
+        return []
+
+    def _scan_prefix(self) -> None:
+        """Advance through the object until the array under `key` opens."""
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and not self._after_colon:
+                        self._last_key = json.loads(buffer[self._string_start:i + 1])
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in '{[':
+                if (char == '[' and self._depth == 1 and self._after_colon
+                        and self._last_key == self.key):
+                    # Keep an empty array in the envelope text so it stays valid JSON
+                    self._outside.append(buffer[:i] + '[]')
+                    self._buffer = buffer[i + 1:]
+                    self._pos = 0
+                    self._state = 'items'
+                    return
+                self._depth += 1
+                self._after_colon = False
+            elif char in '}]':
+                self._depth -= 1
+            elif char == ':' and self._depth == 1:
+                self._after_colon = True
+            elif char == ',' and self._depth == 1:
+                self._after_colon = False
+                self._last_key = None
+            i += 1
+        self._pos = i
+
+    def _scan_items(self) -> List[Any]:
+        """Decode complete array elements from the buffer."""
+        items = []
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE + ',':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                self._state = 'suffix'
+                pos += 1
+                break
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # element not complete yet
+            # A scalar may still be growing ('2.' of '2.5', 'tr' of 'true'):
+            # it is only complete once the separator after it has arrived
+            following = end
+            while following < len(buffer) and buffer[following] in _WHITESPACE:
+                following += 1
+            if following >= len(buffer) or buffer[following] not in ',]':
+                break
+            items.append(item)
+            pos = end
+        # Drop consumed text so the buffer only holds the partial element
+        self._buffer = buffer[pos:]
+        self._pos = 0
+        return items
@@ -0,0 +1,80 @@
+"""
+Daily time series helpers for GDELT Cloud MCP Server
+Builds per-day aggregate queries and tracks which days of a series are
+already cached, so rolling windows only fetch the days they are missing
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .range_split import range_predicate
+from .sql import normalize_sql
+
+
+def build_time_series_query(
+    table: str,
+    metrics: str,
+    where_clause: Optional[str],
+    first: date,
+    last: date
+) -> str:
+    """
+    Build a GROUP BY day aggregate query over [first, last].
+
+    Args:
+        table: 'gdelt_events' or 'gdelt_gkg'
+        metrics: Comma-separated aggregate expressions (e.g. 'count() AS event_count')
+        where_clause: Additional filters (without WHERE keyword)
+        first: First day (inclusive)
+        last: Last day (inclusive)
+
+    Returns:
+        SQL query string returning one row per day with a `day` column
+    """
+    day_expr = 'toDate(date) AS day' if table == 'gdelt_gkg' else 'day'
+    where = range_predicate(table, first, last)
+    if where_clause:
+        where = f"({where_clause}) AND {where}"
+    days = (last - first).days + 1
+    return (
+        f"SELECT {day_expr}, {metrics} FROM {table} WHERE {where} "
+        f"GROUP BY day ORDER BY day ASC LIMIT {days}"
+    )
+
+
+def series_signature(table: str, metrics: str, where_clause: Optional[str]) -> str:
+    """Identity of a series independent of its date range."""
+    return normalize_sql(f"{table} | {metrics} | {where_clause or ''}")
+
+
+def missing_runs(days: List[date], cached: Dict[date, Any]) -> List[Tuple[date, date]]:
+    """
+    Group the days that are not cached into contiguous (first, last) runs.
+
+    Args:
+        days: Consecutive days of the requested window
+        cached: Slices already available, keyed by day
+
+    Returns:
+        List of inclusive day ranges to fetch
+    """
+    runs: List[Tuple[date, date]] = []
+    for day in days:
+        if day in cached:
+            continue
+        if runs and runs[-1][1] == day - timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def row_day(row: Dict[str, Any]) -> Optional[date]:
+    """Read the `day` value of a result row as a date."""
+    value = row.get('day')
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None